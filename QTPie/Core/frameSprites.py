@@ -0,0 +1,284 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the on disk sprite cache of video frames used for scrubber previews.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import glob
+import shutil
+import hashlib
+import tempfile
+import threading
+import subprocess
+import PyQt5
+from PyQt5 import QtCore, QtGui
+
+
+class QTPieFrameSprites:
+    """
+    Extracts a frame of a video every interval into one sprite image saved on disk, keyed by path, modification time
+    and file size, so a video is only read once. Frames are read with OpenCV when installed, otherwise with ffmpeg.
+    Loading is safe off the GUI thread, frames are served on the GUI thread from memory.
+    """
+
+    columns = 10
+    _pool = None
+
+    def __init__(self, filename, interval=10000, thumbSize=160, maxFrames=200, directory=""):
+        """
+        Initializes the sprites of a video without reading it.
+
+        Args:\n
+            filename (str): The path to the video.
+            interval (int, optional): The milliseconds between extracted frames. Defaults to 10000.
+            thumbSize (int, optional): The width of a frame in the sprite. Defaults to 160.
+            maxFrames (int, optional): The most frames extracted, the interval is lengthened to fit longer videos. Defaults to 200.
+            directory (str, optional): The folder the sprites are saved in. Defaults to the user cache folder.
+        """
+
+        if not directory:
+            directory = os.path.join(QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.GenericCacheLocation), "QTPie", "sprites")
+
+        self.filename = filename
+        self.interval = interval
+        self.thumbSize = thumbSize
+        self.maxFrames = maxFrames
+        self.directory = directory
+
+        self.sprite = None
+        self.count = 0
+        self.frameSize = QtCore.QSize()
+        self.diskHit = False
+
+        self._frames = {}
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    @classmethod
+    def pool(cls):
+        """
+        Gets the single thread pool sprites are made on so reading videos never holds up image workers.
+
+        Returns:\n
+            PyQt5.QtCore.QThreadPool: The sprite thread pool.
+        """
+
+        if cls._pool is None:
+            cls._pool = QtCore.QThreadPool()
+            cls._pool.setMaxThreadCount(1)
+
+        return cls._pool
+
+    @property
+    def ready(self):
+        """
+        Whether the sprite is loaded and has frames.
+
+        Returns:\n
+            bool: Whether frames can be served.
+        """
+
+        return self.count > 0
+
+    def path(self):
+        """
+        Gets where the sprite of the video is saved.
+
+        Returns:\n
+            str: The path to the sprite. None if the video can not be read.
+        """
+
+        path = os.path.abspath(self.filename)
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        key = "{}|{}|{}|{}|{}".format(path, stat.st_mtime_ns, stat.st_size, self.interval, self.thumbSize)
+
+        return os.path.join(self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest()+".png")
+
+    def load(self):
+        """
+        Reads the sprite from disk or extracts the frames and saves it. Safe to call off the GUI thread.
+
+        Returns:\n
+            QTPieFrameSprites: These sprites, ready when frames could be read.
+        """
+
+        spritePath = self.path()
+        if spritePath is None:
+            return self
+
+        sprite = QtGui.QImage(spritePath)
+        if sprite.isNull():
+            sprite = self.make(self.extract())
+            if not sprite.isNull():
+                #Written beside then renamed so a reader never sees half a sprite
+                tempPath = "{}.{}.tmp".format(spritePath, threading.get_ident())
+                try:
+                    if sprite.save(tempPath, "PNG"):
+                        os.replace(tempPath, spritePath)
+                except OSError:
+                    pass
+                #A sprite that could not be written is still used, it is just extracted again next time
+                if os.path.exists(tempPath):
+                    os.remove(tempPath)
+        else:
+            self.diskHit = True
+
+        if not sprite.isNull():
+            self.interval = int(sprite.text("interval") or self.interval)
+            self.frameSize = QtCore.QSize(int(sprite.text("width")), int(sprite.text("height")))
+            self.sprite = sprite
+            self.count = int(sprite.text("count"))
+
+        return self
+
+    def extract(self):
+        """
+        Reads one frame every interval scaled to the thumbnail width.
+
+        Returns:\n
+            list of PyQt5.QtGui.QImage: The frames in order.
+        """
+
+        try:
+            import cv2
+        except ImportError:
+            cv2 = None
+
+        if cv2 is not None:
+            return self.extractOpenCV(cv2)
+        if shutil.which("ffmpeg"):
+            return self.extractFFmpeg()
+
+        raise ImportError("Scrubber previews require the opencv-python package or ffmpeg on the PATH")
+
+    def extractOpenCV(self, cv2):
+        """
+        Reads the frames by seeking with OpenCV.
+
+        Args:\n
+            cv2 (module): The OpenCV module.
+
+        Returns:\n
+            list of PyQt5.QtGui.QImage: The frames in order.
+        """
+
+        capture = cv2.VideoCapture(self.filename)
+        fps = capture.get(cv2.CAP_PROP_FPS)
+        duration = capture.get(cv2.CAP_PROP_FRAME_COUNT)/fps*1000 if fps else 0
+        self.interval = max(self.interval, int(duration/self.maxFrames)+1)
+
+        frames = []
+        for position in range(0, int(duration), self.interval):
+            capture.set(cv2.CAP_PROP_POS_MSEC, position)
+            grabbed, frame = capture.read()
+            if not grabbed:
+                break
+
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            height, width = frame.shape[:2]
+            image = QtGui.QImage(frame.data, width, height, frame.strides[0], QtGui.QImage.Format_RGB888)
+            frames.append(image.scaledToWidth(self.thumbSize, QtCore.Qt.SmoothTransformation))
+
+        capture.release()
+
+        return frames
+
+    def duration(self):
+        """
+        Reads the length of the video with ffprobe.
+
+        Returns:\n
+            float: The length in milliseconds. 0 if ffprobe is missing or can not read it.
+        """
+
+        if not shutil.which("ffprobe"):
+            return 0
+
+        probe = subprocess.run(["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "default=noprint_wrappers=1:nokey=1", self.filename],
+                               stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=False)
+
+        try:
+            return float(probe.stdout.strip())*1000
+        except ValueError:
+            return 0
+
+    def extractFFmpeg(self):
+        """
+        Reads the frames with an ffmpeg process writing them to a temporary folder. The interval is lengthened
+        to fit long videos in maxFrames when ffprobe can read their length.
+
+        Returns:\n
+            list of PyQt5.QtGui.QImage: The frames in order.
+        """
+
+        self.interval = max(self.interval, int(self.duration()/self.maxFrames)+1)
+
+        with tempfile.TemporaryDirectory(prefix="QTPieSprites") as directory:
+            subprocess.run(["ffmpeg", "-v", "error", "-i", self.filename,
+                            "-vf", "fps=1000/{},scale={}:-2".format(self.interval, self.thumbSize),
+                            "-frames:v", str(self.maxFrames), os.path.join(directory, "%05d.png")],
+                           check=True, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+            return [QtGui.QImage(framePath) for framePath in sorted(glob.glob(os.path.join(directory, "*.png")))]
+
+    def make(self, frames):
+        """
+        Lays frames out in one sprite and records the layout in its text so the saved sprite describes itself.
+
+        Args:\n
+            frames (list of PyQt5.QtGui.QImage): The frames in order.
+
+        Returns:\n
+            PyQt5.QtGui.QImage: The sprite. Null if there were no frames.
+        """
+
+        frames = [frame for frame in frames if not frame.isNull()]
+        if not frames:
+            return QtGui.QImage()
+
+        width = max(frame.width() for frame in frames)
+        height = max(frame.height() for frame in frames)
+        rows = (len(frames)+self.columns-1)//self.columns
+
+        sprite = QtGui.QImage(width*min(len(frames), self.columns), height*rows, QtGui.QImage.Format_RGB32)
+        sprite.fill(QtCore.Qt.black)
+
+        painter = QtGui.QPainter(sprite)
+        for index, frame in enumerate(frames):
+            painter.drawImage(index%self.columns*width, index//self.columns*height, frame)
+        painter.end()
+
+        for key, value in (("interval", self.interval), ("count", len(frames)), ("width", width), ("height", height)):
+            sprite.setText(key, str(value))
+
+        return sprite
+
+    def frame(self, position):
+        """
+        Gets the frame nearest before position from memory. Call on the GUI thread.
+
+        Args:\n
+            position (int): The media position in milliseconds.
+
+        Returns:\n
+            PyQt5.QtGui.QPixmap: The frame. None if the sprite is not ready.
+        """
+
+        if not self.ready:
+            return None
+
+        index = min(max(position, 0)//self.interval, self.count-1)
+
+        if index not in self._frames:
+            width, height = self.frameSize.width(), self.frameSize.height()
+            self._frames[index] = QtGui.QPixmap.fromImage(self.sprite.copy(index%self.columns*width, index//self.columns*height, width, height))
+
+        return self._frames[index]
@@ -0,0 +1,246 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the video surface that taps the frames of a QTPie media player for analysis.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import time
+import threading
+import collections
+import numpy
+import PyQt5
+from PyQt5 import QtGui, QtMultimedia
+
+
+class QTPieFrameTap(QtMultimedia.QAbstractVideoSurface):
+    """
+    A video surface passing every frame on to the surface of a video widget and queueing it for a callback run on
+    a worker thread. The callback gets a NumPy view of the mapped frame, so it must copy anything it keeps.
+    When the callback falls behind the oldest queued frames are dropped.
+
+    Args:\n
+        QtMultimedia (PyQt5.QtMultimedia.QAbstractVideoSurface): Inherits from QAbstractVideoSurface.
+    """
+
+    #Bytes per pixel of the formats viewed without a copy, planar formats are viewed as their luma plane
+    packed = {QtMultimedia.QVideoFrame.Format_ARGB32: 4,
+              QtMultimedia.QVideoFrame.Format_ARGB32_Premultiplied: 4,
+              QtMultimedia.QVideoFrame.Format_RGB32: 4,
+              QtMultimedia.QVideoFrame.Format_BGRA32: 4,
+              QtMultimedia.QVideoFrame.Format_BGRA32_Premultiplied: 4,
+              QtMultimedia.QVideoFrame.Format_BGR32: 4,
+              QtMultimedia.QVideoFrame.Format_RGB24: 3,
+              QtMultimedia.QVideoFrame.Format_BGR24: 3}
+    planar = (QtMultimedia.QVideoFrame.Format_YUV420P,
+              QtMultimedia.QVideoFrame.Format_YV12,
+              QtMultimedia.QVideoFrame.Format_NV12,
+              QtMultimedia.QVideoFrame.Format_NV21,
+              QtMultimedia.QVideoFrame.Format_Y8)
+
+    def __init__(self, callback, target=None, maxQueue=2):
+        """
+        Initializes the tap, its worker thread runs while the surface is started.
+
+        Args:\n
+            callback (def): Called on the worker thread with the frame as a numpy.ndarray view and its start time in microseconds.
+            target (PyQt5.QtMultimedia.QAbstractVideoSurface, optional): The surface frames are shown on, usually QTPieVideo.videoSurface(). Defaults to None.
+            maxQueue (int, optional): The most frames waiting for the callback. Defaults to 2.
+        """
+
+        super().__init__()
+
+        self.callback = callback
+        self.target = target
+        self.running = False
+
+        self.presented = 0
+        self.processed = 0
+        self.dropped = 0
+        self.copied = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.lastError = None
+
+        self._frames = collections.deque(maxlen=maxQueue)
+        self._ready = threading.Condition()
+        self._thread = None
+
+    def supportedPixelFormats(self, handleType=QtMultimedia.QAbstractVideoBuffer.NoHandle):
+        """
+        Gets the pixel formats accepted, only frames in memory so they can be mapped.
+
+        Args:\n
+            handleType (PyQt5.QtMultimedia.QAbstractVideoBuffer.HandleType, optional): The kind of frame buffer. Defaults to NoHandle.
+
+        Returns:\n
+            list of PyQt5.QtMultimedia.QVideoFrame.PixelFormat: The accepted formats.
+        """
+
+        if handleType != QtMultimedia.QAbstractVideoBuffer.NoHandle:
+            return []
+        if self.target is not None:
+            return self.target.supportedPixelFormats(handleType)
+
+        return list(self.packed)+list(self.planar)
+
+    def start(self, surfaceFormat):
+        """
+        Starts the target surface, this one and the worker thread.
+
+        Args:\n
+            surfaceFormat (PyQt5.QtMultimedia.QVideoSurfaceFormat): The format of the coming frames.
+
+        Returns:\n
+            bool: Whether both surfaces started.
+        """
+
+        if self.target is not None and not self.target.start(surfaceFormat):
+            return False
+        if not super().start(surfaceFormat):
+            return False
+
+        if self._thread is None:
+            self.running = True
+            self._thread = threading.Thread(target=self._consume, name="QTPieFrameTap", daemon=True)
+            self._thread.start()
+
+        return True
+
+    def stop(self):
+        """
+        Stops the target surface, this one and the worker thread.
+        """
+
+        if self.target is not None:
+            self.target.stop()
+
+        super().stop()
+        self.close()
+
+    def present(self, frame):
+        """
+        Shows frame on the target surface and queues it for the callback, dropping the oldest queued frame when full.
+
+        Args:\n
+            frame (PyQt5.QtMultimedia.QVideoFrame): The frame.
+
+        Returns:\n
+            bool: Whether the frame was shown.
+        """
+
+        self.presented += 1
+        shown = self.target.present(frame) if self.target is not None else True
+
+        with self._ready:
+            if not self.running:
+                return shown
+            if len(self._frames) == self._frames.maxlen:
+                self.dropped += 1
+            #Copying a QVideoFrame only shares its buffer
+            self._frames.append(QtMultimedia.QVideoFrame(frame))
+            self._ready.notify()
+
+        return shown
+
+    def close(self):
+        """
+        Stops the worker thread, waiting for a callback still running, and forgets the queued frames.
+        Connected to the destroyed signal of the media widget.
+        """
+
+        with self._ready:
+            self.running = False
+            self._frames.clear()
+            self._ready.notify()
+
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _consume(self):
+        """
+        Runs the callback on queued frames until stopped or closed, on a daemon thread.
+        """
+
+        while True:
+            with self._ready:
+                while self.running and not self._frames:
+                    self._ready.wait()
+                if not self.running:
+                    return
+                frame = self._frames.popleft()
+
+            self.process(frame)
+
+    def process(self, frame):
+        """
+        Maps frame, runs the callback on a view of it and unmaps it.
+
+        Args:\n
+            frame (PyQt5.QtMultimedia.QVideoFrame): The queued frame.
+        """
+
+        if not frame.map(QtMultimedia.QAbstractVideoBuffer.ReadOnly):
+            self.errors += 1
+            return
+
+        start = time.perf_counter()
+
+        try:
+            self.callback(self.view(frame), frame.startTime())
+        except Exception as error: #pylint: disable=W0703
+            self.errors += 1
+            self.lastError = error
+        finally:
+            frame.unmap()
+
+        self.processed += 1
+        self.seconds += time.perf_counter()-start
+
+    def view(self, frame):
+        """
+        Wraps the mapped pixels of frame in an array without copying. Formats that can not be viewed are converted.
+
+        Args:\n
+            frame (PyQt5.QtMultimedia.QVideoFrame): A mapped frame.
+
+        Returns:\n
+            numpy.ndarray: Height by width by channels for packed formats, height by width luma for planar ones.
+        """
+
+        pixelFormat = frame.pixelFormat()
+        width, height, bytesPerLine = frame.width(), frame.height(), frame.bytesPerLine()
+
+        if pixelFormat in self.packed or pixelFormat in self.planar:
+            bits = frame.bits()
+            bits.setsize(frame.mappedBytes())
+            buffer = numpy.frombuffer(bits, numpy.uint8)
+
+            if pixelFormat in self.planar:
+                return numpy.ndarray((height, width), numpy.uint8, buffer, strides=(bytesPerLine, 1))
+
+            channels = self.packed[pixelFormat]
+            return numpy.ndarray((height, width, channels), numpy.uint8, buffer, strides=(bytesPerLine, channels, 1))
+
+        #Other formats are converted through an image, which copies
+        self.copied += 1
+        image = frame.image().convertToFormat(QtGui.QImage.Format_RGB32)
+        bits = image.constBits()
+        bits.setsize(image.sizeInBytes())
+        buffer = numpy.frombuffer(bits, numpy.uint8)
+
+        return numpy.ndarray((image.height(), image.width(), 4), numpy.uint8, buffer, strides=(image.bytesPerLine(), 4, 1)).copy()
+
+    def stats(self):
+        """
+        Gets the tap counters.
+
+        Returns:\n
+            dict: The frames presented, processed, dropped, converted with a copy and failed, and the seconds spent in the callback.
+        """
+
+        return {"presented": self.presented, "processed": self.processed, "dropped": self.dropped,
+                "copied": self.copied, "errors": self.errors, "seconds": self.seconds}
@@ -0,0 +1,125 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the compiled percent geometry used to place QTPie widgets.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import functools
+import PyQt5
+from PyQt5 import sip
+
+
+@functools.lru_cache(maxsize=None)
+def compileValue(value):
+    """
+    Parses a pixel or "NN%" value once into a factor of the window size and a pixel offset.
+
+    Args:\n
+        value (int, str, float): A pixel value or a percent string.
+
+    Returns:\n
+        tuple of float: The factor and the offset.
+    """
+
+    if isinstance(value, str) and value.find("%") != -1:
+        return float(value.replace("%", ""))/100, 0.0
+
+    return 0.0, float(value)
+
+
+class QTPieGeometry:
+    """
+    Keeps the compiled geometry of every percent placed widget so they are all resolved
+    against a new window size in one vectorized pass.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty geometry table.
+        """
+
+        #Imported on first use so percentToPosition and compileValue never load numpy at startup
+        import numpy
+
+        self.widgets = []
+        self.factors = numpy.empty((0, 4))
+        self.offsets = numpy.empty((0, 4))
+
+    def add(self, widget, xPos, yPos, width, height):
+        """
+        Compiles and stores the geometry of widget, replacing any it already had.
+
+        Args:\n
+            widget (PyQt5.QtWidgets.QWidget): The widget to be placed.
+            xPos (int, str, float): The x coordinate, in pixels or percent of the window width.
+            yPos (int, str, float): The y coordinate, in pixels or percent of the window height.
+            width (int, str, float): The width, in pixels or percent of the window width.
+            height (int, str, float): The height, in pixels or percent of the window height.
+        """
+
+        import numpy
+
+        self.remove(widget)
+
+        compiled = [compileValue(value) for value in (xPos, yPos, width, height)]
+        self.widgets.append(widget)
+        self.factors = numpy.vstack([self.factors, [factor for factor, _ in compiled]])
+        self.offsets = numpy.vstack([self.offsets, [offset for _, offset in compiled]])
+
+    def remove(self, widget):
+        """
+        Stops placing widget.
+
+        Args:\n
+            widget (PyQt5.QtWidgets.QWidget): The placed widget.
+        """
+
+        keep = [index for index, placed in enumerate(self.widgets) if placed is not widget]
+        self._keep(keep)
+
+    def resolve(self, width, height):
+        """
+        Converts every compiled geometry to pixels for a window size.
+
+        Args:\n
+            width (int): The width of the window.
+            height (int): The height of the window.
+
+        Returns:\n
+            numpy.ndarray: One x, y, width, height row of ints per widget.
+        """
+
+        import numpy
+
+        return (self.factors*numpy.array([width, height, width, height])+self.offsets).astype(int)
+
+    def apply(self, width, height):
+        """
+        Moves and resizes every placed widget for a window size, forgetting widgets that were deleted.
+
+        Args:\n
+            width (int): The width of the window.
+            height (int): The height of the window.
+        """
+
+        keep = [index for index, widget in enumerate(self.widgets) if not sip.isdeleted(widget)]
+        if len(keep) != len(self.widgets):
+            self._keep(keep)
+
+        for widget, rect in zip(self.widgets, self.resolve(width, height).tolist()):
+            widget.setGeometry(*rect)
+
+    def _keep(self, indices):
+        """
+        Keeps only the widgets at indices.
+
+        Args:\n
+            indices (list of int): The rows to keep.
+        """
+
+        self.widgets = [self.widgets[index] for index in indices]
+        self.factors = self.factors[indices].reshape(-1, 4)
+        self.offsets = self.offsets[indices].reshape(-1, 4)
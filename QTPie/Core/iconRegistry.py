@@ -0,0 +1,174 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the process wide icon registry for QTPie.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import PyQt5
+from PyQt5 import QtWidgets, QtCore, QtGui
+
+#First Party Imports
+import utilities
+
+
+class QTPieIconRegistry:
+    """
+    Resolves every icon name once, pre-renders it at the sizes and device pixel ratios in use and
+    hands out the same QIcon for every later request. Names are standard style icons, registered
+    sources or image files relative to the application.
+    """
+
+    _instance = None
+
+    standard = {"play": QtWidgets.QStyle.SP_MediaPlay,
+                "pause": QtWidgets.QStyle.SP_MediaPause,
+                "file": QtWidgets.QStyle.SP_FileLinkIcon,
+                "volume": QtWidgets.QStyle.SP_MediaVolume,
+                "muted": QtWidgets.QStyle.SP_MediaVolumeMuted}
+
+    def __init__(self, sizes=(16, 24, 32)):
+        """
+        Initializes an empty registry.
+
+        Args:\n
+            sizes (tuple of int, optional): The icon sizes in logical pixels rendered up front. Defaults to (16, 24, 32).
+        """
+
+        self.sizes = sizes
+        self.sources = {}
+        self.lookups = 0
+        self.switches = 0
+        self.skipped = 0
+
+        self._icons = {}
+
+    @classmethod
+    def instance(cls):
+        """
+        Gets the registry shared by the whole process.
+
+        Returns:\n
+            QTPieIconRegistry: The shared icon registry.
+        """
+
+        if cls._instance is None:
+            cls._instance = cls()
+
+        return cls._instance
+
+    def register(self, name, source):
+        """
+        Adds or replaces a named icon.
+
+        Args:\n
+            name (str): The name the icon is requested by.
+            source (str, QtWidgets.QStyle.StandardPixmap or PyQt5.QtGui.QIcon): An image file, a standard style icon or an icon.
+        """
+
+        self.sources[name] = source
+        self._icons.pop(name, None)
+
+    def has(self, name):
+        """
+        Checks whether name is a standard or registered icon.
+
+        Args:\n
+            name (str): The icon name.
+
+        Returns:\n
+            bool: Whether the name is known.
+        """
+
+        return name in self.sources or name in self.standard
+
+    def icon(self, name):
+        """
+        Gets the shared icon for name, resolving and rendering it the first time.
+
+        Args:\n
+            name (str): A standard or registered icon name or an image file relative to the application.
+
+        Returns:\n
+            PyQt5.QtGui.QIcon: The pre-rendered icon.
+        """
+
+        if name not in self._icons:
+            self.lookups += 1
+            self._icons[name] = self.render(self.resolve(name))
+
+        return self._icons[name]
+
+    def resolve(self, name):
+        """
+        Loads the icon a name stands for.
+
+        Args:\n
+            name (str): A standard or registered icon name or an image file relative to the application.
+
+        Returns:\n
+            PyQt5.QtGui.QIcon: The icon as given by its source.
+        """
+
+        source = self.sources.get(name, self.standard.get(name, name))
+
+        if isinstance(source, QtGui.QIcon):
+            return source
+        if isinstance(source, str):
+            return QtGui.QIcon(source if os.path.isabs(source) else utilities.resource_path(source))
+
+        return QtWidgets.QApplication.style().standardIcon(source)
+
+    def render(self, source):
+        """
+        Renders source at every size and screen device pixel ratio so painting never scales it.
+
+        Args:\n
+            source (PyQt5.QtGui.QIcon): The resolved icon.
+
+        Returns:\n
+            PyQt5.QtGui.QIcon: An icon holding the rendered pixmaps.
+        """
+
+        if source.isNull():
+            return source
+
+        ratios = {screen.devicePixelRatio() for screen in QtGui.QGuiApplication.screens()} or {1.0}
+
+        icon = QtGui.QIcon()
+        for size in self.sizes:
+            for ratio in ratios:
+                pixmap = source.pixmap(QtCore.QSize(int(size*ratio), int(size*ratio)))
+                pixmap.setDevicePixelRatio(ratio)
+                icon.addPixmap(pixmap)
+
+        return icon
+
+    def setIcon(self, widget, name):
+        """
+        Switches the icon of widget, doing nothing when it already shows name.
+
+        Args:\n
+            widget (PyQt5.QtWidgets.QAbstractButton or PyQt5.QtWidgets.QAction): The widget showing the icon.
+            name (str): The icon name.
+        """
+
+        if getattr(widget, "iconName", None) == name:
+            self.skipped += 1
+            return
+
+        widget.setIcon(self.icon(name))
+        widget.iconName = name
+        self.switches += 1
+
+    def stats(self):
+        """
+        Gets the registry counters.
+
+        Returns:\n
+            dict: The resolved icons, the lookups made to resolve them and the icon switches made and skipped.
+        """
+
+        return {"icons": len(self._icons), "lookups": self.lookups, "switches": self.switches, "skipped": self.skipped}
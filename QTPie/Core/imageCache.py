@@ -0,0 +1,256 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the process wide decoded image cache for QTPie.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import threading
+import collections
+import PyQt5
+from PyQt5 import QtCore, QtGui
+
+
+class QTPieImageCache:
+    """
+    A least recently used cache of decoded images shared by every QTPie image widget.
+    Images are keyed by path, modification time and file size so an edited file is decoded again.
+    """
+
+    _instance = None
+
+    def __init__(self, budget=256*1024*1024):
+        """
+        Initializes the cache.
+
+        Args:\n
+            budget (int, optional): The maximum amount of bytes the decoded images may use. Defaults to 256MB.
+        """
+
+        self.budget = budget
+        self.usedBytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._images = collections.OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        """
+        Gets the cache shared by the whole process.
+
+        Returns:\n
+            QTPieImageCache: The shared image cache.
+        """
+
+        if cls._instance is None:
+            cls._instance = cls()
+
+        return cls._instance
+
+    @staticmethod
+    def makeKey(filename):
+        """
+        Builds the cache key for a file on disk.
+
+        Args:\n
+            filename (str): The path to the image.
+
+        Returns:\n
+            tuple: The absolute path, modification time and size of the file.
+        """
+
+        path = os.path.abspath(filename)
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return (path, None, None)
+
+        return (path, stat.st_mtime_ns, stat.st_size)
+
+    def contains(self, filename, size=None):
+        """
+        Checks whether an image for filename good enough for size is cached without counting a hit or miss.
+
+        Args:\n
+            filename (str): The path to the image.
+            size (PyQt5.QtCore.QSize, optional): The size the image will be shown at. Defaults to None for full resolution.
+
+        Returns:\n
+            bool: Whether the image is cached.
+        """
+
+        key = self.makeKey(filename)
+        reduction = self.reductionFor(key, filename, size)
+
+        with self._lock:
+            return any(key+(level,) in self._images for level in range(reduction, -1, -1))
+
+    def closest(self, filename):
+        """
+        Gets the highest resolution cached image for filename without decoding or counting a hit or miss.
+
+        Args:\n
+            filename (str): The path to the image.
+
+        Returns:\n
+            PyQt5.QtGui.QImage: The cached image. Null if nothing is cached for filename.
+        """
+
+        key = self.makeKey(filename)
+
+        with self._lock:
+            levels = [cachedKey[-1] for cachedKey in self._images if cachedKey[:-1] == key]
+            if levels:
+                return self._images[key+(min(levels),)]
+
+        return QtGui.QImage()
+
+    def reductionFor(self, key, filename, size):
+        """
+        Gets how many times the image can be halved while still filling size.
+
+        Args:\n
+            key (tuple): The key from makeKey.
+            filename (str): The path to the image.
+            size (PyQt5.QtCore.QSize): The size the image will be shown at. None for full resolution.
+
+        Returns:\n
+            int: The amount of halvings, 0 for full resolution.
+        """
+
+        if size is None or size.isEmpty():
+            return 0
+
+        with self._lock:
+            original = self._sizes.get(key)
+
+        if original is None:
+            original = QtGui.QImageReader(filename).size()
+            with self._lock:
+                self._sizes[key] = original
+
+        if not original.isValid():
+            return 0
+
+        target = original.scaled(size, QtCore.Qt.KeepAspectRatio)
+        reduction = 0
+        while original.width() >> (reduction+1) >= max(target.width(), 1) and original.height() >> (reduction+1) >= max(target.height(), 1):
+            reduction += 1
+
+        return reduction
+
+    def get(self, filename, size=None):
+        """
+        Gets the decoded image for filename, decoding it from disk on a miss. When size is given the
+        image is decoded at the smallest power of two reduction still filling size, letting JPEGs
+        skip most of the work through DCT scaling.
+
+        Args:\n
+            filename (str): The path to the image.
+            size (PyQt5.QtCore.QSize, optional): The size the image will be shown at. Defaults to None for full resolution.
+
+        Returns:\n
+            PyQt5.QtGui.QImage: The decoded image. Null if the file could not be read.
+        """
+
+        key = self.makeKey(filename)
+        reduction = self.reductionFor(key, filename, size)
+
+        with self._lock:
+            #Any higher resolution decode already cached is good enough
+            for level in range(reduction, -1, -1):
+                if key+(level,) in self._images:
+                    self._images.move_to_end(key+(level,))
+                    self.hits += 1
+                    return self._images[key+(level,)]
+            self.misses += 1
+
+        if reduction:
+            reader = QtGui.QImageReader(filename)
+            original = reader.size()
+            reader.setScaledSize(QtCore.QSize(original.width() >> reduction, original.height() >> reduction))
+            image = reader.read()
+        else:
+            image = QtGui.QImage(filename)
+
+        if not image.isNull():
+            self.put(key+(reduction,), image)
+
+        return image
+
+    def put(self, key, image):
+        """
+        Stores a decoded image and evicts the least recently used images over the budget.
+
+        Args:\n
+            key (tuple): The key from makeKey followed by the amount of halvings.
+            image (PyQt5.QtGui.QImage): The decoded image.
+        """
+
+        size = image.sizeInBytes()
+        if size > self.budget:
+            return
+
+        with self._lock:
+            if key in self._images:
+                self.usedBytes -= self._images.pop(key).sizeInBytes()
+
+            self._images[key] = image
+            self.usedBytes += size
+            self._evict()
+
+    def setBudget(self, budget):
+        """
+        Changes the memory budget and evicts images until it is met.
+
+        Args:\n
+            budget (int): The maximum amount of bytes the decoded images may use.
+        """
+
+        with self._lock:
+            self.budget = budget
+            self._evict()
+
+    def clear(self):
+        """
+        Removes every image from the cache.
+        """
+
+        with self._lock:
+            self._images.clear()
+            self._sizes.clear()
+            self.usedBytes = 0
+
+    def stats(self):
+        """
+        Gets the counters of the cache.
+
+        Returns:\n
+            dict: The hits, misses, evictions, amount of images and used bytes of the cache.
+        """
+
+        with self._lock:
+            return {"hits": self.hits,
+                    "misses": self.misses,
+                    "evictions": self.evictions,
+                    "images": len(self._images),
+                    "usedBytes": self.usedBytes,
+                    "budget": self.budget}
+
+    def _evict(self):
+        """
+        Drops the least recently used images until the used bytes fit the budget. The lock must be held.
+        """
+
+        while self._images and self.usedBytes > self.budget:
+            _, image = self._images.popitem(last=False)
+            self.usedBytes -= image.sizeInBytes()
+            self.evictions += 1
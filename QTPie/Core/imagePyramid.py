@@ -0,0 +1,119 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the multi-resolution image pyramid used to rescale QTPie images.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import time
+import PyQt5
+from PyQt5 import QtCore, QtGui
+
+
+class QTPieImagePyramid:
+    """
+    Lazily built half, quarter, eighth... resolution copies of an image so scaling starts
+    from the smallest copy that is still at least as large as the target.
+    """
+
+    def __init__(self, source, budget=64*1024*1024, minSize=32):
+        """
+        Initializes the pyramid with the full resolution level.
+
+        Args:\n
+            source (PyQt5.QtGui.QImage): The full resolution image.
+            budget (int, optional): The maximum amount of bytes the reduced levels may use. Defaults to 64MB.
+            minSize (int, optional): The smallest width or height a level may have. Defaults to 32.
+        """
+
+        self.source = source
+        self.budget = budget
+        self.minSize = minSize
+
+        self.levels = [source]
+        self.usedBytes = 0
+        self.complete = False
+
+        self.scales = 0
+        self.scaleTime = 0.0
+
+    def level(self, size):
+        """
+        Gets the smallest level that still fills size when the aspect ratio is kept.
+
+        Args:\n
+            size (PyQt5.QtCore.QSize): The size the image will be scaled to.
+
+        Returns:\n
+            PyQt5.QtGui.QImage: The level to scale from.
+        """
+
+        target = self.source.size().scaled(size, QtCore.Qt.KeepAspectRatio)
+        index = 0
+
+        while True:
+            current = self.levels[index]
+            if current.width()//2 < target.width() or current.height()//2 < target.height():
+                break
+            if index+1 >= len(self.levels) and not self._buildLevel():
+                break
+            index += 1
+
+        return self.levels[index]
+
+    def scaled(self, size, transform=QtCore.Qt.FastTransformation):
+        """
+        Scales the best fitting level to size while keeping the aspect ratio.
+
+        Args:\n
+            size (PyQt5.QtCore.QSize): The size to scale to.
+            transform (PyQt5.QtCore.Qt.TransformationMode, optional): The scaling quality. Defaults to Qt.FastTransformation.
+
+        Returns:\n
+            PyQt5.QtGui.QImage: The scaled image.
+        """
+
+        start = time.perf_counter()
+        image = self.level(size).scaled(size, QtCore.Qt.KeepAspectRatio, transform)
+        self.scaleTime += time.perf_counter()-start
+        self.scales += 1
+
+        return image
+
+    def stats(self):
+        """
+        Gets the counters of the pyramid.
+
+        Returns:\n
+            dict: The amount of levels, used bytes, scales and total scaling seconds.
+        """
+
+        return {"levels": len(self.levels),
+                "usedBytes": self.usedBytes,
+                "scales": self.scales,
+                "scaleTime": self.scaleTime}
+
+    def _buildLevel(self):
+        """
+        Halves the smallest level built so far if it fits the budget and minimum size.
+
+        Returns:\n
+            bool: Whether a new level was added.
+        """
+
+        if self.complete:
+            return False
+
+        last = self.levels[-1]
+        width, height = last.width()//2, last.height()//2
+        if width < self.minSize or height < self.minSize or self.usedBytes+last.sizeInBytes()//4 > self.budget:
+            self.complete = True
+            return False
+
+        level = last.scaled(width, height, QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation)
+        self.levels.append(level)
+        self.usedBytes += level.sizeInBytes()
+
+        return True
@@ -0,0 +1,155 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the process wide suspender that stops off screen QTPie media players from decoding.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import PyQt5
+from PyQt5 import QtCore, sip
+
+
+class QTPieMediaSuspender(QtCore.QObject):
+    """
+    Suspends the players of media widgets that are hidden, scrolled out of view or in a minimized window and
+    resumes them when they are seen again. At most maxPlaying players decode at once, the largest on screen win.
+
+    Args:\n
+        QtCore (PyQt5.QtCore.QObject): Inherits from QObject to own the timers and watch the media widgets.
+    """
+
+    _instance = None
+
+    def __init__(self, maxPlaying=None, interval=250, release=False):
+        """
+        Initializes the suspender.
+
+        Args:\n
+            maxPlaying (int, optional): The most players decoding at once. Defaults to None for no limit.
+            interval (int, optional): The milliseconds between visibility checks, which catch scrolling and minimizing. Defaults to 250.
+            release (bool, optional): Whether suspended players are stopped to free their decoder instead of paused. Defaults to False.
+        """
+
+        super().__init__()
+
+        self.maxPlaying = maxPlaying
+        self.release = release
+        self.mediaWidgets = []
+
+        self.suspensions = 0
+        self.resumes = 0
+
+        self.pollTimer = QtCore.QTimer(self)
+        self.pollTimer.setInterval(interval)
+        self.pollTimer.timeout.connect(self.check)
+
+        #Show and hide events ask for a check as soon as the event loop is free
+        self.checkTimer = QtCore.QTimer(self)
+        self.checkTimer.setSingleShot(True)
+        self.checkTimer.setInterval(0)
+        self.checkTimer.timeout.connect(self.check)
+
+    @classmethod
+    def instance(cls):
+        """
+        Gets the suspender shared by the whole process.
+
+        Returns:\n
+            QTPieMediaSuspender: The shared media suspender.
+        """
+
+        if cls._instance is None:
+            cls._instance = cls()
+
+        return cls._instance
+
+    def register(self, mediaWidget):
+        """
+        Starts suspending the player of mediaWidget while it can not be seen.
+
+        Args:\n
+            mediaWidget (QTPieMediaWidget): The widget that holds all media player widgets.
+        """
+
+        self.mediaWidgets.append(mediaWidget)
+        mediaWidget.installEventFilter(self)
+
+        self.pollTimer.start()
+        self.checkTimer.start()
+
+    def eventFilter(self, watched, event):
+        """
+        Checks the players soon after a media widget is shown or hidden.
+
+        Args:\n
+            watched (PyQt5.QtCore.QObject): The media widget.
+            event (PyQt5.QtCore.QEvent): The event sent to the media widget.
+
+        Returns:\n
+            bool: Always False so the event is still handled.
+        """
+
+        if event.type() in (QtCore.QEvent.Show, QtCore.QEvent.Hide):
+            self.checkTimer.start()
+
+        return False
+
+    @staticmethod
+    def visibleArea(mediaWidget):
+        """
+        Gets how much of mediaWidget can be seen.
+
+        Args:\n
+            mediaWidget (QTPieMediaWidget): The widget that holds all media player widgets.
+
+        Returns:\n
+            int: The visible pixels, 0 when hidden, clipped away or in a minimized window.
+        """
+
+        if not mediaWidget.isVisible() or mediaWidget.window().isMinimized():
+            return 0
+
+        return sum(rect.width()*rect.height() for rect in mediaWidget.visibleRegion().rects())
+
+    def check(self):
+        """
+        Resumes the largest visible players the user wants playing, up to the limit, and suspends the rest.
+        """
+
+        self.mediaWidgets = [mediaWidget for mediaWidget in self.mediaWidgets if not sip.isdeleted(mediaWidget)]
+        if not self.mediaWidgets:
+            self.pollTimer.stop()
+            return
+
+        areas = {id(mediaWidget): self.visibleArea(mediaWidget) for mediaWidget in self.mediaWidgets}
+
+        wanted = sorted((mediaWidget for mediaWidget in self.mediaWidgets if areas[id(mediaWidget)] and mediaWidget.media.playing),
+                        key=lambda mediaWidget: areas[id(mediaWidget)], reverse=True)
+        allowed = {id(mediaWidget) for mediaWidget in wanted[:self.maxPlaying]}
+
+        for mediaWidget in self.mediaWidgets:
+            media = mediaWidget.media
+            visible = areas[id(mediaWidget)] > 0
+
+            if id(mediaWidget) in allowed or (visible and not media.playing):
+                if media.suspended:
+                    media.resume()
+                    self.resumes += 1
+            elif not media.suspended:
+                media.suspend(self.release)
+                self.suspensions += 1
+
+    def stats(self):
+        """
+        Gets the suspender counters.
+
+        Returns:\n
+            dict: The registered players, the players decoding and how often players were suspended and resumed.
+        """
+
+        decoding = sum(1 for mediaWidget in self.mediaWidgets
+                       if not sip.isdeleted(mediaWidget) and mediaWidget.media.playing and not mediaWidget.media.suspended)
+
+        return {"players": len(self.mediaWidgets), "decoding": decoding, "suspensions": self.suspensions, "resumes": self.resumes}
@@ -0,0 +1,225 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the lazily built, cached pages of a QTPie app.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import collections
+import PyQt5
+from PyQt5 import QtWidgets, QtCore
+
+#First Party Imports
+from QTPie.UI.widget import QTPieWidget
+
+
+class QTPiePages(QtCore.QObject):
+    """
+    A registry of pages built on first navigation, kept in a stacked widget and disposed of least recently
+    used first. Pages the user is likely to open next are built while the app is idle, one per idle moment,
+    starting only after the main window has painted so preloading never delays the first frame.
+
+    Args:\n
+        QtCore (PyQt5.QtCore.QObject): Inherits from QObject to own the preload timer and watch the main window.
+    """
+
+    def __init__(self, qtpie, maxPages=4):
+        """
+        Initializes the registry. The main window is untouched until the first page is shown.
+
+        Args:\n
+            qtpie (QTPie.QTPie): The QTPie app the pages are built with.
+            maxPages (int, optional): The most built pages kept besides the main page. Defaults to 4.
+        """
+
+        super().__init__()
+
+        self.qtpie = qtpie
+        self.maxPages = maxPages
+        self.painted = False
+
+        self.builders = {}
+        self.preloads = []
+        self.pages = collections.OrderedDict()
+        self.current = "main"
+        self.stack = None
+
+        #How often each page was opened from each other page
+        self.transitions = collections.defaultdict(collections.Counter)
+
+        self.preloadTimer = QtCore.QTimer()
+        self.preloadTimer.setSingleShot(True)
+        self.preloadTimer.setInterval(0)
+        self.preloadTimer.timeout.connect(self.preloadNext)
+
+        qtpie.mainWindow.installEventFilter(self)
+        #A window already on screen may not paint again on its own
+        if qtpie.mainWindow.isVisible():
+            qtpie.mainWindow.update()
+
+    def register(self, name, builder, preload=False):
+        """
+        Registers a page without building it.
+
+        Args:\n
+            name (str): The name the page is shown by.
+            builder (def): Called with the QTPie app to make the page. Its make* calls add to the page grid.
+            preload (bool, optional): Whether the page is built when the app is idle before it is first shown. Defaults to False.
+        """
+
+        self.builders[name] = builder
+        if preload:
+            self.preloads.append(name)
+            self.schedulePreload()
+
+    def show(self, name):
+        """
+        Shows a page, building it first if it is not cached.
+
+        Args:\n
+            name (str): The name of the page. "main" is the main QTPie grid.
+
+        Returns:\n
+            QTPieWidget: The shown page.
+        """
+
+        page = self.build(name)
+        self.stack.setCurrentWidget(page)
+
+        if name != self.current:
+            self.transitions[self.current][name] += 1
+        self.current = name
+
+        if name in self.pages:
+            self.pages.move_to_end(name)
+        self.evict()
+        self.schedulePreload()
+
+        return page
+
+    def build(self, name):
+        """
+        Gets a cached page or builds it.
+
+        Args:\n
+            name (str): The name of the page.
+
+        Returns:\n
+            QTPieWidget: The page.
+        """
+
+        self.makeStack()
+
+        if name == "main":
+            return self.mainPage
+        if name in self.pages:
+            return self.pages[name]
+        if name not in self.builders:
+            raise KeyError("No page named {} is registered".format(name))
+
+        page = QTPieWidget()
+        page.setObjectName(name)
+        page.grid = QtWidgets.QGridLayout()
+        page.grid.setSpacing(0)
+        page.grid.setContentsMargins(0, 0, 0, 0)
+
+        #The make* factories add to the QTPie grid so it points at the page grid while building
+        grid, gridCount = self.qtpie.grid, self.qtpie.gridCount
+        self.qtpie.grid, self.qtpie.gridCount = page.grid, 0
+        try:
+            self.builders[name](self.qtpie)
+        finally:
+            page.gridCount = self.qtpie.gridCount
+            self.qtpie.grid, self.qtpie.gridCount = grid, gridCount
+
+        page.setLayout(page.grid)
+        self.qtpie.styleWidget(page)
+        self.stack.addWidget(page)
+        self.pages[name] = page
+
+        return page
+
+    def makeStack(self):
+        """
+        Moves the main QTPie widget into a stacked widget the first time a page is needed.
+        """
+
+        if self.stack is not None:
+            return
+
+        self.mainPage = self.qtpie.mainWindow.takeCentralWidget()
+        self.stack = QtWidgets.QStackedWidget()
+        self.stack.addWidget(self.mainPage)
+        self.qtpie.mainWindow.setCentralWidget(self.stack)
+        self.qtpie.styleWidget(self.stack)
+
+    def evict(self):
+        """
+        Disposes of the least recently shown pages over the limit, never the current page.
+        """
+
+        for name in list(self.pages):
+            if len(self.pages) <= self.maxPages:
+                break
+            if name == self.current:
+                continue
+
+            page = self.pages.pop(name)
+            self.stack.removeWidget(page)
+            page.deleteLater()
+
+    def likelyNext(self):
+        """
+        Gets the unbuilt pages most likely to be opened next, most likely first.
+
+        Returns:\n
+            list of str: The page names.
+        """
+
+        likely = [name for name, _ in self.transitions[self.current].most_common()]
+        likely += self.preloads
+
+        return [name for name in likely if name in self.builders and name not in self.pages and name != self.current]
+
+    def preloadNext(self):
+        """
+        Builds the most likely next page while idle, then waits for the next idle moment for the one after.
+        """
+
+        likely = self.likelyNext()
+        #A preload never pushes a built page out of the cache
+        if not likely or len(self.pages) >= self.maxPages:
+            return
+
+        self.build(likely[0])
+        self.schedulePreload()
+
+    def schedulePreload(self):
+        """
+        Asks for the next preload at the next idle moment once the main window has painted.
+        """
+
+        if self.painted:
+            self.preloadTimer.start()
+
+    def eventFilter(self, watched, event):
+        """
+        Starts preloading after the first paint of the main window.
+
+        Args:\n
+            watched (PyQt5.QtCore.QObject): The main window.
+            event (PyQt5.QtCore.QEvent): The event sent to the main window.
+
+        Returns:\n
+            bool: Always False so the event is still handled.
+        """
+
+        if event.type() == QtCore.QEvent.Paint and not self.painted:
+            self.painted = True
+            watched.removeEventFilter(self)
+            #Queued behind the paint so the frame reaches the screen before the first page is built
+            QtCore.QTimer.singleShot(0, self.schedulePreload)
+
+        return False
@@ -0,0 +1,142 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the throttled sync of a media position to its progress slider.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import time
+import PyQt5
+from PyQt5 import QtCore, QtGui
+
+
+class QTPiePositionSync(QtCore.QObject):
+    """
+    Moves a progress slider to the media position at most once per display refresh or at a fixed rate.
+    Position notifications only remember the position, a single shot timer applies the latest one.
+    The slider is left alone while it is dragged or hidden, it catches up when it is shown again.
+
+    Args:\n
+        QtCore (PyQt5.QtCore.QObject): Inherits from QObject to own the timer and watch the slider.
+    """
+
+    def __init__(self, media, slider, hz=None):
+        """
+        Connects the media position to the slider.
+
+        Args:\n
+            media (QTPieMedia): The media player.
+            slider (QTPieSlider): The progress slider.
+            hz (float, optional): The most slider updates per second. Defaults to None for the refresh rate of the primary screen.
+        """
+
+        super().__init__(slider)
+
+        self.media = media
+        self.slider = slider
+        self.position = media.position()
+        self.atEnd = False
+
+        if not hz:
+            screen = QtGui.QGuiApplication.primaryScreen()
+            hz = screen.refreshRate() if screen and screen.refreshRate() > 0 else 60
+
+        self.notifications = 0
+        self.syncs = 0
+        self.skipped = 0
+        self.seconds = 0.0
+        self.start = time.perf_counter()
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self.timer.setInterval(max(1, int(1000/hz)))
+        self.timer.timeout.connect(self.sync)
+
+        media.positionChanged.connect(self.onPositionChanged)
+        slider.installEventFilter(self)
+
+    def setMedia(self, media):
+        """
+        Follows another media player, for example after a playlist swap.
+
+        Args:\n
+            media (QTPieMedia): The new media player.
+        """
+
+        self.media.positionChanged.disconnect(self.onPositionChanged)
+        self.media = media
+        self.media.positionChanged.connect(self.onPositionChanged)
+
+        self.position = media.position()
+        self.atEnd = False
+        self.timer.start()
+
+    def onPositionChanged(self, position):
+        """
+        Remembers the position and schedules a sync if none is waiting.
+
+        Args:\n
+            position (int): The media position in milliseconds.
+        """
+
+        self.position = position
+        self.notifications += 1
+
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def sync(self):
+        """
+        Restarts the media once when it reaches the end and moves the slider to the remembered position unless it is dragged or hidden.
+        """
+
+        start = time.perf_counter()
+        position = self.position
+
+        #Enables autoplay of video, once per time the end is reached, even while the controls are hidden
+        atEnd = self.slider.maximum() > 0 and position >= self.slider.maximum()
+        if atEnd and not self.atEnd and self.media.loop and not self.media.paused:
+            self.media.play()
+        self.atEnd = atEnd
+
+        if self.slider.isSliderDown() or not self.slider.isVisible():
+            self.skipped += 1
+            return
+
+        self.slider.setValue(position)
+
+        self.syncs += 1
+        self.seconds += time.perf_counter()-start
+
+    def eventFilter(self, watched, event):
+        """
+        Syncs the slider as soon as it is shown again.
+
+        Args:\n
+            watched (PyQt5.QtCore.QObject): The slider.
+            event (PyQt5.QtCore.QEvent): The event sent to the slider.
+
+        Returns:\n
+            bool: Always False so the event is still handled.
+        """
+
+        if event.type() == QtCore.QEvent.Show:
+            self.timer.start()
+
+        return False
+
+    def stats(self):
+        """
+        Gets the sync counters and their cost per second of playback.
+
+        Returns:\n
+            dict: The position notifications, syncs done and skipped, the seconds spent syncing and the per second rates.
+        """
+
+        elapsed = max(time.perf_counter()-self.start, 1e-9)
+
+        return {"notifications": self.notifications, "syncs": self.syncs, "skipped": self.skipped, "seconds": self.seconds,
+                "syncsPerSecond": self.syncs/elapsed, "msPerSecond": self.seconds*1000/elapsed}
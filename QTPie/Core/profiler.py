@@ -0,0 +1,151 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the opt in startup profiler for QTPie.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import json
+import time
+import functools
+import contextlib
+import PyQt5
+from PyQt5 import QtCore
+
+
+class QTPieProfiler(QtCore.QObject):
+    """
+    Times the phases of building a QTPie app and dumps the breakdown once the first frame is painted.
+
+    Args:\n
+        QtCore (PyQt5.QtCore.QObject): Inherits from QObject to watch for the first paint.
+    """
+
+    def __init__(self, output="qtpie_profile.json"):
+        """
+        Starts the clock.
+
+        Args:\n
+            output (str, optional): The path the JSON breakdown is written to. Defaults to "qtpie_profile.json".
+        """
+
+        super().__init__()
+
+        self.output = output
+        self.start = time.perf_counter()
+        self.phases = []
+        self.depth = 0
+        self.firstFrame = None
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Times the with block as a phase. Phases inside other phases are kept with their depth.
+
+        Args:\n
+            name (str): The name of the phase.
+        """
+
+        entry = {"name": name, "depth": self.depth, "start": time.perf_counter()-self.start}
+        self.phases.append(entry)
+        self.depth += 1
+
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            entry["duration"] = time.perf_counter()-self.start-entry["start"]
+
+    def wrap(self, name, function):
+        """
+        Makes every call to function a phase.
+
+        Args:\n
+            name (str): The name of the phase.
+            function (def): The function to be timed.
+
+        Returns:\n
+            def: The timed function.
+        """
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            with self.phase(name):
+                return function(*args, **kwargs)
+
+        return timed
+
+    def watchFirstPaint(self, widget):
+        """
+        Dumps the breakdown after widget paints for the first time.
+
+        Args:\n
+            widget (PyQt5.QtWidgets.QWidget): The main window of the app.
+        """
+
+        widget.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        """
+        Notices the first paint of the watched window.
+
+        Args:\n
+            watched (PyQt5.QtCore.QObject): The watched window.
+            event (PyQt5.QtCore.QEvent): The event sent to the window.
+
+        Returns:\n
+            bool: Always False so the event is still handled.
+        """
+
+        if event.type() == QtCore.QEvent.Paint and self.firstFrame is None:
+            self.firstFrame = time.perf_counter()-self.start
+            watched.removeEventFilter(self)
+            QtCore.QTimer.singleShot(0, self.dump)
+
+        return False
+
+    def report(self):
+        """
+        Builds the breakdown of every phase and the totals per phase name.
+
+        Returns:\n
+            dict: The time to the first frame, the phases in order and the totals.
+        """
+
+        totals = {}
+        for entry in self.phases:
+            total = totals.setdefault(entry["name"], {"calls": 0, "seconds": 0.0})
+            total["calls"] += 1
+            total["seconds"] += entry.get("duration", 0.0)
+
+        return {"firstFrame": self.firstFrame, "phases": self.phases, "totals": totals}
+
+    def table(self):
+        """
+        Formats the totals per phase name as a readable table, slowest first.
+
+        Returns:\n
+            str: The table.
+        """
+
+        report = self.report()
+        rows = sorted(report["totals"].items(), key=lambda item: item[1]["seconds"], reverse=True)
+
+        lines = ["{:<28}{:>8}{:>12}".format("Phase", "Calls", "ms")]
+        lines += ["{:<28}{:>8}{:>12.2f}".format(name, total["calls"], total["seconds"]*1000) for name, total in rows]
+        if report["firstFrame"] is not None:
+            lines.append("{:<28}{:>8}{:>12.2f}".format("first frame", "", report["firstFrame"]*1000))
+
+        return "\n".join(lines)
+
+    def dump(self):
+        """
+        Writes the breakdown to the output file and prints the table.
+        """
+
+        with open(self.output, "w") as jsonFile:
+            json.dump(self.report(), jsonFile, indent=4)
+
+        print(self.table())
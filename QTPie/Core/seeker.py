@@ -0,0 +1,108 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the seek coalescing used by QTPie media players.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import PyQt5
+from PyQt5 import QtCore
+
+
+class QTPieSeeker(QtCore.QObject):
+    """
+    Keeps at most one seek in flight on a media player. Seeks asked for while one is in flight replace each
+    other and only the newest is issued once the player reports the position, so the last target always lands.
+
+    Args:\n
+        QtCore (PyQt5.QtCore.QObject): Inherits from QObject to own the timeout timer.
+    """
+
+    def __init__(self, media, timeout=250):
+        """
+        Watches media for finished seeks.
+
+        Args:\n
+            media (PyQt5.QtMultimedia.QMediaPlayer): The player to seek. Anything with setPosition and positionChanged works.
+            timeout (int, optional): The milliseconds after which a seek counts as done without a position report. Defaults to 250.
+        """
+
+        super().__init__(media)
+
+        self.media = media
+        self.target = None
+        self.pending = None
+        self.seeking = False
+
+        self.requests = 0
+        self.issued = 0
+        self.coalesced = 0
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(timeout)
+        self.timer.timeout.connect(self.onSeekDone)
+
+        media.positionChanged.connect(self.onSeekDone)
+
+    def seek(self, position):
+        """
+        Seeks now or, while a seek is in flight, replaces the waiting target.
+
+        Args:\n
+            position (int): The target position in milliseconds.
+        """
+
+        self.requests += 1
+
+        if not self.seeking:
+            self.issue(position)
+            return
+
+        if self.pending is not None:
+            self.coalesced += 1
+
+        #Asking for the target in flight again needs no second seek
+        self.pending = None if position == self.target else position
+
+    def issue(self, position):
+        """
+        Sends one seek to the player.
+
+        Args:\n
+            position (int): The target position in milliseconds.
+        """
+
+        self.seeking = True
+        self.target = position
+        self.issued += 1
+
+        self.timer.start()
+        self.media.setPosition(position)
+
+    def onSeekDone(self, *_):
+        """
+        Ends the seek in flight and issues the waiting target if there is one.
+        """
+
+        if not self.seeking:
+            return
+
+        self.seeking = False
+        self.timer.stop()
+
+        if self.pending is not None:
+            position, self.pending = self.pending, None
+            self.issue(position)
+
+    def stats(self):
+        """
+        Gets the seek counters.
+
+        Returns:\n
+            dict: The seeks asked for, sent to the player and replaced before being sent.
+        """
+
+        return {"requests": self.requests, "issued": self.issued, "coalesced": self.coalesced}
@@ -0,0 +1,181 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the loader that builds QTPie pages from declarative JSON or YAML specs.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import json
+import PyQt5
+
+
+class QTPieSpecLoader:
+    """
+    Builds every widget of a page spec through the QTPie make* factories in one batch. The widget holding the grid
+    being built is hidden with painting and layout activation suspended until the whole tree exists, so Qt shows
+    every new widget in one pass when it is shown again instead of showing and laying each one out as it is added.
+
+    A spec looks like:\n
+        {"rows": 12, "columns": 12, "menu": true,
+         "widgets": [{"type": "button", "id": "maleBtn", "name": "maleBtn", "txt": "Male", "gridData": [6, 11, 6, 1], "action": "load"},
+                     {"type": "slider", "id": "slider", "gridData": [0, 2, 12, 1],
+                      "action": {"name": "slideAndProgress", "args": ["slider", "progressBar"]}}]}
+
+    Actions are named methods of the Actions object. Their args name widget ids and are looked up when the action runs.
+    Every other key is passed to the factory as a keyword argument.
+    """
+
+    #The keyword each factory takes its main action as
+    actionKeywords = {"button": "clickAction", "slider": "action", "dial": "action"}
+
+    def __init__(self, qtpie):
+        """
+        Initializes the loader.
+
+        Args:\n
+            qtpie (QTPie.QTPie): The QTPie app the widgets are made with.
+        """
+
+        self.qtpie = qtpie
+        self.widgets = {}
+
+    @staticmethod
+    def read(filename):
+        """
+        Reads a spec file. YAML files need the PyYAML package.
+
+        Args:\n
+            filename (str): The path to a .json, .yaml or .yml spec.
+
+        Returns:\n
+            dict: The spec.
+        """
+
+        with open(filename) as specFile:
+            if filename.lower().endswith((".yaml", ".yml")):
+                try:
+                    import yaml
+                except ImportError as error:
+                    raise ImportError("Loading YAML specs requires the PyYAML package") from error
+                return yaml.safe_load(specFile)
+
+            return json.load(specFile)
+
+    def load(self, spec):
+        """
+        Builds every widget in spec.
+
+        Args:\n
+            spec (dict or str): The spec or the path to a spec file.
+
+        Returns:\n
+            dict: The made widgets keyed by their id.
+        """
+
+        if isinstance(spec, str):
+            spec = self.read(spec)
+
+        grid = self.qtpie.grid
+        #A page grid has no widget until its page is built and nothing in it is shown yet
+        container = grid.parentWidget()
+        hidden = container is not None and container.isVisible()
+
+        #Nothing is laid out or painted until the whole page exists
+        if hidden:
+            container.window().setUpdatesEnabled(False)
+            container.hide()
+        grid.setEnabled(False)
+
+        try:
+            for _ in range(spec.get("rows", 0)):
+                self.qtpie.addGridRow(grid, self.qtpie.gridCount, spec.get("columns", spec.get("rows", 0)))
+                self.qtpie.gridCount += 1
+
+            if spec.get("menu"):
+                self.qtpie.createMenu()
+
+            for widgetSpec in spec.get("widgets", []):
+                self.build(widgetSpec)
+        finally:
+            grid.setEnabled(True)
+            if hidden:
+                container.show()
+            grid.activate()
+            if hidden:
+                container.window().setUpdatesEnabled(True)
+
+        return self.widgets
+
+    def build(self, widgetSpec):
+        """
+        Makes one widget through the make* factory named by its type.
+
+        Args:\n
+            widgetSpec (dict): The type, optional id, actions and factory keyword arguments of the widget.
+
+        Returns:\n
+            PyQt5.QtWidgets.QWidget: The made widget.
+        """
+
+        kwargs = dict(widgetSpec)
+        widgetType = kwargs.pop("type")
+        widgetId = kwargs.pop("id", kwargs.get("name", ""))
+
+        factory = getattr(self.qtpie, "make"+widgetType[0].upper()+widgetType[1:], None)
+        if factory is None:
+            raise ValueError("Unknown widget type {}".format(widgetType))
+
+        if "action" in kwargs and widgetType in self.actionKeywords:
+            kwargs[self.actionKeywords[widgetType]] = kwargs.pop("action")
+        for key in kwargs:
+            if key.endswith(("Action", "action")):
+                kwargs[key] = self.resolveAction(kwargs[key])
+
+        widget = factory(**kwargs)
+        if widgetId:
+            self.widgets[widgetId] = widget
+
+        return widget
+
+    def resolveAction(self, actionSpec):
+        """
+        Turns an action spec into a callable.
+
+        Args:\n
+            actionSpec (str or dict): The name of an Actions method or a dict of its name and args.
+
+        Returns:\n
+            def: The action.
+        """
+
+        if actionSpec is None:
+            return None
+
+        if isinstance(actionSpec, str):
+            actionSpec = {"name": actionSpec}
+
+        action = getattr(self.qtpie.actions, actionSpec["name"])
+        args = actionSpec.get("args", [])
+
+        return lambda *_: action(*[self.resolveArg(arg) for arg in args])
+
+    def resolveArg(self, arg):
+        """
+        Looks up an action argument when the action runs.
+
+        Args:\n
+            arg (object): A widget id or the name of a QTPie attribute like "app" or "tunableDict". Anything else is passed as is.
+
+        Returns:\n
+            object: The widget, attribute or the argument itself.
+        """
+
+        if isinstance(arg, str):
+            if arg in self.widgets:
+                return self.widgets[arg]
+            if arg in ("app", "tunableDict"):
+                return getattr(self.qtpie, arg)
+
+        return arg
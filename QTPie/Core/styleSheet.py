@@ -0,0 +1,257 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the scoped stylesheet that gives each QTPie window or page only the rules that can match the widgets in it.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import re
+import weakref
+import functools
+import collections
+import PyQt5
+from PyQt5 import QtWidgets, sip
+
+
+class QTPieStyleSheet:
+    """
+    Splits a Qt stylesheet into rules keyed by the type and object name of their selector and gives each container,
+    a window or page, one stylesheet of only the rules that can match it or the widgets inside it. Children inherit
+    the sheet of their container so widgets made later, like gallery cells, popups and dialogs, are styled without
+    a sheet of their own and Qt parses one small sheet per container instead of one per widget. Rules without an
+    object name are kept in every container for those later widgets. Resolved stylesheets are cached per set of
+    keys. A reload sets the stylesheet again only on the containers whose stylesheet changed, which restyles every
+    widget in them.
+    """
+
+    comment = re.compile(r"/\*.*?\*/", re.S)
+    rule = re.compile(r"([^{}]+)\{([^{}]*)\}")
+    #The last compound of a selector, for example QSlider#VideoProgressBar::sub-page:horizontal
+    compound = re.compile(r"^(\*|[A-Za-z_]\w*)?(?:#([\w-]+))?")
+
+    def __init__(self, text=""):
+        """
+        Parses the stylesheet.
+
+        Args:\n
+            text (str, optional): The Qt stylesheet. Defaults to "".
+        """
+
+        self.rules = []
+        self.hits = 0
+        self.misses = 0
+        self.restyled = 0
+        self._resolved = {}
+        #The object names seen inside each container
+        self._containers = weakref.WeakKeyDictionary()
+
+        self.parse(text)
+
+    def parse(self, text):
+        """
+        Replaces the rules with the ones in text and forgets every resolved stylesheet.
+
+        Args:\n
+            text (str): The Qt stylesheet.
+        """
+
+        self.rules = []
+        self.names = frozenset()
+        self._resolved = {}
+
+        for selectors, body in self.rule.findall(self.comment.sub("", text)):
+            body = " ".join(body.split())
+            for selector in selectors.split(","):
+                selector = " ".join(selector.split())
+                if selector:
+                    self.rules.append(self.parseSelector(selector)+("{}{{{}}}".format(selector, body),))
+
+        self.names = frozenset(name for _, name, _ in self.rules if name)
+
+    def reload(self, text):
+        """
+        Replaces the rules with the ones in text and sets the stylesheet again on the containers whose stylesheet changed.
+        Qt re-polishes every widget in those containers, not only the ones the changed rules match.
+
+        Args:\n
+            text (str): The new Qt stylesheet.
+
+        Returns:\n
+            int: The amount of widgets restyled, every widget in a container that was given a new stylesheet.
+        """
+
+        oldRules = self.keyedRules()
+        self.parse(text)
+        if self.keyedRules() == oldRules:
+            return 0
+
+        restyled = 0
+        for container in list(self._containers):
+            if sip.isdeleted(container):
+                continue
+
+            #Names without rules are not remembered so the containers are searched again for the new rules
+            names = self.namesIn(container, container)
+            self._containers[container] = names
+            sheet = self.resolve(names)
+            if container.styleSheet() != sheet:
+                container.setStyleSheet(sheet)
+                restyled += 1+len(container.findChildren(QtWidgets.QWidget))
+
+        self.restyled += restyled
+
+        return restyled
+
+    def keyedRules(self):
+        """
+        Groups the rules by the type and object name they match.
+
+        Returns:\n
+            dict: The rule texts in order keyed by type and object name.
+        """
+
+        keyed = collections.defaultdict(list)
+        for widgetType, name, text in self.rules:
+            keyed[(widgetType, name)].append(text)
+
+        return dict(keyed)
+
+    def parseSelector(self, selector):
+        """
+        Gets the type and object name a widget must have to be matched by selector.
+        Only the last compound decides, parents in descendant selectors are checked by Qt.
+
+        Args:\n
+            selector (str): A single Qt stylesheet selector.
+
+        Returns:\n
+            tuple of str: The type, "" for any type, and the object name, "" for any name.
+        """
+
+        last = re.split(r"\s*>\s*|\s+", selector)[-1]
+        widgetType, objectName = self.compound.match(last).groups()
+
+        return ("" if widgetType in (None, "*") else widgetType), (objectName or "")
+
+    def resolve(self, names):
+        """
+        Gets the stylesheet of a container holding widgets with names, every rule without an object name
+        and the rules for those names.
+
+        Args:\n
+            names (frozenset of str): The object names with rules inside the container.
+
+        Returns:\n
+            str: The stylesheet of the container.
+        """
+
+        if names in self._resolved:
+            self.hits += 1
+            return self._resolved[names]
+
+        self.misses += 1
+        sheet = "\n".join(text for _, name, text in self.rules if not name or name in names)
+        self._resolved[names] = sheet
+
+        return sheet
+
+    def container(self, widget):
+        """
+        Gets the container whose stylesheet widget inherits, the nearest styled ancestor or else its window.
+
+        Args:\n
+            widget (PyQt5.QtWidgets.QWidget): The widget.
+
+        Returns:\n
+            PyQt5.QtWidgets.QWidget: The container.
+        """
+
+        parent = widget
+        while parent is not None:
+            if parent in self._containers:
+                return parent
+            parent = parent.parentWidget()
+
+        return widget.window()
+
+    def apply(self, widget, container=None):
+        """
+        Makes sure the stylesheet of the container of widget has the rules for widget and every widget inside it.
+
+        Args:\n
+            widget (PyQt5.QtWidgets.QWidget): The top widget.
+            container (PyQt5.QtWidgets.QWidget, optional): The widget given the stylesheet. Defaults to the nearest styled ancestor or window,
+                                                           widgets without a parent or named rules are skipped unless they are containers already.
+        """
+
+        names = self.namesIn(widget)
+
+        if container is None:
+            #Rules without an object name are in every container already
+            if not names:
+                return
+            #Widgets not placed yet are styled with the page or window they are put in
+            if widget.parentWidget() is None and widget not in self._containers:
+                return
+            container = self.container(widget)
+
+        names |= self._containers.get(container, frozenset())
+        self._containers[container] = names
+        sheet = self.resolve(names)
+        if container.styleSheet() != sheet:
+            container.setStyleSheet(sheet)
+
+    def namesIn(self, widget, container=None):
+        """
+        Gets the object names with rules of widget and every widget inside it.
+
+        Args:\n
+            widget (PyQt5.QtWidgets.QWidget): The top widget.
+            container (PyQt5.QtWidgets.QWidget, optional): Only counts the widgets styled by this container,
+                                                           not the ones in containers nested in it. Defaults to None.
+
+        Returns:\n
+            frozenset of str: The object names.
+        """
+
+        names = {widget.objectName()}
+        if widget.children():
+            names.update(child.objectName() for child in widget.findChildren(QtWidgets.QWidget)
+                         if container is None or self.container(child) is container)
+
+        return self.names & names
+
+    def wrap(self, function):
+        """
+        Makes function style the widgets it returns.
+
+        Args:\n
+            function (def): A make* factory.
+
+        Returns:\n
+            def: The styling factory.
+        """
+
+        @functools.wraps(function)
+        def styled(*args, **kwargs):
+            result = function(*args, **kwargs)
+            for widget in (result if isinstance(result, (tuple, list)) else [result]):
+                if isinstance(widget, QtWidgets.QWidget):
+                    self.apply(widget)
+
+            return result
+
+        return styled
+
+    def stats(self):
+        """
+        Gets the cache counters.
+
+        Returns:\n
+            dict: The number of rules, resolved stylesheets, styled containers, cache hits and misses and widgets restyled by reloads.
+        """
+
+        return {"rules": len(self.rules), "resolved": len(self._resolved), "containers": len(self._containers),
+                "hits": self.hits, "misses": self.misses, "restyled": self.restyled}
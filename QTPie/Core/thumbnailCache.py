@@ -0,0 +1,168 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the on disk thumbnail cache for QTPie galleries.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import hashlib
+import threading
+import collections
+import PyQt5
+from PyQt5 import QtCore, QtGui
+
+
+class QTPieThumbnailCache:
+    """
+    Makes thumbnails and keeps them on disk keyed by path, modification time, file size and thumbnail size,
+    so opening the same folder again only reads the small files. Recently used thumbnails are also kept in memory.
+    """
+
+    def __init__(self, directory="", thumbSize=128, maxImages=1024):
+        """
+        Initializes the cache.
+
+        Args:\n
+            directory (str, optional): The folder the thumbnails are saved in. Defaults to the user cache folder.
+            thumbSize (int, optional): The largest width or height of a thumbnail. Defaults to 128.
+            maxImages (int, optional): The most thumbnails kept in memory. Defaults to 1024.
+        """
+
+        if not directory:
+            directory = os.path.join(QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.GenericCacheLocation), "QTPie", "thumbnails")
+
+        self.directory = directory
+        self.thumbSize = thumbSize
+        self.maxImages = maxImages
+
+        self.diskHits = 0
+        self.made = 0
+
+        self._images = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, filename):
+        """
+        Gets where the thumbnail of filename is saved.
+
+        Args:\n
+            filename (str): The path to the image.
+
+        Returns:\n
+            str: The path to the thumbnail. None if filename can not be read.
+        """
+
+        path = os.path.abspath(filename)
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        key = "{}|{}|{}|{}".format(path, stat.st_mtime_ns, stat.st_size, self.thumbSize)
+
+        return os.path.join(self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest()+".png")
+
+    def cached(self, filename):
+        """
+        Gets the thumbnail of filename if it is in memory.
+
+        Args:\n
+            filename (str): The path to the image.
+
+        Returns:\n
+            PyQt5.QtGui.QImage: The thumbnail. None if it is not in memory.
+        """
+
+        with self._lock:
+            image = self._images.get(filename)
+            if image is not None:
+                self._images.move_to_end(filename)
+
+        return image
+
+    def load(self, filename):
+        """
+        Gets the thumbnail of filename from memory, then disk, making it when neither has it. Safe to call off the GUI thread.
+
+        Args:\n
+            filename (str): The path to the image.
+
+        Returns:\n
+            PyQt5.QtGui.QImage: The thumbnail. Null if filename could not be read.
+        """
+
+        image = self.cached(filename)
+        if image is not None:
+            return image
+
+        thumbPath = self.path(filename)
+        if thumbPath is None:
+            return QtGui.QImage()
+
+        image = QtGui.QImage(thumbPath)
+        if image.isNull():
+            image = self.make(filename)
+            if not image.isNull():
+                self.save(image, thumbPath)
+        else:
+            self.diskHits += 1
+
+        if not image.isNull():
+            with self._lock:
+                self._images[filename] = image
+                while len(self._images) > self.maxImages:
+                    self._images.popitem(last=False)
+
+        return image
+
+    def save(self, image, thumbPath):
+        """
+        Writes a thumbnail to disk. A full disk or read only cache folder only loses the disk copy.
+
+        Args:\n
+            image (PyQt5.QtGui.QImage): The thumbnail.
+            thumbPath (str): Where the thumbnail is saved.
+
+        Returns:\n
+            bool: Whether the thumbnail was written.
+        """
+
+        #Written beside then renamed so a reader never sees half a thumbnail
+        tempPath = "{}.{}.tmp".format(thumbPath, threading.get_ident())
+
+        try:
+            if image.save(tempPath, "PNG"):
+                os.replace(tempPath, thumbPath)
+                return True
+        except OSError:
+            pass
+
+        if os.path.exists(tempPath):
+            os.remove(tempPath)
+
+        return False
+
+    def make(self, filename):
+        """
+        Decodes filename straight to thumbnail size.
+
+        Args:\n
+            filename (str): The path to the image.
+
+        Returns:\n
+            PyQt5.QtGui.QImage: The thumbnail. Null if filename could not be read.
+        """
+
+        reader = QtGui.QImageReader(filename)
+        size = reader.size()
+        if size.isValid():
+            reader.setScaledSize(size.scaled(self.thumbSize, self.thumbSize, QtCore.Qt.KeepAspectRatio))
+
+        self.made += 1
+
+        return reader.read()
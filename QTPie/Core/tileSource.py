@@ -0,0 +1,344 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the memory mapped tile reader for very large QTPie images.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import math
+import hashlib
+import threading
+import collections
+import numpy
+import PyQt5
+from PyQt5 import QtCore, QtGui
+
+
+class QTPieTiffLevel:
+    """
+    Reads regions of one TIFF page that can not be memory mapped, like tiled or compressed pages, by decoding only
+    the tiles or strips the region crosses. The most recently decoded segments are kept in memory.
+    """
+
+    def __init__(self, tiff, page, maxSegments=64):
+        """
+        Reads the layout of page without decoding it.
+
+        Args:\n
+            tiff (tifffile.TiffFile): The open TIFF file.
+            page (tifffile.TiffPage): The page to read.
+            maxSegments (int, optional): The most decoded tiles or strips kept in memory. Defaults to 64.
+        """
+
+        if page.samplesperpixel > 1 and page.planarconfig != 1:
+            raise ValueError("Only TIFF pages with interleaved samples can be tiled")
+
+        self.tiff = tiff
+        self.page = page
+        self.maxSegments = maxSegments
+
+        self.shape = (page.imagelength, page.imagewidth, page.samplesperpixel)
+        self.ndim = 3
+        self.dtype = numpy.dtype(page.dtype)
+
+        if page.is_tiled:
+            self.segmentWidth, self.segmentHeight = page.tilewidth, page.tilelength
+        else:
+            self.segmentWidth, self.segmentHeight = page.imagewidth, min(page.rowsperstrip, page.imagelength)
+        self.across = math.ceil(page.imagewidth/self.segmentWidth)
+
+        self._lock = threading.Lock()
+        self._segments = collections.OrderedDict()
+
+    def segment(self, row, column):
+        """
+        Gets a decoded tile or strip.
+
+        Args:\n
+            row (int): The row of the segment.
+            column (int): The column of the segment, always 0 for strips.
+
+        Returns:\n
+            numpy.ndarray: Height by width by samples pixels, padded to the full segment size.
+        """
+
+        index = row*self.across+column
+
+        with self._lock:
+            if index in self._segments:
+                self._segments.move_to_end(index)
+                return self._segments[index]
+
+            #The file handle is shared by every level of the TIFF
+            with self.tiff.filehandle.lock:
+                self.tiff.filehandle.seek(self.page.dataoffsets[index])
+                data = self.tiff.filehandle.read(self.page.databytecounts[index])
+
+        decoded = self.page.decode(data, index, jpegtables=self.page.jpegtables)[0]
+        segment = numpy.zeros((self.segmentHeight, self.segmentWidth, self.shape[2]), self.dtype)
+        decoded = decoded.reshape(-1, self.segmentWidth, self.shape[2])[:self.segmentHeight]
+        segment[:decoded.shape[0]] = decoded
+
+        with self._lock:
+            self._segments[index] = segment
+            while len(self._segments) > self.maxSegments:
+                self._segments.popitem(last=False)
+
+        return segment
+
+    def __getitem__(self, key):
+        """
+        Reads a region, every step pixel of it in each direction.
+
+        Args:\n
+            key (tuple of slice): The rows and columns, as in pixels[top:bottom:step, left:right:step].
+
+        Returns:\n
+            numpy.ndarray: Height by width by samples pixels.
+        """
+
+        top, bottom, rowStep = key[0].indices(self.shape[0])
+        left, right, columnStep = key[1].indices(self.shape[1])
+        rows, columns = range(top, bottom, rowStep), range(left, right, columnStep)
+
+        region = numpy.empty((len(rows), len(columns), self.shape[2]), self.dtype)
+        if not len(rows) or not len(columns):
+            return region
+
+        for segmentRow in range(top//self.segmentHeight, (rows[-1])//self.segmentHeight+1):
+            segmentTop = segmentRow*self.segmentHeight
+            #The rows of the region that fall in this segment row
+            first = max(0, -(-(segmentTop-top)//rowStep))
+            last = min(len(rows), -(-(segmentTop+self.segmentHeight-top)//rowStep))
+            if first >= last:
+                continue
+
+            for segmentColumn in range(left//self.segmentWidth, (columns[-1])//self.segmentWidth+1):
+                segmentLeft = segmentColumn*self.segmentWidth
+                firstColumn = max(0, -(-(segmentLeft-left)//columnStep))
+                lastColumn = min(len(columns), -(-(segmentLeft+self.segmentWidth-left)//columnStep))
+                if firstColumn >= lastColumn:
+                    continue
+
+                segment = self.segment(segmentRow, segmentColumn)
+                region[first:last, firstColumn:lastColumn] = segment[rows[first]-segmentTop:rows[last-1]-segmentTop+1:rowStep,
+                                                                     columns[firstColumn]-segmentLeft:columns[lastColumn-1]-segmentLeft+1:columnStep]
+
+        return region
+
+
+class QTPieTileSource:
+    """
+    Reads tiles of a memory mapped image on demand so only the pages being shown are touched.
+    Supports .npy files, raw pixel dumps given their shape and TIFFs through tifffile, tiled or compressed TIFF pages
+    are read a tile or strip at a time. Zoomed out tiles are read from the overview pages of a TIFF or from downsampled
+    levels built once from the image and kept on disk, so a zoomed out view does not touch every page of the image.
+    """
+
+    formats = {1: QtGui.QImage.Format_Grayscale8,
+               3: QtGui.QImage.Format_RGB888,
+               4: QtGui.QImage.Format_RGBA8888}
+
+    def __init__(self, filename, shape=None, dtype="uint8", tileSize=256, directory=""):
+        """
+        Memory maps filename.
+
+        Args:\n
+            filename (str): The path to the image.
+            shape (tuple of int, optional): The height, width and channels of a raw image. Defaults to None.
+            dtype (str, optional): The data type of a raw image. Defaults to "uint8".
+            tileSize (int, optional): The width and height of a tile in pixels. Defaults to 256.
+            directory (str, optional): The folder downsampled levels are saved in. Defaults to the user cache folder.
+        """
+
+        if not directory:
+            directory = os.path.join(QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.GenericCacheLocation), "QTPie", "tiles")
+
+        self.filename = filename
+        self.tileSize = tileSize
+        self.directory = directory
+
+        #The pixels of each level of detail that can be read directly, level 0 is full resolution
+        self.overviews = {}
+        self.pixels = self.mapFile(filename, shape, dtype)
+
+        if self.pixels.ndim == 2:
+            self.pixels = self.pixels[:, :, numpy.newaxis]
+        if self.pixels.shape[2] not in self.formats:
+            raise ValueError("Only images with 1, 3 or 4 channels can be tiled, got {}".format(self.pixels.shape[2]))
+
+        self.height, self.width = self.pixels.shape[:2]
+        self.overviews[0] = self.pixels
+
+        #Coarsest level is the first to fit in one tile
+        self.levels = max(1, math.ceil(math.log2(max(self.width, self.height)/tileSize))+1)
+
+        self.built = 0
+        self._buildLock = threading.Lock()
+
+    def mapFile(self, filename, shape, dtype):
+        """
+        Memory maps the pixels of filename without reading them. The overview pages of a TIFF are kept by level.
+
+        Args:\n
+            filename (str): The path to the image.
+            shape (tuple of int): The height, width and channels of a raw image. None for .npy and TIFF files.
+            dtype (str): The data type of a raw image.
+
+        Returns:\n
+            numpy.ndarray: The read only memory mapped pixels, or a QTPieTiffLevel for TIFF pages that can not be mapped.
+        """
+
+        if filename.lower().endswith(".npy"):
+            return numpy.load(filename, mmap_mode="r")
+
+        if filename.lower().endswith((".tif", ".tiff")):
+            try:
+                import tifffile
+            except ImportError as error:
+                raise ImportError("Tiling TIFF files requires the tifffile package") from error
+
+            tiff = tifffile.TiffFile(filename)
+            levels = [self.mapPage(tiff, level.keyframe) for level in tiff.series[0].levels]
+            #Overviews are kept when they are a power of two smaller, give or take rounding
+            height, width = levels[0].shape[:2]
+            for pixels in levels[1:]:
+                level = round(math.log2(width/pixels.shape[1]))
+                if level > 0 and abs(pixels.shape[1]*2**level-width) <= 2**level and abs(pixels.shape[0]*2**level-height) <= 2**level:
+                    self.overviews.setdefault(level, pixels)
+
+            return levels[0]
+
+        if shape is None:
+            raise ValueError("The shape of raw image {} must be given".format(filename))
+
+        return numpy.memmap(filename, dtype=dtype, mode="r", shape=tuple(shape))
+
+    @staticmethod
+    def mapPage(tiff, page):
+        """
+        Memory maps an uncompressed, untiled TIFF page or wraps any other page to be read a segment at a time.
+
+        Args:\n
+            tiff (tifffile.TiffFile): The open TIFF file.
+            page (tifffile.TiffPage): The page.
+
+        Returns:\n
+            numpy.ndarray: The pixels, height by width by samples, memory mapped or as a QTPieTiffLevel.
+        """
+
+        if page.is_memmappable:
+            return numpy.memmap(tiff.filehandle.path, dtype=numpy.dtype(tiff.byteorder+numpy.dtype(page.dtype).char), mode="r",
+                                offset=page.dataoffsets[0], shape=(page.imagelength, page.imagewidth, page.samplesperpixel))
+
+        return QTPieTiffLevel(tiff, page)
+
+    def path(self, level):
+        """
+        Gets where a downsampled level of the image is saved.
+
+        Args:\n
+            level (int): The level of detail.
+
+        Returns:\n
+            str: The path to the level.
+        """
+
+        path = os.path.abspath(self.filename)
+        stat = os.stat(path)
+        key = "{}|{}|{}|{}".format(path, stat.st_mtime_ns, stat.st_size, level)
+
+        return os.path.join(self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest()+".npy")
+
+    def overview(self, level):
+        """
+        Gets the pixels of a level of detail, loading or building the downsampled level the first time.
+
+        Args:\n
+            level (int): The level of detail, 0 for full resolution.
+
+        Returns:\n
+            numpy.ndarray: Every 2**level pixel of the image in each direction.
+        """
+
+        if level in self.overviews:
+            return self.overviews[level]
+
+        finer = self.overview(level-1)
+
+        with self._buildLock:
+            if level in self.overviews:
+                return self.overviews[level]
+
+            levelPath = self.path(level)
+            try:
+                pixels = numpy.load(levelPath, mmap_mode="r")
+            except (OSError, ValueError):
+                pixels = self.build(finer, levelPath)
+
+            self.overviews[level] = pixels
+
+        return pixels
+
+    def build(self, finer, levelPath, rows=512):
+        """
+        Downsamples the next finer level by two into a file, a band of rows at a time so memory use stays small.
+
+        Args:\n
+            finer (numpy.ndarray): The pixels of the next finer level.
+            levelPath (str): Where the level is saved.
+            rows (int, optional): The rows of the finer level read at once. Defaults to 512.
+
+        Returns:\n
+            numpy.ndarray: The read only memory mapped level.
+        """
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        height, width, channels = finer.shape
+        #Written beside then renamed so a reader never sees half a level
+        tempPath = "{}.{}.tmp.npy".format(levelPath[:-4], threading.get_ident())
+        pixels = numpy.lib.format.open_memmap(tempPath, mode="w+", dtype=finer.dtype, shape=((height+1)//2, (width+1)//2, channels))
+
+        for top in range(0, height, rows):
+            pixels[top//2:(top+rows+1)//2] = finer[top:top+rows:2, ::2]
+
+        pixels.flush()
+        del pixels
+        os.replace(tempPath, levelPath)
+        self.built += 1
+
+        return numpy.load(levelPath, mmap_mode="r")
+
+    def tile(self, level, column, row):
+        """
+        Reads one tile, every 2**level pixel of the image in each direction.
+
+        Args:\n
+            level (int): The level of detail, 0 for full resolution.
+            column (int): The column of the tile in the level.
+            row (int): The row of the tile in the level.
+
+        Returns:\n
+            PyQt5.QtGui.QImage: The tile. Null if it is outside of the image.
+        """
+
+        span = self.tileSize*2**level
+        if column*span >= self.width or row*span >= self.height or column < 0 or row < 0:
+            return QtGui.QImage()
+
+        x, y = column*self.tileSize, row*self.tileSize
+        pixels = self.overview(level)[y:y+self.tileSize, x:x+self.tileSize]
+        if pixels.dtype == numpy.uint16:
+            pixels = pixels >> 8
+        elif pixels.dtype != numpy.uint8:
+            pixels = numpy.clip(pixels, 0, 255)
+        pixels = numpy.ascontiguousarray(pixels, dtype=numpy.uint8)
+
+        height, width, channels = pixels.shape
+        image = QtGui.QImage(pixels.data, width, height, width*channels, self.formats[channels])
+
+        #The tile must own its pixels once the array goes away
+        return image.copy()
@@ -0,0 +1,146 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the pool that recycles released QTPie widgets.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import time
+import collections
+import PyQt5
+from PyQt5 import QtGui, sip
+
+
+class QTPieWidgetPool:
+    """
+    Keeps released widgets so the make* factories can reuse one made with the same class, style name
+    and constructor arguments instead of building and polishing a new one.
+    """
+
+    #Signals the factories or apps connect that are cleared before a widget is reused
+    signals = ("clicked", "pressed", "released", "toggled", "stateChanged", "mouseEnter", "mouseLeave", "linkActivated", "linkHovered")
+
+    def __init__(self, maxFree=64):
+        """
+        Initializes an empty pool.
+
+        Args:\n
+            maxFree (int, optional): The most released widgets kept per class and style name. Defaults to 64.
+        """
+
+        self.maxFree = maxFree
+
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.discarded = 0
+        self.acquireSeconds = 0.0
+
+        self._free = collections.defaultdict(list)
+        self._keys = {}
+
+    def acquire(self, widgetClass, name, **kwargs):
+        """
+        Gets a released widget made the same way or makes a new one.
+
+        Args:\n
+            widgetClass (type): The QTPie widget class.
+            name (str): The object name the stylesheet styles the widget by.
+            kwargs: The constructor arguments of the widget.
+
+        Returns:\n
+            PyQt5.QtWidgets.QWidget: The widget with its object name set.
+        """
+
+        start = time.perf_counter()
+        key = (widgetClass, name, tuple(sorted(kwargs.items())))
+
+        free = self._free[key]
+        while free and sip.isdeleted(free[-1]):
+            free.pop()
+
+        if free:
+            widget = free.pop()
+            self.reused += 1
+        else:
+            widget = widgetClass(**kwargs)
+            widget.setObjectName(name)
+            self._keys[id(widget)] = key
+            widget.destroyed.connect(lambda _=None, widgetId=id(widget): self._keys.pop(widgetId, None))
+            self.created += 1
+
+        self.acquireSeconds += time.perf_counter()-start
+
+        return widget
+
+    def release(self, widget):
+        """
+        Takes widget off screen, clears its state and connections and keeps it for reuse.
+        Widgets the pool did not make or beyond the free limit are deleted instead.
+
+        Args:\n
+            widget (PyQt5.QtWidgets.QWidget): A widget made by acquire.
+        """
+
+        key = self._keys.get(id(widget))
+        self.released += 1
+
+        #Leaving the parent hides the widget and takes it out of the parents layout. An explicit hide would keep
+        #the widget hidden once it is reused in a layout again
+        widget.setParent(None)
+
+        if key is None or len(self._free[key]) >= self.maxFree:
+            self._keys.pop(id(widget), None)
+            widget.deleteLater()
+            self.discarded += 1
+            return
+
+        self.reset(widget)
+        self._free[key].append(widget)
+
+    def reset(self, widget):
+        """
+        Disconnects every known signal and clears the content of widget.
+
+        Args:\n
+            widget (PyQt5.QtWidgets.QWidget): The released widget.
+        """
+
+        for signalName in self.signals:
+            signal = getattr(widget, signalName, None)
+            if signal is None:
+                continue
+            try:
+                signal.disconnect()
+            except TypeError:
+                #Nothing was connected
+                pass
+
+        widget.blockSignals(True)
+        if hasattr(widget, "setChecked"):
+            widget.setChecked(False)
+        if hasattr(widget, "setIcon"):
+            widget.setIcon(QtGui.QIcon())
+            widget.iconName = None
+        if hasattr(widget, "clear"):
+            widget.clear()
+        else:
+            widget.setText("")
+        widget.setToolTip("")
+        widget.setEnabled(True)
+        widget.blockSignals(False)
+
+    def stats(self):
+        """
+        Gets the allocation counters of the pool.
+
+        Returns:\n
+            dict: How many widgets were created, reused, released and discarded, the time spent
+                  acquiring them and how many are waiting for reuse.
+        """
+
+        return {"created": self.created, "reused": self.reused, "released": self.released,
+                "discarded": self.discarded, "acquireSeconds": self.acquireSeconds,
+                "free": sum(len(free) for free in self._free.values())}
@@ -0,0 +1,125 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the background worker used to keep heavy QTPie work off the GUI thread.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import PyQt5
+from PyQt5 import QtCore
+
+
+class QTPieWorkerSignals(QtCore.QObject):
+    """
+    The signals of a QTPieWorker. Made on the GUI thread so results are delivered back to it.
+    """
+
+    finished = QtCore.pyqtSignal(object, object)
+    failed = QtCore.pyqtSignal(object, object)
+
+
+class QTPieWorker(QtCore.QRunnable):
+    """
+    A runnable calling a function on a QThreadPool and emitting its result with the token it was started with.
+
+    Args:\n
+        QtCore (PyQt5.QtCore.QRunnable): Inherits from QRunnable.
+    """
+
+    #Keeps started workers alive until their result is delivered
+    active = set()
+    _pool = None
+
+    @classmethod
+    def pool(cls):
+        """
+        Gets the thread pool QTPie workers run on. Kept apart from the global pool
+        because Qt itself uses the global pool, for example when smoothly scaling images.
+
+        Returns:\n
+            PyQt5.QtCore.QThreadPool: The QTPie thread pool.
+        """
+
+        if cls._pool is None:
+            cls._pool = QtCore.QThreadPool()
+
+        return cls._pool
+
+    def __init__(self, function, *args, token=None, **kwargs):
+        """
+        Initializes the runnable.
+
+        Args:\n
+            function (def): The function to be called off the GUI thread.
+            token (object, optional): Handed back with the result so stale results can be ignored. Defaults to None.
+        """
+
+        super().__init__()
+
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.token = token
+        self.signals = QTPieWorkerSignals()
+
+        self.setAutoDelete(False)
+
+    def run(self):
+        """
+        Calls the function and emits finished with the result or failed with the exception.
+        """
+
+        try:
+            result = self.function(*self.args, **self.kwargs)
+        except Exception as error: #pylint: disable=W0703
+            self.signals.failed.emit(self.token, error)
+        else:
+            self.signals.finished.emit(self.token, result)
+
+    def start(self, pool=None):
+        """
+        Queues the runnable on pool.
+
+        Args:\n
+            pool (PyQt5.QtCore.QThreadPool, optional): The pool to run on. Defaults to the QTPie pool.
+
+        Returns:\n
+            QTPieWorker: The started worker.
+        """
+
+        pool = pool if pool else QTPieWorker.pool()
+
+        QTPieWorker.active.add(self)
+        self.signals.finished.connect(self._release)
+        self.signals.failed.connect(self._release)
+        pool.start(self)
+
+        return self
+
+    def cancel(self, pool=None):
+        """
+        Removes the runnable from pool if it has not started yet.
+
+        Args:\n
+            pool (PyQt5.QtCore.QThreadPool, optional): The pool it was started on. Defaults to the QTPie pool.
+
+        Returns:\n
+            bool: Whether the runnable was removed before running.
+        """
+
+        pool = pool if pool else QTPieWorker.pool()
+
+        if pool.tryTake(self):
+            QTPieWorker.active.discard(self)
+            return True
+
+        return False
+
+    def _release(self, *_):
+        """
+        Lets the worker be garbage collected once its result reached the GUI thread.
+        """
+
+        QTPieWorker.active.discard(self)
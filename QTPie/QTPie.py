@@ -8,6 +8,7 @@ __author__ = "Noupin"
 import os
 import sys
 import json
+import contextlib
 import PyQt5
 from PyQt5 import QtWidgets, QtCore, QtGui
 
@@ -20,25 +21,9 @@ sys.path.insert(0, parent_dir_path)
 import utilities
 from actions import Actions
 from tunable import Tunable
-from QTPie.UI.dial import QTPieDial
-from QTPie.UI.image import QTPieImage
 from QTPie.UI.label import QTPieLabel
-from QTPie.UI.media import QTPieMedia
-from QTPie.UI.video import QTPieVideo
-from QTPie.UI.button import QTPieButton
-from QTPie.UI.pixmap import QTPiePixmap
-from QTPie.UI.slider import QTPieSlider
 from QTPie.UI.widget import QTPieWidget
 from QTPie.UI.window import QTPieWindow
-from QTPie.UI.textbox import QTPieTextbox
-from QTPie.UI.checkbox import QTPieCheckbox
-from QTPie.UI.dropdown import QTPieDropdown
-from QTPie.UI.scrollArea import QTPieScroll
-from QTPie.UI.mediaWidget import QTPieMediaWidget
-from QTPie.UI.progressBar import QTPieProgressBar
-from QTPie.UI.radioButton import QTPieRadioButton
-from QTPie.UI.volumeWidget import QTPieVolumeWidget
-from QTPie.UI.controlWidget import QTPieControlWidget
 
 
 class QTPie:
@@ -46,7 +31,7 @@ class QTPie:
     Manages the UI based on the users monitor and position in the application.
     """
 
-    def __init__(self, icon=None, tunableDict=json.loads(json.dumps({"windowX": 20, "windowY": 50, "windowWidth": 500, "windowHeight": 500, "volume": 50})), title="Window"):
+    def __init__(self, icon=None, tunableDict=json.loads(json.dumps({"windowX": 20, "windowY": 50, "windowWidth": 500, "windowHeight": 500, "volume": 50})), title="Window", settings=None, imageCacheBudget=256*1024*1024, profile=False, gridMode="spacer", maxPages=4, recycleWidgets=False, styleMode="global", maxPlayingVideos=None):
         """
         Initializing the UI for Forge.
 
@@ -55,41 +40,221 @@ class QTPie:
             tunableDict (JSON, optional): The tunable variables class for saving the windows position on close.
                                           Defaults to {"windowX": 10, "windowY": 10, "windowWidth": 500, "windowHeight": 500}.
             title (str, optional): The name of the window. Defaults to "Window".
+            settings (Settings, optional): The store the tunable variables are saved to on change and close. Defaults to Tunable.settings.
+            imageCacheBudget (int, optional): The maximum amount of bytes decoded images may hold in memory. Defaults to 256MB.
+            profile (bool, optional): Whether to time the startup phases and make* calls and dump them after the first frame.
+                                      Also enabled by the QTPIE_PROFILE environment variable. Defaults to False.
+            gridMode (str, optional): spacer fills every grid cell with a spacer label, stretch sizes the grid with
+                                      row and column stretch only. Defaults to "spacer".
+            maxPages (int, optional): The most registered pages kept built at once. Defaults to 4.
+            recycleWidgets (bool, optional): Whether makeButton, makeLabel and makeCheckbox reuse widgets given back
+                                             with releaseWidget. Defaults to False.
+            styleMode (str, optional): global sets the whole stylesheet on the application, scoped gives each window and page
+                                       only the rules matching the widgets in it. Defaults to "global".
+            maxPlayingVideos (int, optional): The most videos decoding at once, the largest on screen play. Defaults to None for no limit.
         """
 
-        stylesheet = open(utilities.resource_path("QTPie\\QTPie Style\\style.css"), "r")
-        self.styling = stylesheet.read()
-        stylesheet.close()
-
-        self.actions = Actions()
+        if styleMode not in ("global", "scoped"):
+            raise ValueError("styleMode must be global or scoped")
+        self.styleMode = styleMode
+
+        #Scoped styles are applied to whatever each make* returns
+        self.styleSheet = None
+        if styleMode == "scoped":
+            from QTPie.Core.styleSheet import QTPieStyleSheet
+            self.styleSheet = QTPieStyleSheet()
+            for name in dir(self):
+                if (name.startswith("make") and name != "makeWidget") or name == "createMenu":
+                    setattr(self, name, self.styleSheet.wrap(getattr(self, name)))
+
+        #Opt in startup profiling through profile or the QTPIE_PROFILE environment variable
+        self.profiler = None
+        if profile or os.environ.get("QTPIE_PROFILE"):
+            from QTPie.Core.profiler import QTPieProfiler
+            self.profiler = QTPieProfiler(os.environ.get("QTPIE_PROFILE_OUTPUT", "qtpie_profile.json"))
+            for name in dir(self):
+                if name.startswith(("make", "add", "create", "setup")):
+                    setattr(self, name, self.profiler.wrap(name, getattr(self, name)))
+
+        with self.phase("stylesheet"):
+            self.stylePath = utilities.resource_path("QTPie\\QTPie Style\\style.css")
+            self.styleWatcher = None
+            stylesheet = open(self.stylePath, "r")
+            self.styling = stylesheet.read()
+            stylesheet.close()
+            if self.styleSheet:
+                self.styleSheet.parse(self.styling)
+
+        if gridMode not in ("spacer", "stretch"):
+            raise ValueError("gridMode must be spacer or stretch")
+        self.gridMode = gridMode
+
+        self.actions = Actions(settings)
+
+        self.pages = None
+        self.maxPages = maxPages
+
+        self.widgetPool = None
+        if recycleWidgets:
+            from QTPie.Core.widgetPool import QTPieWidgetPool
+            self.widgetPool = QTPieWidgetPool()
 
         self.tunableDict = tunableDict
+        self.maxPlayingVideos = maxPlayingVideos
+
+        from QTPie.Core.imageCache import QTPieImageCache
+        QTPieImageCache.instance().setBudget(imageCacheBudget)
+
+        with self.phase("application"):
+            self.app = QtWidgets.QApplication(sys.argv)
+            if not self.styleSheet:
+                self.app.setStyleSheet(self.styling)
+            self.app.aboutToQuit.connect(lambda: self.actions.onWindowClose(self.mainWindow))
+            self.app.aboutToQuit.connect(self.actions.settings.flush)
+
+            if icon:
+                appIcon = PyQt5.QtGui.QIcon()
+                appIcon.addFile(utilities.resource_path("icon.png"))
+                self.app.setWindowIcon(appIcon)
+
+        with self.phase("grid"):
+            self.grid = QtWidgets.QGridLayout()
+            self.gridCount = 0
+            self.grid.setSpacing(0)
+            self.grid.setContentsMargins(0, 0, 0, 0)
+            self.space = self.makeLabel(txt="", name="Spacer", addToGrid=False) if self.gridMode == "spacer" else None
+
+            self.window = QTPieWidget()
+            self.window.setLayout(self.grid)
+            self.geometry = None
+
+        with self.phase("mainWindow"):
+            self.mainWindow = QTPieWindow()
+            self.mainWindow.setGeometry(self.tunableDict["windowX"],
+                                        self.tunableDict["windowY"],
+                                        self.tunableDict["windowWidth"],
+                                        self.tunableDict["windowHeight"])
+            self.mainWindow.setWindowTitle(title)
+            self.mainWindow.setCentralWidget(self.window)
+            self.styleWidget(self.mainWindow)
+
+        if self.profiler:
+            self.profiler.watchFirstPaint(self.mainWindow)
+
+    def phase(self, name):
+        """
+        Times a with block when startup profiling is enabled.
+
+        Args:\n
+            name (str): The name of the phase.
+
+        Returns:\n
+            contextlib.AbstractContextManager: The profiler phase or a context that does nothing.
+        """
+
+        if self.profiler:
+            return self.profiler.phase(name)
+
+        return contextlib.nullcontext()
+
+    def styleWidget(self, widget):
+        """
+        Makes sure widget and the widgets inside it are styled when styles are scoped. A widget without a parent, like
+        a page or window, becomes a container the widgets put in it inherit their style from. Needed for containers
+        and named widgets not made by a make* factory or after changing a widgets object name.
+
+        Args:\n
+            widget (PyQt5.QtWidgets.QWidget): The top widget to be styled.
+        """
+
+        if self.styleSheet:
+            self.styleSheet.apply(widget, widget if widget.parentWidget() is None else None)
+
+    def reloadStyle(self, filename=None):
+        """
+        Reloads the stylesheet, for example after editing it or to switch themes. The rules are diffed only to decide
+        whether to reload, saves that only change comments, spacing or order of unrelated rules restyle nothing. Any other
+        change sets the stylesheet again and Qt re-polishes every widget under it, so with scoped styles each container whose
+        stylesheet changed is restyled whole, including widgets the changed rules do not match, and in global mode the whole
+        application is restyled.
+
+        Args:\n
+            filename (str, optional): The stylesheet to load. Defaults to the current stylesheet file.
+
+        Returns:\n
+            int: The amount of widgets restyled, -1 when the whole application was restyled.
+        """
+
+        if filename:
+            self.stylePath = filename
+
+        with open(self.stylePath, "r") as stylesheet:
+            styling = stylesheet.read()
+
+        if styling == self.styling:
+            return 0
+        oldStyling, self.styling = self.styling, styling
+
+        if self.styleSheet:
+            return self.styleSheet.reload(styling)
+
+        from QTPie.Core.styleSheet import QTPieStyleSheet
 
-        self.app = QtWidgets.QApplication(sys.argv)
-        self.app.setStyleSheet(self.styling)
-        self.app.aboutToQuit.connect(lambda: self.actions.onWindowClose(self.mainWindow))
+        if QTPieStyleSheet(styling).keyedRules() == QTPieStyleSheet(oldStyling).keyedRules():
+            return 0
 
-        if icon:
-            appIcon = PyQt5.QtGui.QIcon()
-            appIcon.addFile(utilities.resource_path("icon.png"))
-            self.app.setWindowIcon(appIcon)
+        self.app.setStyleSheet(styling)
 
-        self.grid = QtWidgets.QGridLayout()
-        self.gridCount = 0
-        self.grid.setSpacing(0)
-        self.grid.setContentsMargins(0, 0, 0, 0)
-        self.space = self.makeLabel(txt="", name="Spacer", addToGrid=False)
+        return -1
+
+    def watchStyle(self, filename=None):
+        """
+        Reloads the stylesheet whenever its file is saved. Its folder is watched too so saves that delete and recreate the file are seen.
+
+        Args:\n
+            filename (str, optional): The stylesheet to watch. Defaults to the current stylesheet file.
+        """
 
-        self.window = QTPieWidget()
-        self.window.setLayout(self.grid)
+        if filename:
+            self.stylePath = filename
 
-        self.mainWindow = QTPieWindow()
-        self.mainWindow.setGeometry(self.tunableDict["windowX"],
-                                    self.tunableDict["windowY"],
-                                    self.tunableDict["windowWidth"],
-                                    self.tunableDict["windowHeight"])
-        self.mainWindow.setWindowTitle(title)
-        self.mainWindow.setCentralWidget(self.window)
+        if self.styleWatcher is None:
+            self.styleWatcher = QtCore.QFileSystemWatcher()
+            self.styleWatcher.fileChanged.connect(self.onStyleChanged)
+            self.styleWatcher.directoryChanged.connect(self.onStyleDirectoryChanged)
+
+        watched = self.styleWatcher.files()+self.styleWatcher.directories()
+        if watched:
+            self.styleWatcher.removePaths(watched)
+        self.styleWatcher.addPaths([self.stylePath, os.path.dirname(os.path.abspath(self.stylePath))])
+
+    def onStyleChanged(self, path):
+        """
+        Reloads the watched stylesheet. Editors that save by replacing the file remove it from the watcher, if it
+        is gone the folder watch picks it up again once it is recreated.
+
+        Args:\n
+            path (str): The path of the changed stylesheet.
+        """
+
+        if not os.path.exists(path):
+            return
+
+        if path not in self.styleWatcher.files():
+            self.styleWatcher.addPath(path)
+
+        self.reloadStyle()
+
+    def onStyleDirectoryChanged(self, directory):
+        """
+        Watches and reloads the stylesheet again once a save that deleted it has recreated it.
+
+        Args:\n
+            directory (str): The folder of the stylesheet.
+        """
+
+        if self.stylePath not in self.styleWatcher.files() and os.path.exists(self.stylePath):
+            self.onStyleChanged(self.stylePath)
 
     def percentToPosition(self, xPos, yPos, width, height):
         """
@@ -105,20 +270,43 @@ class QTPie:
             tuple of int: The arg converted to an int pixel value.
         """
 
-        if type(xPos) == str:
-            if xPos.find("%") != -1:
-                xPos = self.window.size().width()*(int(xPos.replace("%", ""))/100)
-        if type(yPos) == str:
-            if yPos.find("%") != -1:
-                yPos = self.window.size().height()*(int(yPos.replace("%", ""))/100)
-        if type(width) == str:
-            if width.find("%") != -1:
-                width = self.window.size().width()*(int(width.replace("%", ""))/100)
-        if type(height) == str:
-            if height.find("%") != -1:
-                height = self.window.size().height()*(int(height.replace("%", ""))/100)
-        
-        return int(xPos), int(yPos), int(width), int(height)
+        from QTPie.Core.geometry import compileValue
+
+        windowWidth, windowHeight = self.window.size().width(), self.window.size().height()
+        sizes = (windowWidth, windowHeight, windowWidth, windowHeight)
+
+        return tuple(int(size*factor+offset) for size, (factor, offset) in zip(sizes, map(compileValue, (xPos, yPos, width, height))))
+
+    def placeWidget(self, widget, xPos, yPos, width, height):
+        """
+        Places widget on the window by pixel or percent values and keeps it placed as the window is resized.
+        The percent values are parsed once and every placed widget is repositioned together on resize.
+
+        Args:\n
+            widget (PyQt5.QtWidgets.QWidget): The widget to be placed.
+            xPos (int, str, float): The x coordinate, in pixels or percent of the window width.
+            yPos (int, str, float): The y coordinate, in pixels or percent of the window height.
+            width (int, str, float): The width, in pixels or percent of the window width.
+            height (int, str, float): The height, in pixels or percent of the window height.
+        """
+
+        from QTPie.Core.geometry import QTPieGeometry
+
+        if self.geometry is None:
+            self.geometry = QTPieGeometry()
+            self.window.resized.connect(self.applyGeometry)
+
+        widget.setParent(self.window)
+        self.geometry.add(widget, xPos, yPos, width, height)
+        widget.setGeometry(*self.geometry.resolve(self.window.width(), self.window.height())[-1].tolist())
+        widget.show()
+
+    def applyGeometry(self):
+        """
+        Repositions every widget placed with placeWidget for the current window size.
+        """
+
+        self.geometry.apply(self.window.width(), self.window.height())
 
     def alignWidget(self, widget, alignment):
         """
@@ -132,6 +320,47 @@ class QTPie:
         alignments = {"left": QtCore.Qt.AlignLeft, "center": QtCore.Qt.AlignCenter, "right": QtCore.Qt.AlignRight}
         widget.setAlignment(alignments[alignment.lower()])
 
+    def makeWidget(self, widgetClass, name, **kwargs):
+        """
+        Makes a widget or, when recycling widgets, reuses a released one made the same way.
+
+        Args:\n
+            widgetClass (type): The QTPie widget class.
+            name (str): The name for the QTPie stylesheet to specify style.
+            kwargs: The constructor arguments of the widget.
+
+        Returns:\n
+            PyQt5.QtWidgets.QWidget: The widget with its object name set.
+        """
+
+        if self.widgetPool is not None:
+            return self.widgetPool.acquire(widgetClass, name, **kwargs)
+
+        widget = widgetClass(**kwargs)
+        widget.setObjectName(name)
+
+        return widget
+
+    def releaseWidget(self, widget):
+        """
+        Removes a widget from the window. When recycling widgets it is kept for the next make* call
+        with the same type and name, otherwise it is deleted.
+
+        Args:\n
+            widget (PyQt5.QtWidgets.QWidget): A widget made by makeButton, makeLabel or makeCheckbox.
+        """
+
+        if self.geometry is not None:
+            self.geometry.remove(widget)
+
+        if self.widgetPool is not None:
+            self.widgetPool.release(widget)
+            return
+
+        widget.hide()
+        widget.setParent(None)
+        widget.deleteLater()
+
     def addGridRow(self, grid, count, columns):
         """
         Adds a row to the given grid on the count.
@@ -142,11 +371,32 @@ class QTPie:
             columns (int): The amount of columns to be added to each row.
         """
 
+        if self.gridMode == "stretch":
+            self.addStretchRow(grid, count, columns)
+            return
+
         for _ in range(columns):
             grid.addWidget(self.space, count, _)
             grid.setColumnStretch(_, 1)
         grid.setRowStretch(count, 1)
 
+    def addStretchRow(self, grid, count, columns):
+        """
+        Adds a row to the given grid on the count using only stretch factors and minimum sizes so no spacer
+        widgets are added. Empty rows and columns keep their share because of the minimum size.
+
+        Args:\n
+            grid (PyQt5.QtWidgets.QGridLayout): A grid with count amount of rows.
+            count (int): The current amount of rows the grid being passed in has.
+            columns (int): The amount of columns to be added to each row.
+        """
+
+        for column in range(columns):
+            grid.setColumnStretch(column, 1)
+            grid.setColumnMinimumWidth(column, 1)
+        grid.setRowStretch(count, 1)
+        grid.setRowMinimumHeight(count, 1)
+
     def makeLabel(self, name="", txt="Button", enableDrop=False, align="center", addToGrid=True, gridData=[0, 0, 0, 0]):
         """
         Combines the basic Label code into one function with added functionality and support for css syntax.
@@ -163,8 +413,7 @@ class QTPie:
             QTPieLabel: A QTPie label.
         """
 
-        label = QTPieLabel(dropArea=enableDrop)
-        label.setObjectName(name)
+        label = self.makeWidget(QTPieLabel, name, dropArea=enableDrop)
         label.setText(txt)
         label.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         self.alignWidget(label, align)
@@ -174,7 +423,7 @@ class QTPie:
 
         return label
     
-    def makeImage(self, name="", filename=r"smile.jpg", keepAR=True, enableDrop=False, align="center", addToGrid=True, gridData=[0, 0, 0, 0]):
+    def makeImage(self, name="", filename=r"smile.jpg", keepAR=True, enableDrop=False, usePyramid=True, scaleMode="fast", asyncLoad=False, decodeToSize=False, align="center", addToGrid=True, gridData=[0, 0, 0, 0]):
         """
         Combines the basic Image code into one function with added functionality and support for CSS syntax
 
@@ -183,6 +432,10 @@ class QTPie:
             filename (str, optional): The filepath for the pixmap image. Defaults to "icon.png".
             keepAR (bool, optional): Whether to keep the original pictures aspect ratio or fit to given width and height. Defaults to True.
             enableDrop (bool, optional): Determines whether drag and drop is enabled. Defaults to False.
+            usePyramid (bool, optional): Whether resizing scales from reduced resolution copies of the image. Defaults to True.
+            scaleMode (str, optional): fast, smooth or settle. Settle previews fast while resizing and smoothly rescales off the GUI thread after. Defaults to "fast".
+            asyncLoad (bool, optional): Whether the image and dropped images are decoded off the GUI thread. Defaults to False.
+            decodeToSize (bool, optional): Whether the image is decoded at about its displayed size instead of full resolution. Defaults to False.
             align (str, optional): left, right, center alignment of the content of the label. Defaults to "center".
             addToGrid (bool, optional): Determines whether to add to the main grid or not. Defaults to True.
             gridData (list of int, optional): List of column, row, columnspan, rowspan values. Defaults to [0, 0, 0, 0].
@@ -191,14 +444,22 @@ class QTPie:
             QTPieImage: A QTPie image with a pixmamp in it and extending the QTPieLabel
         """
 
-        name += "Image"
+        from QTPie.UI.image import QTPieImage
+        from QTPie.UI.pixmap import QTPiePixmap
 
-        image = QTPieImage(dropArea=enableDrop, filename=filename)
-        image.pixelMap = QTPiePixmap()
-        image.pixelMap = image.pixelMap.fromImage(PyQt5.QtGui.QImage(filename))
+        name += "Image"
 
+        image = QTPieImage(dropArea=enableDrop, filename=filename, usePyramid=usePyramid, scaleMode=scaleMode, asyncLoad=asyncLoad, decodeToSize=decodeToSize)
         image.setObjectName(name)
-        image.setPixmap(image.pixelMap)
+
+        #Images decoded to size wait for the first resize to know their real size
+        if not decodeToSize:
+            if asyncLoad:
+                image.setImage(filename)
+            else:
+                image.pixelMap = QTPiePixmap.fromImage(image.imageCache.get(filename))
+                image.setPixmap(image.pixelMap)
+
         image.setSizePolicy(PyQt5.QtWidgets.QSizePolicy.Ignored, PyQt5.QtWidgets.QSizePolicy.Ignored)
         self.alignWidget(image, align)
 
@@ -207,6 +468,71 @@ class QTPie:
 
         return image
 
+    def makeTiledImage(self, name="", filename="", shape=None, dtype="uint8", tileSize=256, maxTiles=256, addToGrid=True, gridData=[0, 0, 0, 0]):
+        """
+        Combines the basic Tiled Image code into one function with added functionality and support for CSS syntax.
+        Only the visible tiles of the image are read so memory stays bounded for images of any size.
+
+        Args:\n
+            name (str, optional): The name for the QTPie stylesheet to specify style. Defaults to "".
+            filename (str, optional): The path to a .npy, raw or TIFF image. Defaults to "".
+            shape (tuple of int, optional): The height, width and channels of a raw image. Defaults to None.
+            dtype (str, optional): The data type of a raw image. Defaults to "uint8".
+            tileSize (int, optional): The width and height of a tile in pixels. Defaults to 256.
+            maxTiles (int, optional): The most decoded tiles kept in memory. Defaults to 256.
+            addToGrid (bool, optional): Determines whether to add to the main grid or not. Defaults to True.
+            gridData (list of int, optional): List of column, row, columnspan, rowspan values. Defaults to [0, 0, 0, 0].
+
+        Returns:\n
+            QTPieTiledImage: A QTPie tiled image with pan and zoom.
+        """
+
+        from QTPie.UI.tiledImage import QTPieTiledImage
+
+        name += "TiledImage"
+
+        tiledImage = QTPieTiledImage(filename=filename, shape=shape, dtype=dtype, tileSize=tileSize, maxTiles=maxTiles)
+        tiledImage.setObjectName(name)
+        tiledImage.setSizePolicy(QtWidgets.QSizePolicy.Ignored, QtWidgets.QSizePolicy.Ignored)
+
+        if addToGrid:
+            self.grid.addWidget(tiledImage, gridData[1], gridData[0], gridData[3], gridData[2])
+
+        return tiledImage
+
+    def makeGallery(self, name="", filenames=None, folder="", thumbSize=128, cacheDirectory="", addToGrid=True, gridData=[0, 0, 0, 0]):
+        """
+        Combines the basic Gallery code into one function with added functionality and support for CSS syntax.
+        Only the visible rows get labels and thumbnails are made in the background and saved to disk.
+
+        Args:\n
+            name (str, optional): The name for the QTPie stylesheet to specify style. Defaults to "".
+            filenames (list of str, optional): The images to be shown. Defaults to None.
+            folder (str, optional): A folder whose images are shown instead of filenames. Defaults to "".
+            thumbSize (int, optional): The largest width or height of a thumbnail. Defaults to 128.
+            cacheDirectory (str, optional): The folder thumbnails are saved in. Defaults to the user cache folder.
+            addToGrid (bool, optional): Determines whether to add to the main grid or not. Defaults to True.
+            gridData (list of int, optional): List of column, row, columnspan, rowspan values. Defaults to [0, 0, 0, 0].
+
+        Returns:\n
+            QTPieGallery: A QTPie scroll area of thumbnails.
+        """
+
+        from QTPie.UI.gallery import QTPieGallery
+
+        name += "Gallery"
+
+        gallery = QTPieGallery(filenames=filenames, thumbSize=thumbSize, cacheDirectory=cacheDirectory)
+        gallery.setObjectName(name)
+        gallery.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        if folder:
+            gallery.setFolder(folder)
+
+        if addToGrid:
+            self.grid.addWidget(gallery, gridData[1], gridData[0], gridData[3], gridData[2])
+
+        return gallery
+
     def makeButton(self, clickAction, mouseEnterAction=None, mouseLeaveAction=None, name="", txt="Button", icon="", enableDrop=False, enableHover=False, addToGrid=True, gridData=[0, 0, 0, 0]):
         """
         Combines the basic Button code into one function with added functionality and support for css syntax. Optional to apply to grid.
@@ -217,7 +543,7 @@ class QTPie:
             mouseLeaveAction (def, optional): The function to be called on the mouse leaving the button. Defaults to None.
             name (str, optional): The name for the QTPie stylesheet to specify style. Defaults to "".
             txt (str, optional): The text the be displayed. Defaults to "Button".
-            icon (str, optional): The string corresponding to an icon. Defaults to "".
+            icon (str, optional): The name of a standard or registered icon, see QTPieIconRegistry. Defaults to "".
             enableDrop (bool, optional): Determines whether drag and drop is enabled. Defaults to False.
             enableHover (bool, optional): Determines whether hovering signals are enabled. Defaults to False.
             addToGrid (bool, optional): Determines whether to add to the main grid or not. Defaults to True.
@@ -227,16 +553,12 @@ class QTPie:
             QTPieButton: A PyQt5 push button.
         """
 
-        icons = {"play": PyQt5.QtWidgets.QStyle.SP_MediaPlay,
-                 "pause": PyQt5.QtWidgets.QStyle.SP_MediaPause,
-                 "file": PyQt5.QtWidgets.QStyle.SP_FileLinkIcon,
-                 "volume": PyQt5.QtWidgets.QStyle.SP_MediaVolume,
-                 "muted": PyQt5.QtWidgets.QStyle.SP_MediaVolumeMuted}
+        from QTPie.UI.button import QTPieButton
+        from QTPie.Core.iconRegistry import QTPieIconRegistry
 
-        btn = QTPieButton(dropArea=enableDrop, hover=enableHover)
-        btn.setObjectName(name)
-        if icon in icons:
-            btn.setIcon(self.app.style().standardIcon(icons[icon]))
+        btn = self.makeWidget(QTPieButton, name, dropArea=enableDrop, hover=enableHover)
+        if QTPieIconRegistry.instance().has(icon):
+            QTPieIconRegistry.instance().setIcon(btn, icon)
         else:
             btn.setText(txt)
         btn.clicked.connect(clickAction)
@@ -266,6 +588,8 @@ class QTPie:
             QTPieSlider: A QTPie slider.
         """
 
+        from QTPie.UI.slider import QTPieSlider
+
         volume = QTPieSlider()
         volume.setObjectName("VideoVolume")
         volume.setOrientation(QtCore.Qt.Horizontal)
@@ -277,25 +601,45 @@ class QTPie:
 
         return volume
     
-    def makeVideoProgressBar(self, mediaWidget):
+    def makeVideoProgressBar(self, mediaWidget, syncHz=None, framePreview=False):
         """
         Create a volume slider for a given media. Does not apply to grid.
 
         Args:\n
             mediaWidget (QTPieMediaWidget): The widget that holds all media player widgets.
+            syncHz (float, optional): The most times per second the slider follows the media position. Defaults to None for the screen refresh rate.
+            framePreview (bool, optional): Whether hovering shows the frame under the mouse. Needs opencv-python or ffmpeg. Defaults to False.
 
         Returns:\n
             QTPieSlider: A QTPie slider.
         """
 
+        from QTPie.UI.slider import QTPieSlider
+        from QTPie.Core.positionSync import QTPiePositionSync
+
         videoProgress = QTPieSlider()
         videoProgress.setObjectName("VideoProgressBar")
         videoProgress.setOrientation(QtCore.Qt.Horizontal)
         videoProgress.setMinimum(0)
         videoProgress.setMaximum(100)
         videoProgress.sliderMoved.connect(lambda: self.actions.changeTimestamp(mediaWidget, videoProgress))
-        mediaWidget.media.positionChanged.connect(lambda: self.actions.timestampChanged(mediaWidget, videoProgress))
-        mediaWidget.media.durationChanged.connect(lambda: self.actions.durationChanged(mediaWidget, videoProgress))
+        videoProgress.sliderReleased.connect(lambda: self.actions.changeTimestamp(mediaWidget, videoProgress))
+        videoProgress.positionSync = QTPiePositionSync(mediaWidget.media, videoProgress, syncHz)
+
+        def onMediaSwapped(oldMedia, newMedia):
+            oldMedia.durationChanged.disconnect(onDurationChanged)
+            newMedia.durationChanged.connect(onDurationChanged)
+            videoProgress.positionSync.setMedia(newMedia)
+            onDurationChanged()
+
+        #Playlists swap players so the progress bar follows the one playing
+        mediaWidget.mediaSwapped.connect(onMediaSwapped)
+
+        if framePreview:
+            from QTPie.UI.framePreview import QTPieFramePreview
+            videoProgress.framePreview = QTPieFramePreview(videoProgress, mediaWidget)
+        onDurationChanged = lambda: self.actions.durationChanged(mediaWidget, videoProgress)
+        mediaWidget.media.durationChanged.connect(onDurationChanged)
         videoProgress.setValue(mediaWidget.media.position())
         videoProgress.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
 
@@ -340,13 +684,18 @@ class QTPie:
             self.addGridRow(widget.grid, widget.gridCount, columns)
             widget.gridCount += 1
 
-    def makeVideo(self, name="", filename=r"ChrisH.mp4", enableDrop=False, addToGrid=True, gridData=[0, 0, 0, 0]):
+    def makeVideo(self, name="", filename=r"ChrisH.mp4", enableDrop=False, syncHz=None, framePreview=False, autoSuspend=True, frameTap=None, addToGrid=True, gridData=[0, 0, 0, 0]):
         """
         Combines the basic Video code into one function with added functionality and support for CSS syntax.
 
         Args:\n
             name (str, optional): The name for the QTPie stylesheet to specify style. Defaults to "".
             filename (str, optional): The filepath for the media player video.
+            syncHz (float, optional): The most times per second the progress bar follows the video. Defaults to None for the screen refresh rate.
+            framePreview (bool, optional): Whether hovering the progress bar shows the frame under the mouse. Defaults to False.
+            autoSuspend (bool, optional): Whether the video stops decoding while it can not be seen. Defaults to True.
+            frameTap (def, optional): Called on a worker thread with every shown frame as a NumPy view and its start time
+                                      in microseconds. Frames are dropped when it falls behind. Defaults to None.
             addToGrid (bool, optional): Determines whether to add to the main grid or not. Defaults to True.
             gridData (list of int, optional): List of column, row, columnspan, rowspan values. Defaults to [0, 0, 0, 0].
         
@@ -354,6 +703,12 @@ class QTPie:
             QTPieVideo: A PyQt5 media player
         """
 
+        from QTPie.UI.media import QTPieMedia
+        from QTPie.UI.video import QTPieVideo
+        from QTPie.UI.mediaWidget import QTPieMediaWidget
+        from QTPie.UI.volumeWidget import QTPieVolumeWidget
+        from QTPie.UI.controlWidget import QTPieControlWidget
+
         name = "mediaPlayer" + name
 
         '''Making the widget for the media'''
@@ -367,7 +722,13 @@ class QTPie:
         #Assigning media to mediaWidget
         mediaWidget.media = QTPieMedia()
         mediaWidget.media.setMedia(PyQt5.QtMultimedia.QMediaContent(PyQt5.QtCore.QUrl.fromLocalFile(filename)))
-        mediaWidget.media.setVideoOutput(mediaWidget.video)
+        if frameTap:
+            from QTPie.Core.frameTap import QTPieFrameTap
+            mediaWidget.frameTap = QTPieFrameTap(frameTap, target=mediaWidget.video.videoSurface())
+            mediaWidget.media.setVideoOutput(mediaWidget.frameTap)
+            mediaWidget.destroyed.connect(lambda _=None, tap=mediaWidget.frameTap: tap.close())
+        else:
+            mediaWidget.media.setVideoOutput(mediaWidget.video)
         mediaWidget.media.setVolume(self.tunableDict["volume"])
         mediaWidget.media.setObjectName(name)
 
@@ -379,7 +740,7 @@ class QTPie:
         #Assigning widgets for the controlWidget
         controlWidget.playPause = self.makeButton(lambda: self.actions.playPause(mediaWidget, controlWidget, self.app), name="VideoPlayPause", icon="pause", addToGrid=False)
         controlWidget.openFile = self.makeButton(lambda: self.actions.openFile(mediaWidget), name="VideoOpenFile", icon="file", addToGrid=False)
-        controlWidget.videoProgress = self.makeVideoProgressBar(mediaWidget)
+        controlWidget.videoProgress = self.makeVideoProgressBar(mediaWidget, syncHz, framePreview)
 
 
         '''Making the widget for the volume controls'''
@@ -428,6 +789,11 @@ class QTPie:
         self.actions.hideControls(mediaWidget, controlWidget)
         self.actions.playPause(mediaWidget, controlWidget, self.app)
 
+        if autoSuspend:
+            from QTPie.Core.mediaSuspender import QTPieMediaSuspender
+            QTPieMediaSuspender.instance().maxPlaying = self.maxPlayingVideos
+            QTPieMediaSuspender.instance().register(mediaWidget)
+
         if addToGrid:
             self.grid.addWidget(mediaWidget, gridData[1], gridData[0], gridData[3], gridData[2])
 
@@ -446,6 +812,8 @@ class QTPie:
             QTPieProgressBar: A QTPie progress bar.
         """
 
+        from QTPie.UI.progressBar import QTPieProgressBar
+
         progressBar = QTPieProgressBar()
         progressBar.setObjectName(name)
         progressBar.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
@@ -472,6 +840,8 @@ class QTPie:
             QTPieSlider: A QTPie slider.
         """
 
+        from QTPie.UI.slider import QTPieSlider
+
         orientationDict = {"horizontal": QtCore.Qt.Horizontal, "vertical": QtCore.Qt.Vertical}
 
         slider = QTPieSlider()
@@ -501,6 +871,8 @@ class QTPie:
             QTPieRadioButton: A QTPie radio button with a text tag.
         """
 
+        from QTPie.UI.radioButton import QTPieRadioButton
+
         radioButton = QTPieRadioButton()
         radioButton.setObjectName(name)
         radioButton.setText(txt)
@@ -525,8 +897,9 @@ class QTPie:
             QTPieCheckbox: A QTPie checkbox with a text tag.
         """
 
-        checkbox = QTPieCheckbox()
-        checkbox.setObjectName(name)
+        from QTPie.UI.checkbox import QTPieCheckbox
+
+        checkbox = self.makeWidget(QTPieCheckbox, name)
         checkbox.setText(txt)
         checkbox.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
 
@@ -550,6 +923,8 @@ class QTPie:
             QTPieTextbox: A QTPie textbox with drag and drop optional
         """
 
+        from QTPie.UI.textbox import QTPieTextbox
+
         textbox = QTPieTextbox(dropArea=enableDrop)
         textbox.setObjectName(name)
         textbox.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
@@ -577,6 +952,8 @@ class QTPie:
             QTPieDial: A QTPie dial.
         """
 
+        from QTPie.UI.dial import QTPieDial
+
         dial = QTPieDial(wrapping=wrapping)
         dial.setObjectName(name)
         dial.setMinimum(minVal)
@@ -606,6 +983,8 @@ class QTPie:
             QTPieTextbox: A QTPie dropdown with a set of autofill values
         """
 
+        from QTPie.UI.dropdown import QTPieDropdown
+
         dropdown = QTPieDropdown()
         dropdown.setObjectName(name)
         dropdown.setEditable(textEdit)
@@ -619,11 +998,58 @@ class QTPie:
 
         return dropdown
 
+    def loadSpec(self, spec):
+        """
+        Builds a page from a declarative spec in one batch, see QTPieSpecLoader for the format.
+
+        Args:\n
+            spec (dict or str): The spec or the path to a .json, .yaml or .yml spec file.
+
+        Returns:\n
+            dict: The made widgets keyed by their id.
+        """
+
+        from QTPie.Core.specLoader import QTPieSpecLoader
+
+        return QTPieSpecLoader(self).load(spec)
+
+    def registerPage(self, name, builder, preload=False):
+        """
+        Registers a page that is only built the first time it is shown.
+
+        Args:\n
+            name (str): The name the page is shown by.
+            builder (def): Called with this QTPie to make the page. Its make* calls add to the page grid.
+            preload (bool, optional): Whether the page is built while the app is idle before it is first shown. Defaults to False.
+        """
+
+        from QTPie.Core.pages import QTPiePages
+
+        if self.pages is None:
+            self.pages = QTPiePages(self, self.maxPages)
+
+        self.pages.register(name, builder, preload)
+
+    def showPage(self, name):
+        """
+        Shows a registered page, building and caching it on first use. "main" is the page made on the main grid.
+
+        Args:\n
+            name (str): The name of the page.
+
+        Returns:\n
+            QTPieWidget: The shown page.
+        """
+
+        return self.pages.show(name)
+
     def createMenu(self):
         """
         Makes the menu bar like most applications have at the top of the screen.
         """
 
+        from QTPie.Core.iconRegistry import QTPieIconRegistry
+
         mainMenu = self.mainWindow.menuBar()
         fileMenu = mainMenu.addMenu('File')
         editMenu = mainMenu.addMenu('Edit')
@@ -642,6 +1068,6 @@ class QTPie:
         pasteAction.setShortcut("Ctrl+P")
         fileMenu.addAction(pasteAction)
 
-        exitAction = QtWidgets.QAction(QtGui.QIcon("exit.png"), 'Exit', self.window)
+        exitAction = QtWidgets.QAction(QTPieIconRegistry.instance().icon("exit.png"), 'Exit', self.window)
         exitAction.setShortcut("Ctrl+E")
         fileMenu.addAction(exitAction)
@@ -0,0 +1,114 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Sets up and maintains the Frame Preview part of the UI for QTPie.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import PyQt5
+from PyQt5 import QtCore
+
+#First Party Imports
+from QTPie.UI.label import QTPieLabel
+from QTPie.Core.worker import QTPieWorker
+from QTPie.Core.frameSprites import QTPieFrameSprites
+
+
+class QTPieFramePreview(QTPieLabel):
+    """
+    A super function extending the QTPieLabel class from QTPie. A popup above a video progress slider showing the
+    frame under the mouse. The frames of the playing file are read in the background the first time it is hovered.
+
+    Args:\n
+        QTPieLabel (UI.label.QTPieLabel): Inherits from QTPieLabel.
+    """
+
+    def __init__(self, slider, mediaWidget, interval=10000, thumbSize=160):
+        """
+        Initializes the popup and follows the hovering on slider.
+
+        Args:\n
+            slider (QTPieSlider): The video progress slider.
+            mediaWidget (QTPieMediaWidget): The widget that holds all media player widgets.
+            interval (int, optional): The milliseconds between previewed frames. Defaults to 10000.
+            thumbSize (int, optional): The width of a preview. Defaults to 160.
+        """
+
+        super().__init__(slider)
+
+        self.slider = slider
+        self.mediaWidget = mediaWidget
+        self.interval = interval
+        self.thumbSize = thumbSize
+
+        self.sprites = None
+        self.pending = None
+
+        self.setObjectName("VideoFramePreview")
+        self.setWindowFlags(QtCore.Qt.ToolTip)
+        self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
+
+        slider.setMouseTracking(True)
+        slider.hovered.connect(self.onHovered)
+        slider.hoverEnded.connect(self.hide)
+
+    def onHovered(self, position):
+        """
+        Shows the frame at position if the frames of the playing file are loaded, otherwise starts loading them.
+
+        Args:\n
+            position (int): The media position under the mouse in milliseconds.
+        """
+
+        filename = self.mediaWidget.media.currentMedia().canonicalUrl().toLocalFile()
+        if not filename:
+            return
+
+        if self.sprites is None or self.sprites.filename != filename:
+            self.hide()
+            if self.pending != filename:
+                self.pending = filename
+                worker = QTPieWorker(QTPieFrameSprites(filename, self.interval, self.thumbSize).load, token=filename)
+                worker.signals.finished.connect(self.onSpritesLoaded)
+                worker.signals.failed.connect(self.onSpritesFailed)
+                worker.start(QTPieFrameSprites.pool())
+            return
+
+        frame = self.sprites.frame(position)
+        if frame is None:
+            return
+
+        self.setPixmap(frame)
+        self.resize(frame.size())
+
+        x = self.slider.style().sliderPositionFromValue(self.slider.minimum(), self.slider.maximum(), position, self.slider.width())
+        self.move(self.slider.mapToGlobal(QtCore.QPoint(x-frame.width()//2, -frame.height())))
+        self.show()
+
+    def onSpritesLoaded(self, filename, sprites):
+        """
+        Keeps the frames read in the background if they belong to the file still playing.
+
+        Args:\n
+            filename (str): The file the frames were read from.
+            sprites (QTPieFrameSprites): The loaded frames.
+        """
+
+        if filename == self.pending:
+            self.sprites = sprites
+            self.pending = None
+
+    def onSpritesFailed(self, filename, error):
+        """
+        Gives up on previews for a file whose frames could not be read.
+
+        Args:\n
+            filename (str): The file the frames were read from.
+            error (Exception): Why the frames could not be read.
+        """
+
+        if filename == self.pending:
+            self.sprites = QTPieFrameSprites(filename)
+            self.pending = None
@@ -0,0 +1,260 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Sets up and maintains the Gallery part of the UI for QTPie.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import math
+import collections
+import PyQt5
+from PyQt5 import QtWidgets, QtCore, QtGui
+
+#First Party Imports
+from QTPie.UI.label import QTPieLabel
+from QTPie.UI.widget import QTPieWidget
+from QTPie.UI.scrollArea import QTPieScroll
+from QTPie.Core.worker import QTPieWorker
+from QTPie.Core.thumbnailCache import QTPieThumbnailCache
+
+
+class QTPieGallery(QTPieScroll):
+    """
+    A super function extending the QTPieScroll class from QTPie. Shows a grid of thumbnails
+    for any amount of images while only keeping labels for the rows that are visible.
+
+    Args:\n
+        QTPieScroll (UI.scrollArea.QTPieScroll): Inherits from QTPieScroll.
+    """
+
+    imageClicked = QtCore.pyqtSignal(str)
+
+    def __init__(self, parent=None, filenames=None, thumbSize=128, spacing=8, cacheDirectory="", maxPixmaps=512):
+        """
+        Initializes the super class.
+
+        Args:\n
+            parent (PyQt5.QtWidgets.*): The object to put the widget on. Defaults to None.
+            filenames (list of str, optional): The images to be shown. Defaults to None.
+            thumbSize (int, optional): The largest width or height of a thumbnail. Defaults to 128.
+            spacing (int, optional): The pixels between thumbnails. Defaults to 8.
+            cacheDirectory (str, optional): The folder thumbnails are saved in. Defaults to the user cache folder.
+            maxPixmaps (int, optional): The most thumbnails kept ready to be drawn. Defaults to 512.
+        """
+
+        super().__init__(parent)
+
+        self.filenames = []
+        self.thumbSize = thumbSize
+        self.spacing = spacing
+        self.cellSize = thumbSize+spacing
+        self.columns = 1
+
+        self.thumbnails = QTPieThumbnailCache(cacheDirectory, thumbSize)
+        self.pixmaps = collections.OrderedDict()
+        self.maxPixmaps = maxPixmaps
+        self.pending = {}
+        #Modified time of every image whose thumbnail could not be read, so it is only read again once changed
+        self.failed = {}
+
+        #Labels reused for whichever images are in view
+        self.cells = []
+
+        self.content = QTPieWidget()
+        self.content.installEventFilter(self)
+        self.setWidget(self.content)
+        self.setWidgetResizable(True)
+        self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.verticalScrollBar().valueChanged.connect(self.layoutCells)
+
+        self.setFilenames(filenames if filenames else [])
+
+    def setFilenames(self, filenames):
+        """
+        Replaces the images shown in the gallery.
+
+        Args:\n
+            filenames (list of str): The images to be shown.
+        """
+
+        for worker in self.pending.values():
+            worker.cancel()
+        self.pending.clear()
+        self.pixmaps.clear()
+
+        self.filenames = list(filenames)
+        for cell in self.cells:
+            cell.index = None
+
+        self.verticalScrollBar().setValue(0)
+        self.layoutCells()
+
+    def setFolder(self, folder, extensions=('.png', '.jpg', '.jpeg', '.tiff', '.bmp')):
+        """
+        Shows every image in folder.
+
+        Args:\n
+            folder (str): The folder holding the images.
+            extensions (tuple of str, optional): The file endings counted as images. Defaults to the QTPieImage drop types.
+        """
+
+        self.setFilenames(sorted(os.path.join(folder, name) for name in os.listdir(folder) if name.lower().endswith(extensions)))
+
+    def layoutCells(self):
+        """
+        Moves the reused labels over the rows in view and gives them their thumbnails.
+        """
+
+        viewport = self.viewport()
+        self.columns = max(1, viewport.width()//self.cellSize)
+        rows = math.ceil(len(self.filenames)/self.columns)
+        self.content.setMinimumHeight(rows*self.cellSize)
+
+        top = self.verticalScrollBar().value()
+        firstRow = top//self.cellSize
+        lastRow = min(rows-1, (top+viewport.height())//self.cellSize)
+        visible = range(firstRow*self.columns, min(len(self.filenames), (lastRow+1)*self.columns))
+
+        while len(self.cells) < len(visible):
+            cell = QTPieLabel(self.content)
+            cell.setAlignment(QtCore.Qt.AlignCenter)
+            cell.resize(self.thumbSize, self.thumbSize)
+            cell.index = None
+            self.cells.append(cell)
+
+        for cell, index in zip(self.cells, visible):
+            row, column = divmod(index, self.columns)
+            cell.move(column*self.cellSize+self.spacing//2, row*self.cellSize+self.spacing//2)
+            cell.show()
+            if cell.index != index:
+                cell.index = index
+                self.showThumbnail(cell)
+
+        for cell in self.cells[len(visible):]:
+            cell.index = None
+            cell.hide()
+
+        #Thumbnails queued for rows scrolled away are dropped
+        for index in [index for index in self.pending if index not in visible]:
+            if self.pending[index].cancel():
+                del self.pending[index]
+
+    def showThumbnail(self, cell):
+        """
+        Shows the thumbnail for the image of cell, reading it in the background when it is not ready.
+
+        Args:\n
+            cell (QTPieLabel): A reused label with the index of its image.
+        """
+
+        filename = self.filenames[cell.index]
+        if filename in self.pixmaps:
+            self.pixmaps.move_to_end(filename)
+            cell.setPixmap(self.pixmaps[filename])
+            return
+        if filename in self.failed and self.failed[filename] == self.modified(filename):
+            cell.setText("?")
+            return
+
+        cell.clear()
+        if cell.index not in self.pending:
+            worker = QTPieWorker(self.thumbnails.load, filename, token=(cell.index, filename))
+            worker.signals.finished.connect(self.onThumbnailLoaded)
+            worker.signals.failed.connect(self.onThumbnailFailed)
+            self.pending[cell.index] = worker.start()
+
+    @staticmethod
+    def modified(filename):
+        """
+        Gets when an image was last changed.
+
+        Args:\n
+            filename (str): The path of the image.
+
+        Returns:\n
+            int: The modified time in nanoseconds or None when the image cannot be found.
+        """
+
+        try:
+            return os.stat(filename).st_mtime_ns
+        except OSError:
+            return None
+
+    def onThumbnailLoaded(self, token, image):
+        """
+        Keeps a thumbnail read in the background and shows it if its image is still in view.
+
+        Args:\n
+            token (tuple): The index and filename the thumbnail was read for.
+            image (PyQt5.QtGui.QImage): The thumbnail.
+        """
+
+        index, filename = token
+        if image.isNull():
+            self.onThumbnailFailed(token, None)
+            return
+
+        self.pending.pop(index, None)
+
+        self.pixmaps[filename] = QtGui.QPixmap.fromImage(image)
+        while len(self.pixmaps) > self.maxPixmaps:
+            self.pixmaps.popitem(last=False)
+
+        for cell in self.cells:
+            if cell.index == index and self.filenames[index] == filename:
+                cell.setPixmap(self.pixmaps[filename])
+
+    def onThumbnailFailed(self, token, error):
+        """
+        Shows a placeholder for an image whose thumbnail could not be read. It is only read again once the image changes.
+
+        Args:\n
+            token (tuple): The index and filename the thumbnail was read for.
+            error (Exception): Why the thumbnail could not be read, None when the image could not be decoded.
+        """
+
+        index, filename = token
+        self.pending.pop(index, None)
+        self.failed[filename] = self.modified(filename)
+
+        for cell in self.cells:
+            if cell.index == index and self.filenames[index] == filename:
+                cell.setText("?")
+
+    def eventFilter(self, watched, event):
+        """
+        Emits imageClicked with the image under a click on the gallery.
+
+        Args:\n
+            watched (PyQt5.QtCore.QObject): The object the event was sent to.
+            event (PyQt5.QtCore.QEvent): The event.
+
+        Returns:\n
+            PyQt5.QtWidgets.QScrollArea.eventFilter: Runs the parents eventFilter.
+        """
+
+        if watched is self.content and event.type() == QtCore.QEvent.MouseButtonPress:
+            column, row = event.pos().x()//self.cellSize, event.pos().y()//self.cellSize
+            index = row*self.columns+column
+            if column < self.columns and index < len(self.filenames):
+                self.imageClicked.emit(self.filenames[index])
+
+        return super(QTPieGallery, self).eventFilter(watched, event)
+
+    def resizeEvent(self, event):
+        """
+        Lays the cells out again for the new width.
+
+        Args:\n
+            event (PyQt5.QtGui.QResizeEvent): The PyQt5 resize event.
+
+        Returns:\n
+            PyQt5.QtWidgets.QScrollArea.resizeEvent: Runs the parents resizeEvent.
+        """
+
+        result = super(QTPieGallery, self).resizeEvent(event)
+        self.layoutCells()
+
+        return result
@@ -12,6 +12,9 @@ from PyQt5 import QtWidgets, QtCore, QtGui
 
 #First Party Imports
 from QTPie.UI.label import QTPieLabel
+from QTPie.Core.imageCache import QTPieImageCache
+from QTPie.Core.imagePyramid import QTPieImagePyramid
+from QTPie.Core.worker import QTPieWorker
 
 
 class QTPieImage(QTPieLabel):
@@ -23,7 +26,9 @@ class QTPieImage(QTPieLabel):
         QTPieLabel (UI.label.QTPieLabel): Inherits from QTPieLabel.
     """
 
-    def __init__(self, parent=None, dropArea=False, filename=""):
+    scaleModes = ("fast", "smooth", "settle")
+
+    def __init__(self, parent=None, dropArea=False, filename="", usePyramid=True, pyramidBudget=64*1024*1024, scaleMode="fast", settleDelay=150, asyncLoad=False, decodeToSize=False):
         """
         Initializes the super class
 
@@ -31,12 +36,230 @@ class QTPieImage(QTPieLabel):
             parent (PyQt5.QtWidgets.*): The object to put the widget on. Defaults to None.
             dropArea (bool, optional): Enables or disables drag and drop. Defaults to False.
             filename (str, optional): The given path for the image to be displayed. Defaults to "".
+            usePyramid (bool, optional): Whether to scale from reduced resolution copies of the image. Defaults to True.
+            pyramidBudget (int, optional): The maximum amount of bytes the reduced copies may use. Defaults to 64MB.
+            scaleMode (str, optional): fast, smooth or settle. Settle shows a fast preview while resizing and
+                                       a smooth rescale made off the GUI thread once resizing stops. Defaults to "fast".
+            settleDelay (int, optional): The milliseconds without a resize before the smooth rescale in settle mode. Defaults to 150.
+            asyncLoad (bool, optional): Whether images not yet cached are decoded on the thread pool. Defaults to False.
+            decodeToSize (bool, optional): Whether images are decoded at about the size of the label instead of
+                                           full resolution, decoding again only when the label outgrows them. Defaults to False.
         """
 
         super().__init__(parent, dropArea)
 
+        if scaleMode not in self.scaleModes:
+            raise ValueError("scaleMode must be one of {}".format(", ".join(self.scaleModes)))
+
         self.filename = filename
         self.pixelMap = None
+        self.imageCache = QTPieImageCache.instance()
+
+        self.usePyramid = usePyramid
+        self.pyramidBudget = pyramidBudget
+        self.pyramid = None
+
+        self.scaleMode = scaleMode
+        self.settleTimer = QtCore.QTimer(self)
+        self.settleTimer.setSingleShot(True)
+        self.settleTimer.setInterval(settleDelay)
+        self.settleTimer.timeout.connect(self.smoothRescale)
+        self.scaleToken = 0
+        self.scaleWorker = None
+
+        self.asyncLoad = asyncLoad
+        self.decodeToSize = decodeToSize
+        self.loadToken = 0
+        self.loadWorker = None
+
+    def setImage(self, filename):
+        """
+        Displays the image at filename, decoding it through the shared image cache.
+
+        Args:\n
+            filename (str): The path to the image to be displayed.
+        """
+
+        if self.loadWorker:
+            self.loadWorker.cancel()
+            self.loadWorker = None
+
+        #A newer image replaces any load still running
+        self.loadToken += 1
+
+        if not self.asyncLoad or self.imageCache.contains(filename, self.decodeSize()):
+            self.filename = filename
+            self.rescale()
+            return
+
+        if self.pixelMap is None or self.pixelMap.isNull():
+            self.setText("Loading...")
+
+        self.startLoad(filename)
+
+    def decodeSize(self):
+        """
+        Gets the size images should be decoded for.
+
+        Returns:\n
+            PyQt5.QtCore.QSize: The size of the label, None when decoding at full resolution.
+        """
+
+        return self.size() if self.decodeToSize else None
+
+    def startLoad(self, filename):
+        """
+        Decodes filename on the thread pool for the current load token.
+
+        Args:\n
+            filename (str): The path to the image to be decoded.
+        """
+
+        self.loadWorker = QTPieWorker(self.imageCache.get, filename, self.decodeSize(), token=(self.loadToken, filename))
+        self.loadWorker.signals.finished.connect(self.onImageLoaded)
+        self.loadWorker.signals.failed.connect(self.onImageFailed)
+        self.loadWorker.start()
+
+    def onImageLoaded(self, token, image):
+        """
+        Shows an image decoded on the thread pool if no newer image was requested meanwhile.
+
+        Args:\n
+            token (tuple): The load token and filename the load was started with.
+            image (PyQt5.QtGui.QImage): The decoded image.
+        """
+
+        loadToken, filename = token
+        if loadToken != self.loadToken:
+            return
+
+        self.loadWorker = None
+        #Unreadable or corrupt files decode to a null image instead of raising
+        if image.isNull():
+            self.showLoadError()
+            return
+
+        self.filename = filename
+        self.rescale()
+
+    def onImageFailed(self, token, error):
+        """
+        Shows a placeholder when decoding an image on the thread pool raised and no image is shown yet.
+
+        Args:\n
+            token (tuple): The load token and filename the load was started with.
+            error (Exception): Why the image could not be decoded.
+        """
+
+        loadToken, _ = token
+        if loadToken != self.loadToken:
+            return
+
+        self.loadWorker = None
+        self.showLoadError()
+
+    def showLoadError(self):
+        """
+        Replaces the loading text with a placeholder when no image is shown yet.
+        """
+
+        if self.pixelMap is None or self.pixelMap.isNull():
+            self.setText("Could not load image")
+
+    def sourceImage(self):
+        """
+        Gets the decoded image to scale from.
+
+        Returns:\n
+            PyQt5.QtGui.QImage: The decoded image. Null if the file could not be read.
+        """
+
+        if self.asyncLoad and not self.imageCache.contains(self.filename, self.decodeSize()):
+            #Keep showing what is cached while a large enough decode is made
+            if self.loadWorker is None:
+                self.loadToken += 1
+                self.startLoad(self.filename)
+            return self.imageCache.closest(self.filename)
+
+        return self.imageCache.get(self.filename, self.decodeSize())
+
+    def scaleSource(self, image, size):
+        """
+        Gets the pyramid of image when enabled and builds its levels for size so scaling never builds them off the GUI thread.
+
+        Args:\n
+            image (PyQt5.QtGui.QImage): The decoded image.
+            size (PyQt5.QtCore.QSize): The size the image will be scaled to.
+
+        Returns:\n
+            QTPieImagePyramid: The pyramid of image. None if the pyramid is disabled.
+        """
+
+        if not self.usePyramid:
+            return None
+
+        if self.pyramid is None or self.pyramid.source.cacheKey() != image.cacheKey():
+            self.pyramid = QTPieImagePyramid(image, budget=self.pyramidBudget)
+        self.pyramid.level(size)
+
+        return self.pyramid
+
+    def rescale(self):
+        """
+        Scales the cached decoded image to the size of the label using the scale mode.
+        """
+
+        transform = QtCore.Qt.SmoothTransformation if self.scaleMode == "smooth" else QtCore.Qt.FastTransformation
+        size = self.size()
+
+        image = self.sourceImage()
+        if image.isNull():
+            return
+
+        pyramid = self.scaleSource(image, size)
+        scaled = pyramid.scaled(size, transform) if pyramid else image.scaled(size, QtCore.Qt.KeepAspectRatio, transform)
+
+        #Any smooth rescale still running is now for an old size
+        self.scaleToken += 1
+        self.pixelMap = QtGui.QPixmap.fromImage(scaled)
+        self.setPixmap(self.pixelMap)
+
+        if self.scaleMode == "settle":
+            self.settleTimer.start()
+
+    def smoothRescale(self):
+        """
+        Starts the high quality rescale for the current size on the thread pool.
+        """
+
+        size = self.size()
+        image = self.sourceImage()
+        if image.isNull():
+            return
+
+        self.scaleToken += 1
+        pyramid = self.scaleSource(image, size)
+        if pyramid:
+            self.scaleWorker = QTPieWorker(pyramid.scaled, size, QtCore.Qt.SmoothTransformation, token=self.scaleToken)
+        else:
+            self.scaleWorker = QTPieWorker(image.scaled, size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation, token=self.scaleToken)
+        self.scaleWorker.signals.finished.connect(self.onSmoothRescaled)
+        self.scaleWorker.start()
+
+    def onSmoothRescaled(self, token, image):
+        """
+        Shows the smooth rescale if no resize happened while it was made.
+
+        Args:\n
+            token (int): The scale token the rescale was started with.
+            image (PyQt5.QtGui.QImage): The smoothly scaled image.
+        """
+
+        if token != self.scaleToken:
+            return
+
+        self.pixelMap = QtGui.QPixmap.fromImage(image)
+        self.setPixmap(self.pixelMap)
 
     def dropEvent(self, event):
         """
@@ -50,10 +273,7 @@ class QTPieImage(QTPieLabel):
         """
 
         if event.mimeData().text()[8:].lower().endswith(('.png', '.jpg', '.jpeg', '.tiff', '.bmp')):
-            self.filename = event.mimeData().text()[8:]
-            self.pixelMap = self.pixelMap.fromImage(PyQt5.QtGui.QImage(self.filename))
-            self.pixelMap = self.pixelMap.scaled(self.size(), PyQt5.QtCore.Qt.KeepAspectRatio)
-            self.setPixmap(self.pixelMap)
+            self.setImage(event.mimeData().text()[8:])
         
         return super(QTPieLabel, self).dropEvent(event)
     
@@ -68,8 +288,6 @@ class QTPieImage(QTPieLabel):
             PyQt5.QtWidgets.QLabel.resizeEvent: Runs the parents resizeEvent.
         """
 
-        self.pixelMap = self.pixelMap.fromImage(PyQt5.QtGui.QImage(self.filename))
-        self.pixelMap = self.pixelMap.scaled(self.size(), PyQt5.QtCore.Qt.KeepAspectRatio)
-        self.setPixmap(self.pixelMap)
+        self.rescale()
 
         return super(QTPieLabel, self).resizeEvent(event)
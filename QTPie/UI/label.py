@@ -8,7 +8,6 @@ __author__ = "Noupin"
 import os
 import sys
 import PyQt5
-from PIL import Image
 from PyQt5 import QtWidgets, QtCore, QtGui
 
 
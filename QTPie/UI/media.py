@@ -10,6 +10,9 @@ import sys
 import PyQt5
 from PyQt5 import QtMultimedia
 
+#First Party Imports
+from QTPie.Core.seeker import QTPieSeeker
+
 
 class QTPieMedia(PyQt5.QtMultimedia.QMediaPlayer):
     """
@@ -31,10 +34,21 @@ class QTPieMedia(PyQt5.QtMultimedia.QMediaPlayer):
     
         self.playing = False
         self.paused = False
+
+        #Whether reaching the end starts the media over and which playlist item is loaded
+        self.loop = True
+        self.preloaded = None
+
+        #Suspending stops decoding without changing whether the user wants the media playing
+        self.suspended = False
+        self.released = False
+        self.suspendedPosition = 0
+
+        self.seeker = QTPieSeeker(self)
     
     def play(self):
         """
-        Plays the media.
+        Plays the media. While suspended it starts playing once resumed.
 
         Returns:\n
             PyQt5.QtMultimedia.QMediaPlayer.play: Runs the parents play.
@@ -43,6 +57,9 @@ class QTPieMedia(PyQt5.QtMultimedia.QMediaPlayer):
         self.playing = True
         self.paused = False
 
+        if self.suspended:
+            return None
+
         return super(QTPieMedia, self).play()
     
     def pause(self):
@@ -55,5 +72,53 @@ class QTPieMedia(PyQt5.QtMultimedia.QMediaPlayer):
 
         self.paused = True
         self.playing = False
+
+        if self.suspended:
+            return None
         
         return super(QTPieMedia, self).pause()
+
+    def suspend(self, release=False):
+        """
+        Stops decoding, for example while the video can not be seen, keeping whether it should be playing.
+
+        Args:\n
+            release (bool, optional): Whether the player is stopped to free its decoder instead of paused. Defaults to False.
+        """
+
+        if self.suspended:
+            return
+
+        self.suspended = True
+        self.released = release
+        self.suspendedPosition = self.position()
+
+        if release:
+            super(QTPieMedia, self).stop()
+        else:
+            super(QTPieMedia, self).pause()
+
+    def resume(self):
+        """
+        Undoes suspend, going back to the suspended position and playing if the media should be playing.
+        """
+
+        if not self.suspended:
+            return
+
+        self.suspended = False
+
+        if self.released:
+            self.setPosition(self.suspendedPosition)
+        if self.playing:
+            super(QTPieMedia, self).play()
+
+    def seek(self, position):
+        """
+        Seeks with at most one seek in flight, newer targets replace ones still waiting.
+
+        Args:\n
+            position (int): The target position in milliseconds.
+        """
+
+        self.seeker.seek(position)
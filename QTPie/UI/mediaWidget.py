@@ -7,7 +7,9 @@ __author__ = "Noupin"
 #Third Party Imports
 import os
 import sys
+import time
 import PyQt5
+from PyQt5 import QtCore, QtMultimedia
 
 #First Party Imports
 from QTPie.UI.widget import QTPieWidget
@@ -21,6 +23,9 @@ class QTPieMediaWidget(QTPieWidget):
         QTPieWidget (UI.widget.QTPieWidget): Inherits from QTPieWidget.
     """
 
+    #The player playing before and after a playlist swap
+    mediaSwapped = QtCore.pyqtSignal(object, object)
+
     def __init__(self, parent=None, doesSignal=False, dropArea=False):
         """
         Initializes the super class.
@@ -45,6 +50,17 @@ class QTPieMediaWidget(QTPieWidget):
         self.video = None
         self.filename = ""
 
+        #Playlist variables for the widget
+        self.playlist = []
+        self.playlistIndex = -1
+        self.loopPlaylist = False
+        self.nextMedia = None
+        self.switchStart = None
+        self.switchLatencies = []
+
+        #The surface frames are tapped through, shown on the video when set
+        self.frameTap = None
+
         self.setAcceptDrops(self.dropArea)
     
     def dragEnterEvent(self, event):
@@ -77,9 +93,127 @@ class QTPieMediaWidget(QTPieWidget):
         """
 
         if self.dropEvent and event.mimeData().text()[8:].lower().endswith(('.mp4', '.avi', '.m4v')):
-            self.filename = event.mimeData().text()[8:]
-            self.media.setMedia(PyQt5.QtMultimedia.QMediaContent(PyQt5.QtCore.QUrl.fromLocalFile(self.filename)))
-            self.media.play()
+            #Played as a looping playlist of one so the players and their outputs are swapped the same way as playlists
+            self.setPlaylist([event.mimeData().text()[8:]], loop=True)
         
         return super(QTPieMediaWidget, self).dropEvent(event)
 
+    def setPlaylist(self, filenames, loop=False):
+        """
+        Plays filenames back to back. The next item is loaded into a second player while the current one plays
+        and swapped in when the current one ends.
+
+        Args:\n
+            filenames (list of str): The media files in play order.
+            loop (bool, optional): Whether the playlist starts over after the last item. Defaults to False.
+        """
+
+        self.playlist = list(filenames)
+        self.playlistIndex = -1
+        self.loopPlaylist = loop
+
+        if self.nextMedia is None:
+            from QTPie.UI.media import QTPieMedia
+            self.nextMedia = QTPieMedia(self)
+            self.nextMedia.setObjectName(self.media.objectName())
+            for media in (self.media, self.nextMedia):
+                media.loop = False
+                media.mediaStatusChanged.connect(self.onMediaStatusChanged)
+
+        self.preloadNext()
+        self.playNext()
+
+    def nextIndex(self):
+        """
+        Gets the index of the item after the current one.
+
+        Returns:\n
+            int: The index, -1 when the playlist is over.
+        """
+
+        index = self.playlistIndex+1
+        if index >= len(self.playlist):
+            return 0 if self.loopPlaylist and self.playlist else -1
+
+        return index
+
+    def preloadNext(self):
+        """
+        Loads the next playlist item into the idle player without showing or playing it.
+        """
+
+        index = self.nextIndex()
+        if index == -1:
+            self.nextMedia.setMedia(QtMultimedia.QMediaContent())
+            return
+
+        self.nextMedia.setMedia(QtMultimedia.QMediaContent(QtCore.QUrl.fromLocalFile(self.playlist[index])))
+        self.nextMedia.preloaded = index
+
+    def playNext(self):
+        """
+        Swaps the preloaded player in and plays it, then preloads the item after it in the player that finished.
+        """
+
+        index = self.nextIndex()
+        if index == -1:
+            return
+
+        if self.nextMedia.preloaded != index:
+            self.preloadNext()
+
+        #A swap before the last one started playing leaves its latency unmeasured
+        if self.switchStart is not None:
+            self.media.mediaStatusChanged.disconnect(self.onSwitched)
+            self.media.stateChanged.disconnect(self.onSwitched)
+
+        self.switchStart = time.perf_counter()
+        oldMedia, newMedia = self.media, self.nextMedia
+
+        newMedia.setVolume(oldMedia.volume())
+        newMedia.setMuted(oldMedia.isMuted())
+        #An output is only shown by one player, the old one lets go of it before the new one takes it
+        oldMedia.setVideoOutput(None)
+        newMedia.setVideoOutput(self.frameTap if self.frameTap else self.video)
+        #Watched through status and state as a preloaded item may already be buffered when it is played
+        newMedia.mediaStatusChanged.connect(self.onSwitched)
+        newMedia.stateChanged.connect(self.onSwitched)
+        newMedia.play()
+
+        oldMedia.stop()
+        oldMedia.playing = False
+
+        self.media, self.nextMedia = newMedia, oldMedia
+        self.playlistIndex = index
+        self.filename = self.playlist[index]
+        self.nextMedia.preloaded = None
+
+        self.mediaSwapped.emit(oldMedia, newMedia)
+        self.preloadNext()
+
+    def onMediaStatusChanged(self, status):
+        """
+        Moves to the next playlist item when the playing item ends.
+
+        Args:\n
+            status (PyQt5.QtMultimedia.QMediaPlayer.MediaStatus): The new status of a player.
+        """
+
+        if status == QtMultimedia.QMediaPlayer.EndOfMedia and self.sender() is self.media:
+            self.playNext()
+
+    def onSwitched(self, *_):
+        """
+        Records how long the swapped in player took to be playing with its media buffered. Not measured through
+        positionChanged as that is only reported every notifyInterval.
+        """
+
+        if self.switchStart is None:
+            return
+        if self.media.state() != QtMultimedia.QMediaPlayer.PlayingState or self.media.mediaStatus() != QtMultimedia.QMediaPlayer.BufferedMedia:
+            return
+
+        self.media.mediaStatusChanged.disconnect(self.onSwitched)
+        self.media.stateChanged.disconnect(self.onSwitched)
+        self.switchLatencies.append(time.perf_counter()-self.switchStart)
+        self.switchStart = None
@@ -8,6 +8,7 @@ __author__ = "Noupin"
 import os
 import sys
 import PyQt5
+from PyQt5 import QtWidgets
 
 
 class QTPieSlider(PyQt5.QtWidgets.QSlider):
@@ -18,6 +19,10 @@ class QTPieSlider(PyQt5.QtWidgets.QSlider):
         QtWidgets (PyQt5.QtWidgets.QSlider): Inherits from QSlider.
     """
 
+    #The value under the mouse while mouse tracking is on
+    hovered = PyQt5.QtCore.pyqtSignal(int)
+    hoverEnded = PyQt5.QtCore.pyqtSignal()
+
     def __init__(self, parent=None):
         """
         Initializes the super class.
@@ -57,5 +62,44 @@ class QTPieSlider(PyQt5.QtWidgets.QSlider):
         """
 
         self.mouseOn = False
+        self.hoverEnded.emit()
 
         return super(QTPieSlider, self).leaveEvent(event)
+
+    def mouseMoveEvent(self, event):
+        """
+        Triggers when the mouse moves over the QTPieSlider, only while dragging unless mouse tracking is on.
+
+        Args:\n
+            event (PyQt5.QtGui.QMouseEvent): The PyQt5 mouse move event.
+
+        Returns:\n
+            PyQt5.QtWidgets.QSlider.mouseMoveEvent: Runs the parents mouseMoveEvent.
+        """
+
+        self.hovered.emit(self.valueAt(event.pos()))
+
+        return super(QTPieSlider, self).mouseMoveEvent(event)
+
+    def valueAt(self, point):
+        """
+        Converts a point on the slider to the value the handle would have there.
+
+        Args:\n
+            point (PyQt5.QtCore.QPoint): The point in slider coordinates.
+
+        Returns:\n
+            int: The value.
+        """
+
+        option = QtWidgets.QStyleOptionSlider()
+        self.initStyleOption(option)
+        groove = self.style().subControlRect(QtWidgets.QStyle.CC_Slider, option, QtWidgets.QStyle.SC_SliderGroove, self)
+        handle = self.style().subControlRect(QtWidgets.QStyle.CC_Slider, option, QtWidgets.QStyle.SC_SliderHandle, self)
+
+        if self.orientation() == PyQt5.QtCore.Qt.Horizontal:
+            position, span = point.x()-groove.x()-handle.width()//2, groove.width()-handle.width()
+        else:
+            position, span = point.y()-groove.y()-handle.height()//2, groove.height()-handle.height()
+
+        return QtWidgets.QStyle.sliderValueFromPosition(self.minimum(), self.maximum(), position, span, option.upsideDown)
@@ -0,0 +1,331 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Sets up and maintains the Tiled Image part of the UI for QTPie.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import math
+import collections
+import PyQt5
+from PyQt5 import QtWidgets, QtCore, QtGui
+
+#First Party Imports
+from QTPie.UI.widget import QTPieWidget
+from QTPie.Core.worker import QTPieWorker
+from QTPie.Core.tileSource import QTPieTileSource
+
+
+class QTPieTiledImage(QTPieWidget):
+    """
+    A super function extending the QTPieWidget class from QTPie. Shows images too large for a QPixmap
+    by reading only the visible tiles from a memory mapped file, with pan and zoom.
+
+    Args:\n
+        QTPieWidget (UI.widget.QTPieWidget): Inherits from QTPieWidget.
+    """
+
+    def __init__(self, parent=None, filename="", shape=None, dtype="uint8", tileSize=256, maxTiles=256):
+        """
+        Initializes the super class.
+
+        Args:\n
+            parent (PyQt5.QtWidgets.*): The object to put the widget on. Defaults to None.
+            filename (str, optional): The path to a .npy, raw or TIFF image. Defaults to "".
+            shape (tuple of int, optional): The height, width and channels of a raw image. Defaults to None.
+            dtype (str, optional): The data type of a raw image. Defaults to "uint8".
+            tileSize (int, optional): The width and height of a tile in pixels. Defaults to 256.
+            maxTiles (int, optional): The most decoded tiles kept in memory. Defaults to 256.
+        """
+
+        super().__init__(parent)
+
+        self.source = None
+        self.tileSize = tileSize
+        self.maxTiles = maxTiles
+
+        #Decoded tiles keyed by level, column and row
+        self.tiles = collections.OrderedDict()
+        self.pending = {}
+
+        #Screen pixels per image pixel and the image point at the top left of the widget
+        self.zoom = 1.0
+        self.origin = QtCore.QPointF(0, 0)
+        self.fitted = False
+        self.dragStart = None
+
+        if filename:
+            self.setImage(filename, shape, dtype)
+
+    def setImage(self, filename, shape=None, dtype="uint8"):
+        """
+        Memory maps a new image and fits it to the widget.
+
+        Args:\n
+            filename (str): The path to a .npy, raw or TIFF image.
+            shape (tuple of int, optional): The height, width and channels of a raw image. Defaults to None.
+            dtype (str, optional): The data type of a raw image. Defaults to "uint8".
+        """
+
+        for worker in self.pending.values():
+            worker.cancel()
+        self.pending.clear()
+        self.tiles.clear()
+
+        self.source = QTPieTileSource(filename, shape, dtype, self.tileSize)
+        self.fitToView()
+
+    def fitToView(self):
+        """
+        Zooms and centers the image so it is fully visible.
+        """
+
+        if self.source is None or self.width() <= 0 or self.height() <= 0:
+            return
+
+        self.zoom = min(self.width()/self.source.width, self.height()/self.source.height)
+        self.origin = QtCore.QPointF((self.source.width-self.width()/self.zoom)/2,
+                                     (self.source.height-self.height()/self.zoom)/2)
+        self.fitted = True
+        self.update()
+
+    def level(self):
+        """
+        Gets the level of detail for the current zoom.
+
+        Returns:\n
+            int: The level, 0 for full resolution.
+        """
+
+        if self.zoom >= 1:
+            return 0
+
+        return min(int(math.floor(math.log2(1/self.zoom))), self.source.levels-1)
+
+    def visibleTiles(self, level):
+        """
+        Gets the tiles of level covering the widget.
+
+        Returns:\n
+            list of tuple: The level, column and row of each visible tile.
+        """
+
+        span = self.tileSize*2**level
+        left = max(0, int(self.origin.x()//span))
+        top = max(0, int(self.origin.y()//span))
+        right = min(int((self.origin.x()+self.width()/self.zoom)//span), (self.source.width-1)//span)
+        bottom = min(int((self.origin.y()+self.height()/self.zoom)//span), (self.source.height-1)//span)
+
+        return [(level, column, row) for row in range(top, bottom+1) for column in range(left, right+1)]
+
+    def tileRect(self, level, column, row):
+        """
+        Gets where a tile is drawn on the widget.
+
+        Returns:\n
+            PyQt5.QtCore.QRectF: The rectangle of the tile in widget coordinates.
+        """
+
+        span = self.tileSize*2**level
+        width = min(span, self.source.width-column*span)
+        height = min(span, self.source.height-row*span)
+
+        return QtCore.QRectF((column*span-self.origin.x())*self.zoom, (row*span-self.origin.y())*self.zoom,
+                             width*self.zoom, height*self.zoom)
+
+    def requestTile(self, key):
+        """
+        Reads a tile on the thread pool unless it is already being read.
+
+        Args:\n
+            key (tuple): The level, column and row of the tile.
+        """
+
+        if key in self.pending:
+            return
+
+        worker = QTPieWorker(self.source.tile, *key, token=(self.source, key))
+        worker.signals.finished.connect(self.onTileLoaded)
+        worker.signals.failed.connect(self.onTileFailed)
+        self.pending[key] = worker.start()
+
+    def onTileLoaded(self, token, tile):
+        """
+        Caches a tile read on the thread pool and repaints.
+
+        Args:\n
+            token (tuple): The source and key the tile was read for.
+            tile (PyQt5.QtGui.QImage): The tile.
+        """
+
+        source, key = token
+        if source is not self.source:
+            return
+
+        self.pending.pop(key, None)
+        self.tiles[key] = QtGui.QPixmap.fromImage(tile)
+
+        while len(self.tiles) > self.maxTiles:
+            self.tiles.popitem(last=False)
+
+        self.update()
+
+    def onTileFailed(self, token, error):
+        """
+        Forgets a tile that could not be read so it is read again the next time it is painted.
+
+        Args:\n
+            token (tuple): The source and key the tile was read for.
+            error (Exception): Why the tile could not be read.
+        """
+
+        source, key = token
+        if source is self.source:
+            self.pending.pop(key, None)
+
+    def coarserTile(self, level, column, row):
+        """
+        Finds a cached lower detail tile covering a tile that is still being read.
+
+        Returns:\n
+            tuple: The key of the cached tile and the part of it covering the tile. None if nothing is cached.
+        """
+
+        for coarser in range(level+1, self.source.levels):
+            factor = 2**(coarser-level)
+            key = (coarser, column//factor, row//factor)
+            if key in self.tiles:
+                size = self.tileSize/factor
+                part = QtCore.QRectF((column % factor)*size, (row % factor)*size, size, size)
+                return key, part
+
+        return None
+
+    def paintEvent(self, event):
+        """
+        Draws the visible tiles, using lower detail tiles for those still being read.
+
+        Args:\n
+            event (PyQt5.QtGui.QPaintEvent): The PyQt5 paint event.
+
+        Returns:\n
+            PyQt5.QtWidgets.QWidget.paintEvent: Runs the parents paintEvent.
+        """
+
+        if self.source is None:
+            return super(QTPieTiledImage, self).paintEvent(event)
+
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform, self.zoom < 1)
+
+        visible = self.visibleTiles(self.level())
+        for key in visible:
+            target = self.tileRect(*key)
+            if key in self.tiles:
+                self.tiles.move_to_end(key)
+                pixmap = self.tiles[key]
+                painter.drawPixmap(target, pixmap, QtCore.QRectF(pixmap.rect()))
+                continue
+
+            self.requestTile(key)
+            coarser = self.coarserTile(*key)
+            if coarser:
+                coarserKey, part = coarser
+                pixmap = self.tiles[coarserKey]
+                part = part.intersected(QtCore.QRectF(pixmap.rect()))
+                painter.drawPixmap(QtCore.QRectF(target.topLeft(), part.size()*2**coarserKey[0]*self.zoom), pixmap, part)
+
+        painter.end()
+
+        #Reads queued for tiles scrolled away are dropped
+        for key in [key for key in self.pending if key not in visible]:
+            if self.pending[key].cancel():
+                del self.pending[key]
+
+        return super(QTPieTiledImage, self).paintEvent(event)
+
+    def resizeEvent(self, event):
+        """
+        Fits the image to the widget the first time it gets a size.
+
+        Args:\n
+            event (PyQt5.QtGui.QResizeEvent): The PyQt5 resize event.
+
+        Returns:\n
+            PyQt5.QtWidgets.QWidget.resizeEvent: Runs the parents resizeEvent.
+        """
+
+        if not self.fitted:
+            self.fitToView()
+
+        return super(QTPieTiledImage, self).resizeEvent(event)
+
+    def wheelEvent(self, event):
+        """
+        Zooms around the mouse.
+
+        Args:\n
+            event (PyQt5.QtGui.QWheelEvent): The PyQt5 wheel event.
+        """
+
+        if self.source is None:
+            return
+
+        anchor = event.pos()
+        imagePoint = self.origin+QtCore.QPointF(anchor)/self.zoom
+
+        minZoom = min(self.width()/self.source.width, self.height()/self.source.height)/2
+        self.zoom = min(max(self.zoom*1.25**(event.angleDelta().y()/120), minZoom), 32.0)
+        self.origin = imagePoint-QtCore.QPointF(anchor)/self.zoom
+
+        self.update()
+
+    def mousePressEvent(self, event):
+        """
+        Starts panning.
+
+        Args:\n
+            event (PyQt5.QtGui.QMouseEvent): The PyQt5 mouse press event.
+
+        Returns:\n
+            PyQt5.QtWidgets.QWidget.mousePressEvent: Runs the parents mousePressEvent.
+        """
+
+        self.dragStart = event.pos()
+
+        return super(QTPieTiledImage, self).mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        """
+        Pans the image with the mouse.
+
+        Args:\n
+            event (PyQt5.QtGui.QMouseEvent): The PyQt5 mouse move event.
+
+        Returns:\n
+            PyQt5.QtWidgets.QWidget.mouseMoveEvent: Runs the parents mouseMoveEvent.
+        """
+
+        if self.dragStart is not None:
+            self.origin -= QtCore.QPointF(event.pos()-self.dragStart)/self.zoom
+            self.dragStart = event.pos()
+            self.update()
+
+        return super(QTPieTiledImage, self).mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        """
+        Stops panning.
+
+        Args:\n
+            event (PyQt5.QtGui.QMouseEvent): The PyQt5 mouse release event.
+
+        Returns:\n
+            PyQt5.QtWidgets.QWidget.mouseReleaseEvent: Runs the parents mouseReleaseEvent.
+        """
+
+        self.dragStart = None
+
+        return super(QTPieTiledImage, self).mouseReleaseEvent(event)
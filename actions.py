@@ -15,7 +15,6 @@ parent_dir_path = os.path.abspath(os.path.join(dir_path, os.pardir))
 sys.path.insert(0, parent_dir_path)
 
 #First Party Imports
-import utilities
 from tunable import Tunable
 
 
@@ -24,6 +23,16 @@ class Actions:
     Holds the actions functions for the QTPie GUI.
     """
 
+    def __init__(self, settings=None):
+        """
+        Initializes the actions.
+
+        Args:\n
+            settings (Settings, optional): The store the tunable variables are saved to. Defaults to Tunable.settings.
+        """
+
+        self.settings = settings if settings else Tunable.settings
+
     def fileDialog(self):
         """
         Opens file dialog window.
@@ -70,10 +79,7 @@ class Actions:
 
         x, y = window.pos().x(), window.pos().y()
         width, height = window.size().width(), window.size().height()
-        utilities.changeJSON("windowX", x)
-        utilities.changeJSON("windowY", y)
-        utilities.changeJSON("windowWidth", width)
-        utilities.changeJSON("windowHeight", height)
+        self.settings.update({"windowX": x, "windowY": y, "windowWidth": width, "windowHeight": height})
     
     def playPause(self, mediaWidget, controlWidget, app):
         """
@@ -85,12 +91,14 @@ class Actions:
             app (PyQt5.QtWidgets.QApplication): The application to change icons,
         """
 
+        from QTPie.Core.iconRegistry import QTPieIconRegistry
+
         if mediaWidget.media.playing:
             mediaWidget.media.pause()
-            controlWidget.playPause.setIcon(app.style().standardIcon(PyQt5.QtWidgets.QStyle.SP_MediaPlay))
+            QTPieIconRegistry.instance().setIcon(controlWidget.playPause, "play")
         else:
             mediaWidget.media.play()
-            controlWidget.playPause.setIcon(app.style().standardIcon(PyQt5.QtWidgets.QStyle.SP_MediaPause))
+            QTPieIconRegistry.instance().setIcon(controlWidget.playPause, "pause")
     
     def changeVolume(self, mediaWidget, volumeWidget, app, tunableDict):
         """
@@ -103,16 +111,18 @@ class Actions:
             tunableDict (JSON): The tunable variables for the application.
         """
 
+        from QTPie.Core.iconRegistry import QTPieIconRegistry
+
         mediaWidget.media.setVolume(volumeWidget.volumeBar.value())
-        utilities.changeJSON("volume", volumeWidget.volumeBar.value())
+        self.settings.set("volume", volumeWidget.volumeBar.value())
 
         if mediaWidget.media.volume() == 0:
             mediaWidget.media.setMuted(True)
-            volumeWidget.volumeBtn.setIcon(app.style().standardIcon(PyQt5.QtWidgets.QStyle.SP_MediaVolumeMuted))
+            QTPieIconRegistry.instance().setIcon(volumeWidget.volumeBtn, "muted")
         else:
             mediaWidget.media.setMuted(False)
             tunableDict["volume"] = volumeWidget.volumeBar.value()
-            volumeWidget.volumeBtn.setIcon(app.style().standardIcon(PyQt5.QtWidgets.QStyle.SP_MediaVolume))
+            QTPieIconRegistry.instance().setIcon(volumeWidget.volumeBtn, "volume")
     
     def changeTimestamp(self, mediaWidget, controller):
         """
@@ -123,7 +133,7 @@ class Actions:
             controller (QTPieSlider or QTPieDial): Controls the videos position from 0-duration values.
         """
 
-        mediaWidget.media.setPosition(controller.value())
+        mediaWidget.media.seek(controller.value())
     
     def timestampChanged(self, mediaWidget, controller):
         """
@@ -134,10 +144,11 @@ class Actions:
             controller (QTPieSlider or QTPieDial): Controls the videos position from 0-duration values.
         """
 
-        controller.setValue(mediaWidget.media.position())
+        position = mediaWidget.media.position()
+        controller.setValue(position)
 
         #Enables autoplay of video
-        if (mediaWidget.media.position() >= controller.maximum()) and not mediaWidget.media.paused:
+        if (position >= controller.maximum()) and not mediaWidget.media.paused:
             mediaWidget.media.play()
     
     def durationChanged(self, mediaWidget, controller):
@@ -183,11 +194,11 @@ class Actions:
             mediaWidget (QTPieWidget): The widget that holds all media player widgets.
         """
 
-        filename, _ = PyQt5.QtWidgets.QFileDialog.getOpenFileName()
+        #Parented to the window so the dialog inherits scoped styles
+        filename, _ = PyQt5.QtWidgets.QFileDialog.getOpenFileName(mediaWidget.window())
 
         if filename.lower().endswith(('.mp4', '.avi', '.m4v')):
-            mediaWidget.media.setMedia(PyQt5.QtMultimedia.QMediaContent(PyQt5.QtCore.QUrl.fromLocalFile(filename)))
-            mediaWidget.media.play()
+            mediaWidget.setPlaylist([filename], loop=True)
 
     def muteUnmute(self, mediaWidget, volumeWidget, app, tunableDict):
         """
@@ -200,14 +211,16 @@ class Actions:
             tunableDict (JSON): The tunable variables for the application.
         """
 
+        from QTPie.Core.iconRegistry import QTPieIconRegistry
+
         if not mediaWidget.media.isMuted():
             mediaWidget.media.setMuted(True)
             volumeWidget.volumeBar.setValue(0)
-            volumeWidget.volumeBtn.setIcon(app.style().standardIcon(PyQt5.QtWidgets.QStyle.SP_MediaVolumeMuted))
+            QTPieIconRegistry.instance().setIcon(volumeWidget.volumeBtn, "muted")
         else:
             mediaWidget.media.setMuted(False)
             volumeWidget.volumeBar.setValue(tunableDict["volume"])
-            volumeWidget.volumeBtn.setIcon(app.style().standardIcon(PyQt5.QtWidgets.QStyle.SP_MediaVolume))
+            QTPieIconRegistry.instance().setIcon(volumeWidget.volumeBtn, "volume")
 
     def volumeHover(self, volumeWidget):
         """
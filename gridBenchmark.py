@@ -0,0 +1,73 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Times building and laying out 12x12 and 48x48 grids in spacer and stretch grid mode.
+
+Run with python gridBenchmark.py, each grid mode and size is timed in its own process.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import time
+import subprocess
+from PyQt5 import QtCore
+
+#First Party Imports
+from QTPie.QTPie import QTPie
+
+
+class GridBenchmark:
+    """
+    Builds a square grid with one button in one grid mode and times building and laying it out.
+    """
+
+    def __init__(self, gridMode, size=12, resizes=200):
+        """
+        Initializes the app in gridMode.
+
+        Args:\n
+            gridMode (str): spacer or stretch.
+            size (int, optional): The rows and columns of the grid. Defaults to 12.
+            resizes (int, optional): The amount of layout passes timed. Defaults to 200.
+        """
+
+        self.size = size
+        self.resizes = resizes
+        self.QTPie = QTPie(title="Grid Benchmark", gridMode=gridMode)
+
+    def run(self):
+        """
+        Builds the grid, shows the window, then lays the grid out for a range of sizes.
+
+        Returns:\n
+            tuple of float: The milliseconds spent building the grid until it is shown and per hundred layout passes.
+        """
+
+        start = time.perf_counter()
+
+        for _ in range(self.size):
+            self.QTPie.addGridRow(self.QTPie.grid, self.QTPie.gridCount, self.size)
+            self.QTPie.gridCount += 1
+        self.QTPie.makeButton(lambda: None, txt="Button", gridData=[self.size//2, self.size//2, 1, 1])
+
+        self.QTPie.mainWindow.show()
+        self.QTPie.app.processEvents()
+        built = time.perf_counter()
+
+        #Each pass lays out every item of the grid like a window resize does
+        for index in range(self.resizes):
+            self.QTPie.grid.setGeometry(QtCore.QRect(0, 0, 400+index%50*20, 300+index%50*15))
+
+        return (built-start)*1000, (time.perf_counter()-built)*1000*100/self.resizes
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2:
+        building, resizing = GridBenchmark(sys.argv[1], int(sys.argv[2])).run()
+        print("{:<10}{:>6}{:>12.2f}{:>12.2f}".format(sys.argv[1], sys.argv[2], building, resizing))
+    else:
+        print("{:<10}{:>6}{:>12}{:>12}".format("Mode", "Size", "Build ms", "Layout ms"))
+        for size in (12, 48):
+            for mode in ("spacer", "stretch"):
+                subprocess.run([sys.executable, os.path.abspath(__file__), mode, str(size)], check=True)
@@ -0,0 +1,63 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Measures how long importing QTPie takes and which of its modules are loaded by the import alone.
+
+Run with python importBenchmark.py, the import is timed in a fresh process with python -X importtime.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import subprocess
+
+
+class ImportBenchmark:
+    """
+    Imports QTPie in its own process and reads the import times Python reports.
+    """
+
+    statement = "from QTPie.QTPie import QTPie"
+
+    def __init__(self, top=15):
+        """
+        Initializes the benchmark.
+
+        Args:\n
+            top (int, optional): The amount of slowest modules listed. Defaults to 15.
+        """
+
+        self.top = top
+
+    def run(self):
+        """
+        Imports QTPie once with python -X importtime.
+
+        Returns:\n
+            list of tuple: The self and cumulative microseconds and the name of every imported module in import order.
+        """
+
+        process = subprocess.run([sys.executable, "-X", "importtime", "-c", self.statement],
+                                 cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True)
+
+        modules = []
+        for line in process.stderr.splitlines():
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            selfTime, cumulative, name = line[len("import time:"):].split("|")
+            modules.append((int(selfTime), int(cumulative), name.rstrip()))
+
+        return modules
+
+
+if __name__ == "__main__":
+    benchmark = ImportBenchmark()
+    modules = benchmark.run()
+
+    ours = [(cumulative, name.strip()) for _, cumulative, name in modules if name.strip().startswith(("QTPie", "actions", "tunable", "utilities"))]
+    total = max(cumulative for cumulative, name in ours if name == "QTPie.QTPie")
+    print("{:<40}{:>12.2f}".format(benchmark.statement, total/1000))
+
+    print("\n{:<40}{:>12}".format("Module", "Cum ms"))
+    for cumulative, name in sorted(ours, reverse=True)[:benchmark.top]:
+        print("{:<40}{:>12.2f}".format(name, cumulative/1000))
@@ -24,7 +24,7 @@ class Main:
         Initializes the application.
         """
 
-        self.QTPie = QTPie(icon=r"icon.png", tunableDict=Tunable.tunableDict, title="QTPie")
+        self.QTPie = QTPie(icon=r"icon.png", tunableDict=Tunable.tunableDict, title="QTPie", settings=Tunable.settings)
         self.ui = UI(self.QTPie)
         self.ui.makeLoadPage()
     
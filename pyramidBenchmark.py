@@ -0,0 +1,85 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Times resizing a large image with and without the image pyramid.
+
+Run with python pyramidBenchmark.py, each mode is timed in its own process.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import time
+import tempfile
+import subprocess
+from PyQt5 import QtCore, QtGui
+
+#First Party Imports
+from QTPie.QTPie import QTPie
+
+
+class PyramidBenchmark:
+    """
+    Resizes the same large image through a range of window sizes in one mode and times it.
+    """
+
+    def __init__(self, usePyramid, scaleMode="smooth", resizes=100, imageSize=(6000, 4000)):
+        """
+        Initializes the app with one image made from a large generated picture.
+
+        Args:\n
+            usePyramid (bool): Whether the image scales from its pyramid.
+            scaleMode (str, optional): fast or smooth. Defaults to "smooth".
+            resizes (int, optional): The amount of resizes timed. Defaults to 100.
+            imageSize (tuple of int, optional): The width and height of the generated picture. Defaults to (6000, 4000).
+        """
+
+        self.resizes = resizes
+        self.QTPie = QTPie(title="Pyramid Benchmark", gridMode="stretch")
+
+        picture = QtGui.QImage(*imageSize, QtGui.QImage.Format_RGB32)
+        gradient = QtGui.QLinearGradient(0, 0, *imageSize)
+        gradient.setColorAt(0, QtCore.Qt.darkBlue)
+        gradient.setColorAt(1, QtCore.Qt.yellow)
+        painter = QtGui.QPainter(picture)
+        painter.fillRect(picture.rect(), gradient)
+        painter.end()
+
+        self.filename = os.path.join(tempfile.mkdtemp(prefix="QTPiePyramid"), "picture.png")
+        picture.save(self.filename)
+
+        self.image = self.QTPie.makeImage(filename=self.filename, usePyramid=usePyramid, scaleMode=scaleMode, addToGrid=False)
+
+    def run(self):
+        """
+        Resizes the image from small to large and back, rescaling after every resize.
+
+        Returns:\n
+            tuple of float: The milliseconds per resize and the milliseconds spent scaling per resize.
+        """
+
+        sizes = [200+int(600*abs(index/(self.resizes/2)-1)) for index in range(self.resizes)]
+
+        #The first rescale decodes the picture, which both modes pay the same
+        self.image.resize(sizes[0], sizes[0])
+        self.image.rescale()
+
+        start = time.perf_counter()
+        for size in sizes:
+            self.image.resize(size, size*2//3)
+            self.image.rescale()
+        elapsed = time.perf_counter()-start
+
+        scaleTime = self.image.pyramid.stats()["scaleTime"] if self.image.pyramid else elapsed
+
+        return elapsed*1000/self.resizes, scaleTime*1000/self.resizes
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        perResize, perScale = PyramidBenchmark(sys.argv[1] == "pyramid").run()
+        print("{:<10}{:>14.2f}{:>14.2f}".format(sys.argv[1], perResize, perScale))
+    else:
+        print("{:<10}{:>14}{:>14}".format("Mode", "Resize ms", "Scale ms"))
+        for mode in ("full", "pyramid"):
+            subprocess.run([sys.executable, os.path.abspath(__file__), mode], check=True)
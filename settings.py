@@ -0,0 +1,238 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Holds the settings store that keeps the tunable variables in memory and saves them to disk.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import json
+import time
+import atexit
+import tempfile
+import threading
+import contextlib
+
+
+class Settings:
+    """
+    Keeps a JSON settings file in memory, batches changes and writes the whole file atomically.
+    With a flush delay changes are written behind by a background thread once they stop coming and any still
+    pending when the interpreter exits are written then, with or without a running application.
+    """
+
+    def __init__(self, filename, flushDelay=None):
+        """
+        Reads the settings file.
+
+        Args:\n
+            filename (str): The path to the JSON settings file.
+            flushDelay (float, optional): The seconds without a change before changes are written in the background.
+                                          Defaults to None to write on every change.
+        """
+
+        self.filename = filename
+        self.flushDelay = flushDelay
+        self.writes = 0
+        #The last error the background writer hit, it keeps running and retries
+        self.lastError = None
+
+        self._lock = threading.RLock()
+        self._writeLock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._flushThread = None
+        self._lastChange = 0.0
+        self._batchDepth = 0
+        self._dirty = False
+
+        self.data = self.read()
+
+        #The background writer is a daemon thread so changes it has not written yet would be lost at exit
+        if flushDelay is not None:
+            atexit.register(self.flush)
+
+    def read(self):
+        """
+        Reads the settings from disk.
+
+        Returns:\n
+            dict: The settings. Empty if the file does not exist yet.
+        """
+
+        try:
+            with open(self.filename) as jsonFile:
+                return json.load(jsonFile)
+        except FileNotFoundError:
+            return {}
+
+    def __getitem__(self, key):
+        """
+        Gets a setting.
+
+        Args:\n
+            key (str): The name of the setting.
+
+        Returns:\n
+            object: The value of the setting.
+        """
+
+        with self._lock:
+            return self.data[key]
+
+    def get(self, key, default=None):
+        """
+        Gets a setting or default when it is not set.
+
+        Args:\n
+            key (str): The name of the setting.
+            default (object, optional): The value when the setting is not set. Defaults to None.
+
+        Returns:\n
+            object: The value of the setting.
+        """
+
+        with self._lock:
+            return self.data.get(key, default)
+
+    def snapshot(self):
+        """
+        Gets a copy of every setting.
+
+        Returns:\n
+            dict: The settings.
+        """
+
+        with self._lock:
+            return dict(self.data)
+
+    def set(self, key, value):
+        """
+        Changes one setting.
+
+        Args:\n
+            key (str): The name of the setting.
+            value (object): The new JSON serializable value.
+        """
+
+        self.update({key: value})
+
+    def update(self, values):
+        """
+        Changes several settings with a single write.
+
+        Args:\n
+            values (dict): The names and new values of the settings.
+        """
+
+        with self._lock:
+            self.data.update(values)
+            self._dirty = True
+            batched = self._batchDepth > 0
+
+        if not batched:
+            self.changed()
+
+    def changed(self):
+        """
+        Writes the pending changes now or, with a flush delay, wakes the background writer.
+        """
+
+        if self.flushDelay is None:
+            self.save()
+            return
+
+        with self._lock:
+            self._lastChange = time.monotonic()
+            if self._flushThread is None:
+                self._flushThread = threading.Thread(target=self._flushLoop, name="SettingsFlush", daemon=True)
+                self._flushThread.start()
+            self._changed.notify()
+
+    def flush(self):
+        """
+        Writes any pending changes immediately. Connected to the applications aboutToQuit and run at exit.
+        """
+
+        if self._dirty:
+            self.save()
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Holds every change made inside the with block and writes them once at the end.
+
+        Yields:\n
+            Settings: This settings store.
+        """
+
+        with self._lock:
+            self._batchDepth += 1
+
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batchDepth -= 1
+                finished = not self._batchDepth and self._dirty
+
+            if finished:
+                self.changed()
+
+    def save(self):
+        """
+        Writes the settings to a temporary file next to the settings file and renames it over the
+        settings file so a crash mid write leaves the old file intact.
+        """
+
+        with self._writeLock:
+            with self._lock:
+                contents = json.dumps(self.data)
+                self._dirty = False
+
+            directory = os.path.dirname(os.path.abspath(self.filename))
+            tempName = None
+
+            try:
+                descriptor, tempName = tempfile.mkstemp(prefix=".settings", suffix=".tmp", dir=directory)
+                with os.fdopen(descriptor, "w") as jsonFile:
+                    jsonFile.write(contents)
+                    jsonFile.flush()
+                    os.fsync(jsonFile.fileno())
+                os.replace(tempName, self.filename)
+            except BaseException:
+                if tempName and os.path.exists(tempName):
+                    os.remove(tempName)
+                with self._lock:
+                    self._dirty = True
+                raise
+
+            self.writes += 1
+
+    def _flushLoop(self):
+        """
+        Waits for changes to go quiet for the flush delay then writes them, forever on a daemon thread.
+        A failed write keeps the changes pending and is tried again after another flush delay.
+        """
+
+        while True:
+            with self._lock:
+                while not self._dirty:
+                    self._changed.wait()
+
+                remaining = self._lastChange+self.flushDelay-time.monotonic()
+                while remaining > 0:
+                    self._changed.wait(remaining)
+                    remaining = self._lastChange+self.flushDelay-time.monotonic()
+
+                #A flush may have written the changes while waiting
+                if not self._dirty:
+                    continue
+
+            try:
+                self.save()
+            except Exception as error:
+                #save keeps the changes dirty, waiting again stops a failing disk from being retried in a busy loop
+                with self._lock:
+                    self.lastError = error
+                    self._lastChange = time.monotonic()
@@ -0,0 +1,85 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Times building a 500 widget page from a spec against the same page made with imperative make* calls.
+
+Run with python specBenchmark.py, each way of building is timed in its own process.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import time
+import subprocess
+
+#First Party Imports
+from QTPie.QTPie import QTPie
+
+
+class SpecBenchmark:
+    """
+    Builds the same page of buttons, labels and checkboxes on a shown window one way and times it.
+    """
+
+    def __init__(self, build, widgets=500):
+        """
+        Initializes the app and the spec of the page.
+
+        Args:\n
+            build (str): spec builds through loadSpec, imperative through make* calls and interactive through
+                         make* calls with the event loop running after each, as when a page grows while shown.
+            widgets (int, optional): The amount of widgets made. Defaults to 500.
+        """
+
+        self.build = build
+        self.QTPie = QTPie(title="Spec Benchmark", gridMode="stretch")
+
+        types = ("button", "label", "checkbox")
+        self.spec = {"rows": 25, "columns": 20,
+                     "widgets": [{"type": types[index%3], "txt": str(index), "gridData": [index%20, index//20, 1, 1]}
+                                 for index in range(widgets)]}
+        #Buttons need an action, it is never clicked
+        for widgetSpec in self.spec["widgets"]:
+            if widgetSpec["type"] == "button":
+                widgetSpec["action"] = "load"
+
+        self.QTPie.mainWindow.show()
+        self.QTPie.app.processEvents()
+
+    def run(self):
+        """
+        Builds the page and waits until it is laid out and painted.
+
+        Returns:\n
+            float: The milliseconds spent building the page.
+        """
+
+        start = time.perf_counter()
+
+        if self.build == "spec":
+            self.QTPie.loadSpec(self.spec)
+        else:
+            for _ in range(self.spec["rows"]):
+                self.QTPie.addGridRow(self.QTPie.grid, self.QTPie.gridCount, self.spec["columns"])
+                self.QTPie.gridCount += 1
+
+            factories = {"button": lambda **kwargs: self.QTPie.makeButton(lambda: None, **kwargs),
+                         "label": self.QTPie.makeLabel,
+                         "checkbox": self.QTPie.makeCheckbox}
+            for widgetSpec in self.spec["widgets"]:
+                factories[widgetSpec["type"]](txt=widgetSpec["txt"], gridData=widgetSpec["gridData"])
+                if self.build == "interactive":
+                    self.QTPie.app.processEvents()
+
+        self.QTPie.app.processEvents()
+
+        return (time.perf_counter()-start)*1000
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        print("{:<14}{:>12.2f}".format(sys.argv[1], SpecBenchmark(sys.argv[1]).run()))
+    else:
+        print("{:<14}{:>12}".format("Build", "Build ms"))
+        for build in ("interactive", "imperative", "spec"):
+            subprocess.run([sys.executable, os.path.abspath(__file__), build], check=True)
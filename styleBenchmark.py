@@ -0,0 +1,73 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Times making and showing 1000 widgets with the global application stylesheet and with scoped stylesheets.
+
+Run with python styleBenchmark.py, each style mode is timed in its own process.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import time
+import subprocess
+
+#First Party Imports
+from QTPie.QTPie import QTPie
+
+
+class StyleBenchmark:
+    """
+    Makes the same 1000 labels, buttons and checkboxes in one style mode and times it.
+    """
+
+    def __init__(self, styleMode, widgets=1000):
+        """
+        Initializes the app in styleMode.
+
+        Args:\n
+            styleMode (str): global or scoped.
+            widgets (int, optional): The amount of widgets made. Defaults to 1000.
+        """
+
+        self.widgets = widgets
+        self.QTPie = QTPie(title="Style Benchmark", styleMode=styleMode, gridMode="stretch")
+
+        for _ in range(10):
+            self.QTPie.addGridRow(self.QTPie.grid, self.QTPie.gridCount, 10)
+            self.QTPie.gridCount += 1
+
+    def run(self):
+        """
+        Makes the widgets, shows the window and waits for the first paint.
+
+        Returns:\n
+            tuple of float: The seconds spent making the widgets and the seconds until they are shown.
+        """
+
+        start = time.perf_counter()
+
+        for index in range(self.widgets):
+            gridData = [index%10, index//10%10, 1, 1]
+            if index%3 == 0:
+                self.QTPie.makeLabel(name="Image" if index%2 else "", txt=str(index), gridData=gridData)
+            elif index%3 == 1:
+                self.QTPie.makeButton(lambda: None, name="maleBtn" if index%2 else "", txt=str(index), gridData=gridData)
+            else:
+                self.QTPie.makeCheckbox(txt=str(index), gridData=gridData)
+
+        made = time.perf_counter()
+        self.QTPie.mainWindow.show()
+        self.QTPie.app.processEvents()
+
+        return made-start, time.perf_counter()-start
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        making, showing = StyleBenchmark(sys.argv[1]).run()
+        print("{:<10}{:>12.2f}{:>12.2f}".format(sys.argv[1], making*1000, showing*1000))
+    else:
+        print("{:<10}{:>12}{:>12}".format("Mode", "Make ms", "Shown ms"))
+        for mode in ("global", "scoped"):
+            subprocess.run([sys.executable, os.path.abspath(__file__), mode], check=True)
@@ -0,0 +1,27 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Shares the offscreen QApplication the QTPie tests run in.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5 import QtWidgets
+
+
+@pytest.fixture(scope="session")
+def app():
+    """
+    Gets the QApplication shared by every test.
+
+    Returns:\n
+        PyQt5.QtWidgets.QApplication: The application.
+    """
+
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -0,0 +1,95 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Tests the throttled sync of a media position to its progress slider.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+from PyQt5 import QtCore
+
+#First Party Imports
+from QTPie.UI.slider import QTPieSlider
+from QTPie.Core.positionSync import QTPiePositionSync
+
+
+class StubMedia(QtCore.QObject):
+    """
+    A media player standing in for QTPieMedia that counts how often it is played.
+    """
+
+    positionChanged = QtCore.pyqtSignal(int)
+
+    def __init__(self):
+        """
+        Starts looping and unpaused at the start of the media.
+        """
+
+        super().__init__()
+
+        self.loop = True
+        self.paused = False
+        self.plays = 0
+
+    def position(self):
+        """
+        Gets the position, positions are only reported through positionChanged.
+
+        Returns:\n
+            int: Always 0.
+        """
+
+        return 0
+
+    def play(self):
+        """
+        Counts a play, the sync plays the media again to loop it.
+        """
+
+        self.plays += 1
+
+
+def test_hiddenControlsStillLoop(app):
+    """
+    While the slider is hidden it is not moved but the media still loops once each time it reaches the end.
+    """
+
+    media = StubMedia()
+    slider = QTPieSlider()
+    slider.setRange(0, 1000)
+    sync = QTPiePositionSync(media, slider, hz=1000)
+
+    assert not slider.isVisible()
+
+    media.positionChanged.emit(500)
+    sync.sync()
+    media.positionChanged.emit(1000)
+    sync.sync()
+    sync.sync()
+
+    assert media.plays == 1
+    assert slider.value() == 0
+    assert sync.skipped == 3
+
+    media.positionChanged.emit(0)
+    sync.sync()
+    media.positionChanged.emit(1000)
+    sync.sync()
+
+    assert media.plays == 2
+
+
+def test_pausedMediaDoesNotLoop(app):
+    """
+    Paused media at its end is not played again.
+    """
+
+    media = StubMedia()
+    media.paused = True
+    slider = QTPieSlider()
+    slider.setRange(0, 1000)
+    sync = QTPiePositionSync(media, slider, hz=1000)
+
+    media.positionChanged.emit(1000)
+    sync.sync()
+
+    assert media.plays == 0
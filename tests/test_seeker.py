@@ -0,0 +1,71 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Tests the seek coalescing of QTPie media players.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+from PyQt5 import QtCore
+
+#First Party Imports
+from QTPie.Core.seeker import QTPieSeeker
+
+
+class StubBackend(QtCore.QObject):
+    """
+    A media player standing in for QMediaPlayer that records seeks and reports them done when told to.
+    """
+
+    positionChanged = QtCore.pyqtSignal(int)
+
+    def __init__(self):
+        """
+        Starts without any seeks.
+        """
+
+        super().__init__()
+
+        self.positions = []
+
+    def setPosition(self, position):
+        """
+        Records a seek without finishing it.
+
+        Args:\n
+            position (int): The position seeked to in milliseconds.
+        """
+
+        self.positions.append(position)
+
+    def finishSeek(self):
+        """
+        Reports the last seek done, as a player does once the new position is decoded.
+        """
+
+        self.positionChanged.emit(self.positions[-1])
+
+
+def test_dragIssuesBoundedSeeks(app):
+    """
+    A fast drag issues at most one seek per finished seek and the last target is always the one that lands.
+    """
+
+    backend = StubBackend()
+    seeker = QTPieSeeker(backend, timeout=10000)
+
+    #A 200 event drag over a backend that finishes a seek every 10 events
+    for event in range(200):
+        seeker.seek(event*50)
+        if event%10 == 9:
+            backend.finishSeek()
+    backend.finishSeek()
+
+    assert len(backend.positions) <= 21
+    assert backend.positions[-1] == 199*50
+    assert seeker.requests == 200
+    assert seeker.issued == len(backend.positions)
+
+    #Nothing is left to issue once the last seek is done
+    backend.finishSeek()
+    assert backend.positions[-1] == 199*50
+    assert not seeker.seeking and seeker.pending is None
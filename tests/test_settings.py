@@ -0,0 +1,163 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Tests the write behind settings store.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import json
+import time
+import types
+import subprocess
+from PyQt5 import QtWidgets
+
+#First Party Imports
+from actions import Actions
+from settings import Settings
+from QTPie.QTPie import QTPie
+
+
+class StubMedia:
+    """
+    A media player standing in for QTPieMedia that only keeps its volume.
+    """
+
+    def __init__(self):
+        """
+        Starts at full volume, unmuted.
+        """
+
+        self._volume = 100
+        self._muted = False
+
+    def volume(self):
+        """
+        Gets the volume.
+
+        Returns:\n
+            int: The volume from 0 to 100.
+        """
+
+        return self._volume
+
+    def setVolume(self, volume):
+        """
+        Changes the volume.
+
+        Args:\n
+            volume (int): The volume from 0 to 100.
+        """
+
+        self._volume = volume
+
+    def setMuted(self, muted):
+        """
+        Mutes or unmutes.
+
+        Args:\n
+            muted (bool): Whether the media is muted.
+        """
+
+        self._muted = muted
+
+
+def waitFor(condition, timeout=5):
+    """
+    Waits until condition is true or timeout seconds pass.
+
+    Args:\n
+        condition (def): Checked every few milliseconds.
+        timeout (float, optional): The most seconds waited. Defaults to 5.
+
+    Returns:\n
+        bool: Whether condition became true.
+    """
+
+    end = time.monotonic()+timeout
+    while not condition():
+        if time.monotonic() > end:
+            return False
+        time.sleep(0.005)
+
+    return True
+
+
+def test_sweepWritesOnce(tmp_path):
+    """
+    A thousand changes followed by two flushes write the file once with the last value.
+    """
+
+    filename = str(tmp_path/"tunable.json")
+    settings = Settings(filename, flushDelay=60)
+
+    for step in range(1000):
+        settings.set("volume", step)
+    settings.flush()
+    settings.flush()
+
+    assert settings.writes == 1
+    with open(filename) as jsonFile:
+        assert json.load(jsonFile) == {"volume": 999}
+
+
+def test_volumeSweepWritesOnce(app, tmp_path):
+    """
+    Dragging the volume slider from 0 to 100 saves the volume through Actions with a single debounced write.
+    """
+
+    filename = str(tmp_path/"tunable.json")
+    settings = Settings(filename, flushDelay=0.05)
+    qtpie = types.SimpleNamespace(actions=Actions(settings), app=app, tunableDict={"volume": 100})
+    mediaWidget = types.SimpleNamespace(media=StubMedia())
+    volumeWidget = types.SimpleNamespace(volumeBtn=QtWidgets.QPushButton())
+
+    volume = QTPie.makeVolume(qtpie, mediaWidget, volumeWidget)
+    volumeWidget.volumeBar = volume
+    for value in range(101):
+        volume.setValue(value)
+
+    assert waitFor(lambda: settings.writes == 1)
+    time.sleep(0.2)
+
+    assert settings.writes == 1
+    assert mediaWidget.media.volume() == 100
+    with open(filename) as jsonFile:
+        assert json.load(jsonFile) == {"volume": 100}
+
+
+def test_failedFlushIsRetried(tmp_path):
+    """
+    A background write that fails keeps the changes and writes them once the disk works again.
+    """
+
+    folder = tmp_path/"missing"
+    settings = Settings(str(folder/"tunable.json"), flushDelay=0.01)
+
+    settings.set("volume", 30)
+    assert waitFor(lambda: settings.lastError is not None)
+    assert settings.writes == 0
+
+    folder.mkdir()
+    assert waitFor(lambda: settings.writes == 1)
+    with open(str(folder/"tunable.json")) as jsonFile:
+        assert json.load(jsonFile) == {"volume": 30}
+
+
+def test_sweepPersistsAtExit(tmp_path):
+    """
+    Changes still waiting for the background writer are written when the interpreter exits.
+    """
+
+    filename = str(tmp_path/"tunable.json")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    script = ("import sys; sys.path.insert(0, {!r})\n"
+              "from settings import Settings\n"
+              "settings = Settings({!r}, flushDelay=60)\n"
+              "for step in range(1000): settings.set('volume', step)\n").format(root, filename)
+
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+    with open(filename) as jsonFile:
+        assert json.load(jsonFile) == {"volume": 999}
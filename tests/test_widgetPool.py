@@ -0,0 +1,41 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Tests the pool that recycles released QTPie widgets.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+from PyQt5 import QtWidgets
+
+#First Party Imports
+from QTPie.UI.button import QTPieButton
+from QTPie.Core.widgetPool import QTPieWidgetPool
+
+
+def test_reusedWidgetIsShown(app):
+    """
+    A released widget put back in the grid of a shown window is visible again.
+    """
+
+    window = QtWidgets.QWidget()
+    grid = QtWidgets.QGridLayout(window)
+    window.show()
+
+    pool = QTPieWidgetPool()
+    button = pool.acquire(QTPieButton, "maleBtn")
+    grid.addWidget(button, 0, 0)
+    app.processEvents()
+    assert button.isVisible()
+
+    pool.release(button)
+    app.processEvents()
+    assert not button.isVisible()
+
+    reused = pool.acquire(QTPieButton, "maleBtn")
+    grid.addWidget(reused, 0, 0)
+    app.processEvents()
+
+    assert reused is button
+    assert pool.reused == 1
+    assert reused.parentWidget() is window
+    assert reused.isVisible()
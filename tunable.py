@@ -7,7 +7,6 @@ __author__ = "Noupin"
 #Third Party Imports
 import os
 import sys
-import json
 
 #Allow for Python. relative imports
 dir_path = os.path.dirname(os.path.realpath(__file__))
@@ -16,6 +15,7 @@ sys.path.insert(0, parent_dir_path)
 
 #First Party Imports
 import utilities
+from settings import Settings
 
 
 class Tunable:
@@ -23,8 +23,6 @@ class Tunable:
     Tunable variables for Shift.
     """
 
-    jsonFile = None
-    tunableDict = None
-
-    with open(utilities.resource_path(r"tunable.json")) as jsonFile:
-        tunableDict = json.load(jsonFile)
+    #Slider drags change settings many times a second so they are written behind
+    settings = Settings(utilities.resource_path(r"tunable.json"), flushDelay=0.5)
+    tunableDict = settings.snapshot()
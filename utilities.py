@@ -7,21 +7,16 @@ __author__ = "Noupin"
 #Third Party Imports
 import os
 import sys
-import json
 
 
 def changeJSON(key, value):
     """
-    Takes a key and a value to change the tunable JSON file.
+    Takes a key and a value to change the tunable JSON file through the shared settings store.
     """
 
-    with open(resource_path(r"tunable.json")) as jsonFile:
-        tunableDict = json.load(jsonFile)
+    from tunable import Tunable
 
-    tunableDict[key] = value
-
-    with open(resource_path(r"tunable.json"), 'w') as jsonFile:
-        json.dump(tunableDict, jsonFile)
+    Tunable.settings.set(key, value)
 
 def resource_path(relative_path):
     """
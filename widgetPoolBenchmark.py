@@ -0,0 +1,105 @@
+#pylint: disable=C0103, C0301, R0902
+"""
+Times rebuilding a page of 300 widgets with recycled widgets against making new ones every time.
+
+Run with python widgetPoolBenchmark.py, each mode is timed in its own process.
+"""
+__author__ = "Noupin"
+
+#Third Party Imports
+import os
+import sys
+import time
+import subprocess
+
+#First Party Imports
+from QTPie.QTPie import QTPie
+
+
+class WidgetPoolBenchmark:
+    """
+    Makes, shows and releases the same buttons, labels and checkboxes over and over in one mode and times it.
+    """
+
+    def __init__(self, recycleWidgets, widgets=300, rounds=10):
+        """
+        Initializes the app with or without widget recycling.
+
+        Args:\n
+            recycleWidgets (bool): Whether released widgets are reused.
+            widgets (int, optional): The amount of widgets made each round. Defaults to 300.
+            rounds (int, optional): The amount of times the widgets are made and released. Defaults to 10.
+        """
+
+        self.widgets = widgets
+        self.rounds = rounds
+        self.QTPie = QTPie(title="Widget Pool Benchmark", gridMode="stretch", recycleWidgets=recycleWidgets)
+
+        for _ in range(10):
+            self.QTPie.addGridRow(self.QTPie.grid, self.QTPie.gridCount, 30)
+            self.QTPie.gridCount += 1
+
+        self.QTPie.mainWindow.show()
+        self.QTPie.app.processEvents()
+
+    def makeRound(self):
+        """
+        Makes the widgets of one round and waits until they are shown.
+
+        Returns:\n
+            list of PyQt5.QtWidgets.QWidget: The made widgets.
+        """
+
+        made = []
+        for index in range(self.widgets):
+            gridData = [index%30, index//30, 1, 1]
+            if index%3 == 0:
+                made.append(self.QTPie.makeLabel(txt=str(index), gridData=gridData))
+            elif index%3 == 1:
+                made.append(self.QTPie.makeButton(lambda: None, txt=str(index), gridData=gridData))
+            else:
+                made.append(self.QTPie.makeCheckbox(txt=str(index), gridData=gridData))
+
+        self.QTPie.app.processEvents()
+
+        #Widgets that are not shown would make the round look cheaper than it is
+        if not all(widget.isVisible() for widget in made):
+            raise RuntimeError("Not every made widget is shown")
+
+        return made
+
+    def run(self):
+        """
+        Makes and releases the widgets every round after a first round that fills the pool.
+
+        Returns:\n
+            tuple of float: The milliseconds per round spent making and showing the widgets and spent releasing them.
+        """
+
+        for widget in self.makeRound():
+            self.QTPie.releaseWidget(widget)
+        self.QTPie.app.processEvents()
+
+        making = releasing = 0.0
+        for _ in range(self.rounds):
+            start = time.perf_counter()
+            made = self.makeRound()
+            madeAt = time.perf_counter()
+            for widget in made:
+                self.QTPie.releaseWidget(widget)
+            self.QTPie.app.processEvents()
+
+            making += madeAt-start
+            releasing += time.perf_counter()-madeAt
+
+        return making*1000/self.rounds, releasing*1000/self.rounds
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        making, releasing = WidgetPoolBenchmark(sys.argv[1] == "recycled").run()
+        print("{:<10}{:>12.2f}{:>14.2f}".format(sys.argv[1], making, releasing))
+    else:
+        print("{:<10}{:>12}{:>14}".format("Mode", "Make ms", "Release ms"))
+        for mode in ("fresh", "recycled"):
+            subprocess.run([sys.executable, os.path.abspath(__file__), mode], check=True)